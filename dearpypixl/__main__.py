@@ -1,3 +1,4 @@
+import sys
 import types
 import inspect
 from inspect import Parameter
@@ -174,6 +175,10 @@ def style_pyi(fpath: str | Path):
 
 
 
+if sys.argv[1:2] == ['bench']:
+    from . import bench
+    sys.exit(bench.main(sys.argv[2:]))
+
 items_pyi("items.pyi")
 color_pyi("color.pyi")
 style_pyi("style.pyi")
@@ -129,11 +129,19 @@ def _create_init_overload(
 
 
 def _create_init_method(cls: Any, parameters: Mapping[str, Parameter], *, __item_exists=f"_errors.{_errors.does_item_exist.__name__}(self)", __argless_init="(tag and not (args or kwargs))") -> Any:
+    hook_callback = (
+        (
+            f"if _api._callback_hook is not None and kwargs.get('callback') is not None:",
+            f"    kwargs['callback'] = _api._callback_hook(kwargs['callback'])",
+        )
+        if 'callback' in parameters else ()
+    )
     method = _tools.create_function(
         '__init__',
         ('self', '*args', 'tag: int | str = 0', '**kwargs'),
         (
             f"super(__class__, self).__init__()",
+            *hook_callback,
             f"try:",
             f"    self.command(*args, tag=self, **kwargs)",
             # Allow creating interfaces for existing items. When doing so, `tag`
@@ -177,6 +185,7 @@ def _create_init_method(cls: Any, parameters: Mapping[str, Parameter], *, __item
         locals={
             '__class__': cls,
             '_errors'   : _errors,
+            '_api'      : api,
         }
     )
     method.__name__      = '__init__'
@@ -205,10 +214,18 @@ def _create_init_method(cls: Any, parameters: Mapping[str, Parameter], *, __item
 def _create_configure_method(cls: Any, parameters: Mapping[str, Parameter]) -> Any:
     """Generate and return a new `.configure` method using item
     command parameters."""
+    hook_callback = (
+        (
+            "if _api._callback_hook is not None and kwargs.get('callback') is not None:",
+            "    kwargs['callback'] = _api._callback_hook(kwargs['callback'])",
+        )
+        if 'callback' in parameters else ()
+    )
     method = _tools.create_function(
         'configure',
         ('self', '**kwargs'),
         (
+            *hook_callback,
             "try:",
             "    configure_item(self, **kwargs)",
             "except SystemError:",
@@ -233,6 +250,7 @@ def _create_configure_method(cls: Any, parameters: Mapping[str, Parameter]) -> A
         locals={
             '__class__'        : cls,
             '_errors'           : _errors,
+            '_api'              : api,
             'configure_item'   : _dearpygui.configure_item,
             '_ITEM_CFG_KEYS'   : frozenset(parameters),
         }
@@ -1,5 +1,6 @@
 import sys
 import abc
+import math
 import time
 import enum
 import types
@@ -632,6 +633,242 @@ class Locker(typing.Generic[T]):
     __call__ = bind
 
 
+class Timer:
+    """A handle to a callback scheduled on a `TimerWheel`."""
+    __slots__ = (
+        'deadline',
+        'callback',
+        'args',
+        'level',
+        '_pending',
+        '_wheel',
+    )
+
+    def __init__(self, wheel: 'TimerWheel', deadline: int, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args     = args
+        self.level    = 0
+        self._pending = True
+        self._wheel   = wheel
+
+    def __repr__(self):
+        return f"<{type(self).__qualname__}(callback={self.callback!r}, pending={self._pending})>"
+
+    @property
+    def pending(self) -> bool:
+        """Return True if the callback has yet to run and was not
+        cancelled."""
+        return self._pending
+
+    def cancel(self) -> bool:
+        """Prevent the callback from running. Return False if it
+        already ran or was cancelled, otherwise return True."""
+        return self._wheel._cancel(self)
+
+
+class TimerWheel:
+    """Hierarchical timing wheel. Schedules callbacks to run after a
+    delay in O(1) time.
+
+    Timers are bucketed into one of several wheels of 64 slots based on
+    how far away they are; timers in outer wheels are moved inward
+    as their deadline nears. Callbacks only run when the wheel is
+    advanced (see `.advance`), and are executed in the advancing
+    thread. Advancing an empty wheel is a no-op.
+    """
+    __slots__ = (
+        'resolution',
+        'clock',
+        '_offset',
+        '_wheels',
+        '_overflow',
+        '_counts',
+        '_active',
+        '_tick',
+        '_lock',
+    )
+
+    SLOT_BITS = 6
+    SLOTS     = 1 << SLOT_BITS
+    LEVELS    = 4
+
+    def __init__(self, resolution: float = 0.001, clock: Callable[[], float] = time.perf_counter):
+        """Args:
+            * resolution: Length of a tick, in units of *clock*. Delays
+            are rounded up to the nearest tick.
+
+            * clock: A zero-argument callable that returns a monotonic
+            time.
+        """
+        self.resolution = resolution
+        self.clock      = clock
+        # added to the clock so `.now` is continuous across `.set_clock`
+        self._offset    = 0.0
+        self._wheels    = [[[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self._overflow: list[Timer] = []
+        self._counts    = [0] * (self.LEVELS + 1)
+        self._active    = 0
+        self._tick      = self._now()
+        self._lock      = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._active
+
+    def __bool__(self) -> bool:
+        return bool(self._active)
+
+    def now(self) -> float:
+        """Return the wheel's current time, in units of its clock. Unlike
+        the clock, it does not jump when the clock is replaced (see
+        `.set_clock`)."""
+        return self.clock() + self._offset
+
+    def _now(self) -> int:
+        return int((self.clock() + self._offset) / self.resolution)
+
+    def _insert(self, timer: Timer):
+        # lock must be held
+        deadline = timer.deadline
+        delta    = deadline - self._tick
+        bits     = self.SLOT_BITS
+        for level in range(self.LEVELS):
+            if delta < 1 << (bits * (level + 1)):
+                self._wheels[level][(deadline >> (bits * level)) & (self.SLOTS - 1)].append(timer)
+                break
+        else:
+            level = self.LEVELS
+            self._overflow.append(timer)
+        timer.level = level
+        self._counts[level] += 1
+
+    def _cascade(self, tick: int):
+        # lock must be held
+        bits = self.SLOT_BITS
+        mask = self.SLOTS - 1
+        for level in range(1, self.LEVELS + 1):
+            if level == self.LEVELS:
+                timers = self._overflow
+                self._overflow = []
+                index = 0
+            else:
+                index = (tick >> (bits * level)) & mask
+                slot  = self._wheels[level][index]
+                timers = slot[:]
+                slot.clear()
+            for t in timers:
+                if t._pending:
+                    self._counts[level] -= 1
+                    self._insert(t)
+            # the next wheel only turns when this one completes a rotation
+            if index:
+                break
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Schedule a callback to run after a delay. Return a handle that
+        can be used to cancel it.
+
+        Args:
+            * delay: Time to wait, in units of the wheel's clock.
+
+            * callback: The callable to execute. Additional positional
+            arguments are passed to it when called.
+        """
+        with self._lock:
+            now = self._now()
+            if not self._active:
+                self._tick = now
+            deadline = max(now + math.ceil(delay / self.resolution), self._tick + 1)
+            timer = Timer(self, deadline, callback, args)
+            self._insert(timer)
+            self._active += 1
+        return timer
+
+    def _cancel(self, timer: Timer) -> bool:
+        with self._lock:
+            if not timer._pending:
+                return False
+            # removed from its slot when the slot is processed
+            timer._pending = False
+            self._counts[timer.level] -= 1
+            self._active -= 1
+        return True
+
+    def clear(self) -> int:
+        """Cancel all pending timers. Return the number of timers
+        cancelled."""
+        with self._lock:
+            count = self._active
+            for wheel in self._wheels:
+                for slot in wheel:
+                    for t in slot:
+                        t._pending = False
+                    slot.clear()
+            for t in self._overflow:
+                t._pending = False
+            self._overflow.clear()
+            self._counts[:] = [0] * len(self._counts)
+            self._active = 0
+        return count
+
+    def set_clock(self, clock: Callable[[], float]):
+        """Replace the wheel's clock. The wheel's time (see `.now`)
+        continues from where the previous clock left it, so pending
+        timers keep the time they had left.
+
+        Args:
+            * clock: A zero-argument callable that returns a monotonic
+            time, in the same units as the previous clock.
+        """
+        with self._lock:
+            now = self.clock() + self._offset
+            self.clock   = clock
+            self._offset = now - clock()
+
+    def advance(self, now: float | None = None) -> int:
+        """Execute the callbacks of expired timers. Return the number of
+        callbacks executed.
+
+        Args:
+            * now: The current time in units of the wheel's clock (see
+            `.now`). If None, `.now()` is used.
+        """
+        if not self._active:
+            return 0
+
+        mask = self.SLOTS - 1
+        due  = []
+        with self._lock:
+            target = self._now() if now is None else int(now / self.resolution)
+            tick   = self._tick
+            inner  = self._wheels[0]
+            counts = self._counts
+            while tick < target:
+                if not counts[0]:
+                    # innermost wheel is empty; skip to its next rotation
+                    tick = min(target, (tick | mask) + 1) - 1
+                tick += 1
+                self._tick = tick
+                if not tick & mask:
+                    self._cascade(tick)
+                slot = inner[tick & mask]
+                if slot:
+                    for t in slot:
+                        if t._pending:
+                            t._pending = False
+                            counts[0]    -= 1
+                            self._active -= 1
+                            due.append(t)
+                    slot.clear()
+                if not self._active:
+                    break
+            self._tick = max(tick, target) if not self._active else tick
+
+        for t in due:
+            t.callback(*t.args)
+        return len(due)
+
+
 def cfunction(pfunction: 'ctypes._NamedFuncPointer', argtypes: tuple[Any, ...] = (), restype: Any = None):
     """Cast a foreign C function pointer as the decorated function.
 
@@ -655,6 +892,15 @@ def Py_DECREF(_object: Any) -> None:
     """
 
 
+@cfunction(ctypes.pythonapi.Py_IncRef, (ctypes.py_object,))
+def Py_INCREF(_object: Any) -> None:
+    """Increase the reference count of a Python object by one.
+
+    The object will never be deconstructed unless the reference is
+    released using `Py_DECREF`.
+    """
+
+
 def timed(fn: Callable[P, T]) -> Callable[P, T]:
     """Decorator that times the execution of a function."""
     @functools.wraps(fn)
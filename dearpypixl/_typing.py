@@ -56,6 +56,7 @@ from typing import (
     Union,
 
     NamedTuple,
+    IO,
 
     cast,
     final,
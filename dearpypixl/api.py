@@ -69,15 +69,28 @@ Glossary:
 import os
 import sys
 import time
+import atexit
 import math
 import types
 import ctypes
 import inspect
+import heapq
 import functools
 import itertools
 import contextlib
+import weakref
+import threading
+import array
+import csv
+import json
+import collections
+import concurrent.futures
 import importlib.metadata
-from queue import Queue
+from queue import Queue, Empty
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context as _mp_get_context
+from multiprocessing.shared_memory import SharedMemory
 from uuid import uuid4
 from dearpygui import dearpygui, _dearpygui
 from . import _typing, constants, _tools, _errors, _parsing, _mkstub
@@ -101,7 +114,10 @@ from ._typing import (
     MutableMapping,
     ParamSpec,
     TypedDict,
+    NotRequired,
+    NamedTuple,
     SupportsIndex,
+    IO,
 
     overload,
     final,
@@ -135,6 +151,13 @@ _ItemTree = dict[ItemT, tuple[list['_ItemTree'], list['_ItemTree'], list['_ItemT
 _SENTINEL = object()
 
 
+# When not None, callbacks registered through Dear PyPixl (item `callback`
+# configuration, `events` handler methods, `events.Callback`) are passed
+# to this function, and the returned callable is registered instead. Used
+# by the `diagnostics` module.
+_callback_hook: Callable[[Callable], Callable] | None = None
+
+
 def _clear_lockers(cls: type[_T]) -> type[_T]:
     """Helper decorator to remove leftover `Locker` references.
     """
@@ -1175,16 +1198,592 @@ class RuntimeConfigDict(TypedDict):
     target_frame_rate: int
     clamp_frame_rate: bool
     update_interval : float
+    task_workers    : int
+    process_workers : int
+    stats_window    : int
 
 class _RuntimeState(_typing.ItemStateDict):
     render_interval   : float
     frame_rate_clamped: bool
 
 
+class TaskStatsDict(TypedDict):
+    workers          : int
+    queued           : int
+    running          : int
+    pending_callbacks: int
+    submitted        : int
+    completed        : int
+    failed           : int
+    cancelled        : int
+    wait_time_avg    : float
+    wait_time_max    : float
+    run_time_avg     : float
+    run_time_max     : float
+    delivery_time_avg: float
+    delivery_time_max: float
+
+
+class ProcessTaskStatsDict(TypedDict):
+    workers      : int
+    pending      : int
+    submitted    : int
+    completed    : int
+    failed       : int
+    cancelled    : int
+    restarts     : int
+    wait_time_avg: float
+    wait_time_max: float
+    run_time_avg : float
+    run_time_max : float
+
+
+class PhaseStatsDict(TypedDict):
+    avg: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class FrameSampleDict(TypedDict):
+    frame        : int
+    frame_time   : float
+    task_time    : float
+    callback_time: float
+    render_time  : float
+    idle_time    : float
+    tasks        : int
+    callbacks    : int
+
+
+class RuntimeStatsDict(TypedDict):
+    frames        : int
+    dropped_frames: int
+    tasks         : int
+    callbacks     : int
+    window        : int
+    frame_time    : PhaseStatsDict
+    task_time     : PhaseStatsDict
+    callback_time : PhaseStatsDict
+    render_time   : PhaseStatsDict
+    idle_time     : PhaseStatsDict
+    samples       : NotRequired[list[FrameSampleDict]]
+
+
+class _FrameStats:
+    """Fixed-size ring buffer of per-frame timings recorded by the
+    runtime loop. Percentiles are only computed when requested."""
+    __slots__ = (
+        'window',
+        'frames',
+        'dropped',
+        'tasks',
+        'callbacks',
+        '_columns',
+        '_lock',
+    )
+
+    PHASES  = ('frame_time', 'task_time', 'callback_time', 'render_time', 'idle_time')
+    COUNTS  = ('tasks', 'callbacks')
+    # frames taking longer than this many frame budgets are "dropped"
+    DROP_THRESHOLD = 1.5
+
+    def __init__(self, window: int):
+        self._lock = threading.Lock()
+        self.resize(window)
+
+    def resize(self, window: int):
+        with self._lock:
+            self.window    = window
+            self.frames    = 0
+            self.dropped   = 0
+            self.tasks     = 0
+            self.callbacks = 0
+            self._columns  = {
+                **{k: array.array('d', bytes(8 * window)) for k in self.PHASES},
+                **{k: array.array('q', bytes(8 * window)) for k in self.COUNTS},
+            }
+
+    def reset(self):
+        self.resize(self.window)
+
+    def record(
+        self,
+        frame_time   : float,
+        task_time    : float,
+        callback_time: float,
+        render_time  : float,
+        tasks        : int,
+        callbacks    : int,
+        budget       : float,
+    ):
+        idle_time = frame_time - task_time - callback_time - render_time
+        with self._lock:
+            i = self.frames % self.window
+            c = self._columns
+            c['frame_time'][i]    = frame_time
+            c['task_time'][i]     = task_time
+            c['callback_time'][i] = callback_time
+            c['render_time'][i]   = render_time
+            c['idle_time'][i]     = idle_time if idle_time > 0.0 else 0.0
+            c['tasks'][i]         = tasks
+            c['callbacks'][i]     = callbacks
+            self.frames    += 1
+            self.tasks     += tasks
+            self.callbacks += callbacks
+            if frame_time > budget * self.DROP_THRESHOLD:
+                self.dropped += 1
+
+    def _ordered(self, column: array.array) -> list:
+        # lock must be held; oldest to newest
+        n = min(self.frames, self.window)
+        i = self.frames % self.window
+        if n < self.window:
+            return column[:n].tolist()
+        return column[i:].tolist() + column[:i].tolist()
+
+    @staticmethod
+    def _summarize(values: list[float]) -> PhaseStatsDict:
+        if not values:
+            return PhaseStatsDict(avg=0.0, p50=0.0, p95=0.0, p99=0.0, max=0.0)
+        values = sorted(values)
+        n = len(values)
+        rank = lambda p: values[min(n - 1, max(0, math.ceil(p * n) - 1))]  # nearest-rank
+        return PhaseStatsDict(
+            avg=math.fsum(values) / n,
+            p50=rank(0.50),
+            p95=rank(0.95),
+            p99=rank(0.99),
+            max=values[-1],
+        )
+
+    def samples(self) -> list[FrameSampleDict]:
+        with self._lock:
+            first   = self.frames - min(self.frames, self.window)
+            columns = {k: self._ordered(v) for k, v in self._columns.items()}
+        return [
+            FrameSampleDict(frame=first + i, **{k: v[i] for k, v in columns.items()})  # type: ignore
+            for i in range(len(columns['frame_time']))
+        ]
+
+    def summary(self, samples: bool = False) -> RuntimeStatsDict:
+        with self._lock:
+            stats: Any = {
+                'frames'        : self.frames,
+                'dropped_frames': self.dropped,
+                'tasks'         : self.tasks,
+                'callbacks'     : self.callbacks,
+                'window'        : self.window,
+            }
+            phases = {k: self._ordered(self._columns[k]) for k in self.PHASES}
+        for k, v in phases.items():
+            stats[k] = self._summarize(v)
+        if samples:
+            stats['samples'] = self.samples()
+        return stats
+
+
+# used for counting dropped frames when the frame rate isn't clamped
+_DEFAULT_FRAME_BUDGET = 1000.0 / 60
+
+
+def _default_task_workers() -> int:
+    # same default as `ThreadPoolExecutor`
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _default_process_workers() -> int:
+    # leave a core for the renderer
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _perf_counter_ms(_counter = time.perf_counter) -> float:
+    return 1000.0 * _counter()
+
+
+def _run_task(locker: Locker, fn: Callable, args: tuple, kwargs: dict, ts_submit: float):
+    # Executed in a worker thread.
+    ts_start = _perf_counter_ms()
+    with locker:
+        stats = locker.value
+        wait_time = ts_start - ts_submit
+        stats['queued']    -= 1
+        stats['running']   += 1
+        stats['wait_time'] += wait_time
+        if wait_time > stats['wait_time_max']:
+            stats['wait_time_max'] = wait_time
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        run_time = _perf_counter_ms() - ts_start
+        with locker:
+            stats = locker.value
+            stats['running']  -= 1
+            stats['run_time'] += run_time
+            if run_time > stats['run_time_max']:
+                stats['run_time_max'] = run_time
+
+
+def _task_done_callback(locker: Locker, on_done: Callable | None, on_error: Callable | None, future: Future):
+    # Executed in a worker thread, or in the calling thread when the
+    # future is cancelled. Handlers are NOT called here -- they are
+    # queued and called on the main thread by the runtime.
+    with locker:
+        stats = locker.value
+        stats['futures'].discard(future)
+        if future.cancelled():
+            stats['queued']    -= 1
+            stats['cancelled'] += 1
+            return
+        exc = future.exception()
+        if exc is None:
+            stats['completed'] += 1
+            handler = on_done
+            value   = future.result()
+        else:
+            stats['failed'] += 1
+            handler = on_error
+            value   = exc
+    if handler is not None:
+        stats['results'].append((handler, value, _perf_counter_ms()))
+
+
+
+
+# `Runtime.submit_process` helpers. Buffer-protocol results are written
+# into shared memory by the worker process and are mapped (not copied)
+# by the main process, so large arrays don't go through `pickle`.
+
+class _SharedBuffer(NamedTuple):
+    name  : str
+    format: str
+    shape : tuple[int, ...]
+    nbytes: int
+
+
+def _to_shared_buffer(obj: Any) -> Any:
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return obj
+    with view:
+        if not view.c_contiguous:
+            data = view.tobytes()
+        else:
+            data = view.cast('B') if view.ndim else view.tobytes()
+        shm = SharedMemory(create=True, size=max(1, view.nbytes))
+        try:
+            shm.buf[:view.nbytes] = data
+            return _SharedBuffer(shm.name, view.format, view.shape, view.nbytes)
+        except:
+            shm.unlink()
+            raise
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+            shm.close()
+
+
+def _to_shared_payload(result: Any) -> Any:
+    # Only the top-level of a tuple or list is inspected; i.e. `[xs, ys]`
+    # for plot series.
+    if result.__class__ not in (tuple, list):
+        return _to_shared_buffer(result)
+    payload = []
+    try:
+        for v in result:
+            payload.append(_to_shared_buffer(v))
+    except:
+        _unlink_shared_payload(payload)
+        raise
+    return result.__class__(payload)
+
+
+def _is_shared_payload(payload: Any) -> bool:
+    if isinstance(payload, _SharedBuffer):
+        return True
+    if payload.__class__ not in (tuple, list):
+        return False
+    return any(isinstance(v, _SharedBuffer) for v in payload)
+
+
+def _unlink_shared_payload(payload: Any) -> None:
+    if isinstance(payload, _SharedBuffer):
+        payload = (payload,)
+    elif payload.__class__ not in (tuple, list):
+        return
+    for v in payload:
+        if isinstance(v, _SharedBuffer):
+            try:
+                SharedMemory(name=v.name).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _run_process_task(fn: Callable, args: tuple, kwargs: dict) -> tuple[Any, float]:
+    # Executed in a worker process.
+    ts_start = time.perf_counter()
+    result   = fn(*args, **kwargs)
+    run_time = 1000.0 * (time.perf_counter() - ts_start)
+    return _to_shared_payload(result), run_time
+
+
+def _process_warm_up() -> int:
+    # Keeps the worker busy long enough for other workers to be spawned.
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def _release_shared_payloads(locker: Locker) -> None:
+    # Unlinks shared blocks of results that were queued, but not yet
+    # delivered. Their handlers are skipped.
+    with locker:
+        payloads = locker.value['payloads']
+        pending  = tuple(payloads.values())
+        payloads.clear()
+    for payload in pending:
+        _unlink_shared_payload(payload)
+
+
+def _deliver_shared_payload(locker: Locker, handler: Callable, token: int, payload: Any) -> None:
+    # Executed in the main thread. Views are only valid for the duration
+    # of the handler call.
+    with locker:
+        if locker.value['payloads'].pop(token, None) is None:
+            return  # released by `_release_shared_payloads`
+    blocks: list[tuple[SharedMemory, memoryview]] = []
+
+    def attach(v: Any):
+        if not isinstance(v, _SharedBuffer):
+            return v
+        shm  = SharedMemory(name=v.name)
+        view = shm.buf[:v.nbytes]
+        blocks.append((shm, view))
+        if v.format != 'B' or len(v.shape) != 1:
+            try:
+                view = view.cast(v.format, v.shape)
+            except (TypeError, ValueError):
+                pass  # non-native format; send raw bytes
+            else:
+                blocks.append((shm, view))
+        return view
+
+    try:
+        if payload.__class__ in (tuple, list):
+            value = payload.__class__(attach(v) for v in payload)
+        else:
+            value = attach(payload)
+        handler(value)
+    finally:
+        for shm, view in reversed(blocks):
+            try:
+                view.release()
+            except BufferError:
+                pass  # still exported by the handler
+        for shm in {id(shm): shm for shm, _ in blocks}.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass
+            shm.unlink()
+
+
+def _set_value_from_result(item: ItemT, value: Any) -> None:
+    # Shared buffer views are released once the handler returns, so
+    # Dear PyGui gets a copy.
+    if isinstance(value, memoryview):
+        value = value.tolist()
+    elif value.__class__ in (tuple, list):
+        value = value.__class__(v.tolist() if isinstance(v, memoryview) else v for v in value)
+    _dearpygui.set_value(item, value)
+
+
+def _get_process_executor(locker: Locker) -> ProcessPoolExecutor:
+    # lock must be held
+    state    = locker.value
+    # The lock is not held for this read. Worst-case is the pool is
+    # resized on the next submission.
+    workers  = Runtime.configure.__self__.value['process_workers']  # type: ignore
+    executor = state['executor']
+    if executor is None or state['workers'] != workers:
+        if executor is not None:
+            executor.shutdown(wait=False)
+        # Forking a process running Dear PyGui's threads is asking for
+        # trouble.
+        executor = state['executor'] = ProcessPoolExecutor(
+            workers,
+            mp_context=_mp_get_context('spawn'),
+        )
+        state['workers'] = workers
+    return executor
+
+
+def _submit_process_task(locker: Locker, fn: Callable, *args) -> Future:
+    # lock must be held
+    try:
+        return _get_process_executor(locker).submit(fn, *args)
+    except BrokenProcessPool:
+        # The pool broke before any task could report it.
+        state = locker.value
+        state['executor'].shutdown(wait=False)
+        state['executor'] = None
+        state['restarts'] += 1
+        return _get_process_executor(locker).submit(fn, *args)
+
+
+def _process_task_done_callback(
+    locker  : Locker,
+    executor: ProcessPoolExecutor,
+    on_done : Callable | None,
+    on_error: Callable | None,
+    ts_submit: float,
+    future  : Future,
+):
+    # Executed in the executor's management thread, or in the calling
+    # thread when the future is cancelled.
+    with locker:
+        stats = locker.value
+        stats['futures'].discard(future)
+        if future.cancelled():
+            stats['cancelled'] += 1
+            return
+        exc = future.exception()
+        if exc is None:
+            payload, run_time = future.result()
+            wait_time = _perf_counter_ms() - ts_submit - run_time
+            stats['completed'] += 1
+            stats['run_time']  += run_time
+            stats['wait_time'] += wait_time
+            if run_time > stats['run_time_max']:
+                stats['run_time_max'] = run_time
+            if wait_time > stats['wait_time_max']:
+                stats['wait_time_max'] = wait_time
+            handler = on_done
+        else:
+            stats['failed'] += 1
+            # A worker died abruptly; the pool is unusable. A new one
+            # is created on the next submission.
+            if isinstance(exc, BrokenProcessPool) and stats['executor'] is executor:
+                stats['executor'] = None
+                stats['workers']  = 0
+                stats['restarts'] += 1
+                executor.shutdown(wait=False)
+            handler = on_error
+            payload = exc
+    if handler is None:
+        if exc is None:
+            _unlink_shared_payload(payload)
+    elif exc is None and _is_shared_payload(payload):
+        with locker:
+            token = next(stats['payload_seq'])
+            stats['payloads'][token] = payload
+        stats['results'].append(
+            (functools.partial(_deliver_shared_payload, locker, handler, token), payload, _perf_counter_ms())
+        )
+    else:
+        stats['results'].append((handler, payload, _perf_counter_ms()))
+
+
+# Keyed by the function object's id so bound methods (a new object on
+# each attribute access) share an entry. Entries are evicted when the
+# function is collected. `WeakKeyDictionary` is ~4x slower on lookup.
+_callback_arities: dict[int, tuple[int, weakref.ref]] = {}
+
+_VARIADIC_ARITY = 1 << 16
+
+
+def _count_arity(callback: Callable) -> int:
+    if type(callback) is types.FunctionType and not hasattr(callback, '__wrapped__'):
+        code = callback.__code__
+        if code.co_flags & inspect.CO_VARARGS:
+            return _VARIADIC_ARITY
+        return code.co_argcount
+    # signature follows `__wrapped__`, which matters for decorated callbacks
+    count = 0
+    for p in _tools.parameters(callback):
+        if p.kind == p.VAR_POSITIONAL:
+            return _VARIADIC_ARITY
+        elif p.kind in (p.KEYWORD_ONLY, p.VAR_KEYWORD):
+            break
+        count += 1
+    return count
+
+
+def _callback_arity(callback: Callable) -> int:
+    """Return the number of positional arguments (max 3) Dear PyGui
+    would send to a callback.
+    """
+    tp = type(callback)
+    if tp is types.MethodType:
+        key    = callback.__func__  # type: ignore
+        offset = 1
+    elif tp is types.FunctionType:
+        key    = callback
+        offset = 0
+    elif getattr(tp, '__item_callback__', False):
+        # `events.Callback` & co. accept all three
+        return 3
+    else:
+        key    = callback
+        offset = 0
+    try:
+        arity = _callback_arities[id(key)][0]
+    except KeyError:
+        arity = _count_arity(key)
+        try:
+            ref = weakref.ref(key, lambda _, k=id(key): _callback_arities.pop(k, None))
+        except TypeError:
+            pass  # not weak-referencable (i.e. built-in)
+        else:
+            _callback_arities[id(key)] = (arity, ref)
+    arity -= offset
+    return 3 if arity > 3 else arity if arity > 0 else 0
+
+
+class ScheduledCallback:
+    """A handle to a callback scheduled using
+    `Runtime.schedule_frame_callback`."""
+    __slots__ = (
+        'callback',
+        'user_data',
+        'interval',
+        'frame',
+        '_cancelled',
+        '__weakref__',
+    )
+
+    def __init__(self, callback: Callable, frame: int, interval: int, user_data: Any):
+        self.callback   = callback
+        self.user_data  = user_data
+        self.interval   = interval
+        self.frame      = frame
+        self._cancelled = False
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__qualname__}(callback={self.callback!r}, frame={self.frame}, "
+            f"interval={self.interval}, cancelled={self._cancelled})>"
+        )
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if the callback will no longer run."""
+        return self._cancelled
+
+    def cancel(self) -> bool:
+        """Prevent the callback from running. Return False if it was
+        already cancelled, otherwise return True."""
+        return Runtime._cancel_frame_callback(self)
+
+
 class _RuntimeMeta(_typing.ItemInterfaceMeta):
     target_frame_rate: Property[float | None] = _typing.ItemConfig()
     clamp_frame_rate : Property[bool]         = _typing.ItemConfig()
     update_interval  : Property[float]        = _typing.ItemConfig()
+    task_workers     : Property[int]          = _typing.ItemConfig()
+    process_workers  : Property[int]          = _typing.ItemConfig()
+    stats_window     : Property[int]          = _typing.ItemConfig()
 
     is_ok                : Property[bool | None]  = _typing.ItemState("ok")
     is_frame_rate_clamped: Property[bool | None]  = _typing.ItemState("frame_rate_clamped")
@@ -1210,10 +1809,26 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         (min 0.1) used for executing tasks/updates in `Runtime.queue`
         while running. Negative and false-like values evaluate to 0.1.
         Float values are set with a precision of 3.
+
+        * task_workers: The maximum number of worker threads used to
+        execute tasks sent to `Runtime.submit` (min 1). False-like
+        values evaluate to the `concurrent.futures.ThreadPoolExecutor`
+        default.
+
+        * process_workers: The maximum number of worker processes used
+        to execute tasks sent to `Runtime.submit_process` (min 1). False-
+        like values evaluate to one less than the number of CPUs.
+
+        * stats_window: The number of most recent frames (min 1) kept
+        by the runtime for computing frame time percentiles. Updating
+        this value resets all frame statistics.
     """
     target_frame_rate = cast(float | None, _RuntimeMeta.target_frame_rate)  # type: ignore
     clamp_frame_rate  = cast(bool, _RuntimeMeta.clamp_frame_rate)  # type: ignore
     update_interval   = cast(float, _RuntimeMeta.update_interval)  # type: ignore
+    task_workers      = cast(int, _RuntimeMeta.task_workers)  # type: ignore
+    process_workers   = cast(int, _RuntimeMeta.process_workers)  # type: ignore
+    stats_window      = cast(int, _RuntimeMeta.stats_window)  # type: ignore
 
     is_ok                 = cast(bool, _RuntimeMeta.is_ok)  # type: ignore
     is_frame_rate_clamped = cast(bool, _RuntimeMeta.is_frame_rate_clamped)  # type: ignore
@@ -1227,6 +1842,9 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         "render_interval"  : 0.0,
         "target_frame_rate": None,
         "clamp_frame_rate" : False,
+        "task_workers"     : _default_task_workers(),
+        "process_workers"  : _default_process_workers(),
+        "stats_window"     : 600,
     })
     __rt_callbacks = Locker({})
 
@@ -1269,6 +1887,10 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         before rendering that frame. When *frame* is -1, *callback* will
         run when destroying the GPU context (`dearpygui.destroy_context`
         or `Application.destroy_context`).
+
+        Only one callback can be set per frame; setting another replaces
+        it. See `Runtime.schedule_frame_callback` for scheduling multiple,
+        relative or recurring callbacks.
         """
         # Unlike `callback_queue`, I can easily see users doing
         # this before setup.
@@ -1287,7 +1909,11 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
                 else:
                     locker.value[frame] = callback
 
-                return callback
+            # don't break the chain of `Runtime.schedule_frame_callback`'s
+            # fallback driver (see `Runtime._arm_frame_driver`)
+            if frame != -1 and frame == Runtime.run_frame_callbacks.__self__.value['driver']:
+                Runtime._arm_frame_driver(frame + 1)
+            return callback
 
         if callback is _SENTINEL:
             return capture_callback
@@ -1317,6 +1943,213 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         """
         return Runtime.set_frame_callback(-1, callback, user_data=user_data)
 
+    # Entries are `(frame, seq, handle)`; *seq* keeps same-frame callbacks
+    # in FIFO order and prevents handles from being compared. Cancelled
+    # entries are left in the heap and skipped when popped, unless they
+    # make up most of it.
+    # *runs* counts calls to `run_frame_callbacks` and *ran* is the frame
+    # of the last one. *driver* is the frame the fallback driver is set
+    # for (-1 if unset), and *driver_runs* the value of *runs* after it
+    # last ran.
+    __rt_schedule = Locker({
+        "heap"       : [],
+        "seq"        : itertools.count(),
+        "cancelled"  : 0,
+        "runs"       : 0,
+        "ran"        : -2,
+        "driver"     : -1,
+        "driver_runs": 0,
+    })
+
+    @staticmethod
+    @__rt_schedule
+    def schedule_frame_callback(
+        locker   : Locker, /,
+        callback : Callable,
+        frame    : int | None = None,
+        *,
+        delay    : int        = 0,
+        interval : int        = 0,
+        user_data: Any        = None,
+    ) -> ScheduledCallback:
+        """Schedule a callback to run before rendering a frame. Return a
+        handle that can be used to cancel it.
+
+        Args:
+            * callback: A Dear PyGui-callable callback. It is sent the
+            frame number as `sender` and *user_data* (if able).
+
+            * frame: The frame number in which *callback* will be
+            scheduled. If None, the current frame is used.
+
+            * delay: The number of frames to wait after *frame*.
+
+            * interval: If non-zero, *callback* is rescheduled to run
+            every *interval* frames until cancelled.
+
+            * user_data: Send as the third positional argument to the
+            callback (if able).
+
+
+        Unlike `Runtime.set_frame_callback`, any number of callbacks can
+        be scheduled for the same frame; they run in the order they were
+        scheduled. Callbacks scheduled for a frame that has already been
+        rendered run before rendering the next frame. Scheduled callbacks
+        are executed in the main thread by `Runtime.run_frame_callbacks`,
+        which `Runtime.start` calls automatically.
+
+        When nothing else calls `Runtime.run_frame_callbacks` (i.e. the
+        loop is `dearpygui.start_dearpygui()`), scheduled callbacks are
+        run by a Dear PyGui frame callback instead, and execute wherever
+        Dear PyGui runs its callbacks. It yields to frames that have a
+        callback set via `Runtime.set_frame_callback`, so those frames
+        may run scheduled callbacks one frame late.
+        """
+        count = _dearpygui.get_frame_count()
+        if frame is None:
+            frame = count
+        frame += max(0, delay)
+        handle = ScheduledCallback(callback, frame, max(0, interval), user_data)
+        with locker:
+            state = locker.value
+            heapq.heappush(state['heap'], (frame, next(state['seq']), handle))
+            arm = state['driver'] <= count and state['ran'] < count - 1
+        if arm:
+            Runtime._arm_frame_driver()
+        return handle
+
+    @staticmethod
+    @__rt_schedule
+    def _arm_frame_driver(locker: Locker, /, frame: int | None = None):
+        # The fallback driver of scheduled callbacks is a Dear PyGui frame
+        # callback that sets itself for the next frame while callbacks are
+        # scheduled. It stops once something else (`Runtime.start`, a
+        # manual loop) calls `run_frame_callbacks`.
+        if frame is None:
+            frame = _dearpygui.get_frame_count() + 1
+        user_frames = Runtime.frame_callbacks
+        while frame in user_frames:
+            frame += 1
+        with locker:
+            state = locker.value
+            state['driver']      = frame
+            state['driver_runs'] = state['runs']
+        _runtime_set_frame_callback(frame, _drive_frame_callbacks)
+
+    @staticmethod
+    @__rt_schedule
+    def _cancel_frame_callback(locker: Locker, /, handle: ScheduledCallback) -> bool:
+        with locker:
+            if handle._cancelled:
+                return False
+            handle._cancelled = True
+            state = locker.value
+            heap  = state['heap']
+            state['cancelled'] += 1
+            if state['cancelled'] > 64 and state['cancelled'] > len(heap) // 2:
+                heap[:] = [e for e in heap if not e[2]._cancelled]
+                heapq.heapify(heap)
+                state['cancelled'] = 0
+        return True
+
+    @staticmethod
+    @__rt_schedule
+    def cancel_frame_callbacks(locker: Locker, /) -> int:
+        """Cancel all callbacks scheduled using `Runtime.schedule_frame_callback`.
+        Return the number of callbacks cancelled.
+        """
+        with locker:
+            state = locker.value
+            count = 0
+            for _, _, handle in state['heap']:
+                if not handle._cancelled:
+                    handle._cancelled = True
+                    count += 1
+            state['heap'].clear()
+            state['cancelled'] = 0
+        return count
+
+    @staticmethod
+    @__rt_schedule
+    def run_frame_callbacks(locker: Locker, /, frame: int | None = None) -> int:
+        """Execute callbacks scheduled using `Runtime.schedule_frame_callback`
+        that are due. Return the number of callbacks executed.
+
+        Args:
+            * frame: Callbacks scheduled on or before this frame are
+            considered due. If None, the current frame is used.
+
+
+        `Runtime.start` calls this once per frame automatically, so using
+        this method is only necessary when building the main event loop
+        manually.
+        """
+        state = locker.value
+        heap  = state['heap']
+        if frame is None:
+            frame = _dearpygui.get_frame_count()
+        with locker:
+            state['runs'] += 1
+            state['ran']   = frame
+        if not heap:
+            return 0
+
+        heappop  = heapq.heappop
+        heappush = heapq.heappush
+        seq      = state['seq']
+        due      = []
+        with locker:
+            while heap and heap[0][0] <= frame:
+                _, _, handle = heappop(heap)
+                if handle._cancelled:
+                    state['cancelled'] -= 1
+                    continue
+                due.append(handle)
+                if handle.interval:
+                    # scheduled relative to the current frame so missed
+                    # frames aren't "caught up"
+                    handle.frame = frame + handle.interval
+                    heappush(heap, (handle.frame, next(seq), handle))
+        if not due:
+            return 0
+
+        arity = _callback_arity
+        count = 0
+        index = 0
+        try:
+            while index < len(due):
+                handle = due[index]
+                index += 1
+                # A callback may cancel others that are due in the same batch.
+                with locker:
+                    if handle._cancelled:
+                        if not handle.interval:  # was already popped
+                            state['cancelled'] = max(0, state['cancelled'] - 1)
+                        continue
+                    if not handle.interval:
+                        handle._cancelled = True
+                callback = handle.callback
+                arg_count = arity(callback)
+                if arg_count >= 3:
+                    callback(frame, None, handle.user_data)
+                elif arg_count == 2:
+                    callback(frame, None)
+                elif arg_count == 1:
+                    callback(frame)
+                else:
+                    callback()
+                count += 1
+        finally:
+            if index < len(due):
+                # A callback raised. One-shot callbacks that didn't get to
+                # run are put back (recurring ones already were). Cancelled
+                # ones are too, so the heap's cancelled count stays right.
+                with locker:
+                    for handle in due[index:]:
+                        if not handle.interval:
+                            heappush(heap, (handle.frame, next(seq), handle))
+        return count
+
     @staticmethod
     def callback_queue() -> Sequence[tuple[Callable | None, Any, Any, Any]] | None:
         """Return Dear PyGui's callback queue, or None if the
@@ -1359,32 +2192,28 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         """
         if queue is None or not len(queue):  # custom queues may not be falsy when empty
             return
-        for callback, *args in queue:
-            try:
-                parameters = _tools.parameters(callback)
-            except TypeError:
-                # XXX: I'm not sure when this could be None as a result of
-                # `get_callback_queue`, but the original implementation does
-                # include a check.
-                if callback is None:
-                    continue
-                raise
+        arity = _callback_arity
+        for entry in queue:
+            callback = entry[0]
+            # XXX: I'm not sure when this could be None as a result of
+            # `get_callback_queue`, but the original implementation does
+            # include a check.
+            if callback is None:
+                continue
             # Dear PyGui (i.e. `get_callback_queue`) will always send its usual
             # three positional arguments, regardless if the function can accept
             # them. A user may have a different structure.
-            args_count  = len(args)
-            param_count = 0
-            for p in parameters:
-                if param_count >= args_count or p.kind in (
-                    p.KEYWORD_ONLY,
-                    p.VAR_KEYWORD,
-                ):
-                    break
-                elif p.kind == p.VAR_POSITIONAL:
-                    param_count = args_count
-                    break
-                param_count += 1
-            callback(*args[:param_count])  # type:ignore
+            arg_count = arity(callback)
+            if arg_count >= len(entry):
+                arg_count = len(entry) - 1
+            if arg_count == 3:
+                callback(entry[1], entry[2], entry[3])
+            elif arg_count == 2:
+                callback(entry[1], entry[2])
+            elif arg_count == 1:
+                callback(entry[1])
+            else:
+                callback()
 
     @staticmethod
     def time_elapsed():
@@ -1472,6 +2301,40 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
 
     queue: Queue[Callable[[], Any]] = Queue()
 
+    # Clock is shared with the runtime loop (`time.perf_counter`).
+    timers: _tools.TimerWheel = _tools.TimerWheel()
+
+    @staticmethod
+    def call_later(delay: float, callback: Callable[..., Any], *args: Any) -> _tools.Timer:
+        """Schedule a callback to run in the main thread after a delay.
+        Return a handle that can be used to cancel it.
+
+        Args:
+            * delay: Time to wait in fractional seconds.
+
+            * callback: The callable to execute. Additional positional
+            arguments are passed to it when called.
+
+
+        Timers are tracked using the runtime's timer wheel (class-bound
+        `Runtime.timers`), which `Runtime.start` advances on every
+        iteration of the event loop. Scheduling and cancelling a timer
+        are constant-time operations, and an empty wheel costs nothing
+        to advance. Callbacks run with a resolution of one millisecond,
+        but no sooner than the next iteration of the event loop.
+        """
+        return Runtime.timers.call_later(delay, callback, *args)
+
+    @staticmethod
+    def run_timers() -> int:
+        """Execute callbacks of expired timers scheduled using
+        `Runtime.call_later`. Return the number of callbacks executed.
+
+        `Runtime.start` calls this automatically, so using this method
+        is only necessary when building the main event loop manually.
+        """
+        return Runtime.timers.advance()
+
     @classmethod
     def start(cls, *args, debug_aware: bool = False, **kwargs):
         """Start the runtime event loop and render the user interface.
@@ -1516,9 +2379,26 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         of 2.0 means that every task executed will "consume" 2.0
         milliseconds of real-time "produced" by the renderer (Dear PyGui),
         regardless of how long the task actually takes to run.
+
+        Callbacks scheduled using `Runtime.schedule_frame_callback` and
+        handlers of tasks sent to `Runtime.submit` are executed once per
+        frame, immediately before rendering it.
+
+        Expired timers scheduled using `Runtime.call_later` are executed
+        on every iteration of the loop, regardless of rendering.
+
+        Time spent in each phase of the loop is recorded per frame and
+        can be fetched using `Runtime.stats`.
         """
         Runtime.prepare()
 
+        # switch timers back to the real clock if `Runtime.step` was used
+        step_state = Runtime.step.__self__.value  # type: ignore
+        if step_state['clock'] is not None:
+            # re-anchored; the virtual clock may be ahead of real time
+            cls.timers.set_clock(step_state['real_clock'])
+            step_state['clock'] = step_state['real_clock'] = None
+
         # The lock never held for access here. Worst-case is it
         # fixes itself in a frame.
         rt_config    = Runtime.configure.__self__.value
@@ -1526,6 +2406,9 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         is_running   = Runtime.is_running
         render_frame = cls.render_frame
         queue        = cls.queue
+        run_handlers = cls.run_task_callbacks
+        run_frame_callbacks = cls.run_frame_callbacks
+        run_timers   = cls.timers.advance
 
         def perf_counter_ms(_counter = time.perf_counter):
             return 1000.0 * _counter()
@@ -1542,19 +2425,36 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         # It's probably for the best to not handle exceptions here
         # anyway to avoid unintentionally handling errors thrown from
         # user code.
-        def recursive_task(_put=queue.put):
+        # `Queue.put` is used directly so instance-level patches of
+        # `queue.put` (i.e. `diagnostics.Tracer`) don't see this task;
+        # they would run on every tick.
+        def recursive_task(_put=functools.partial(Queue.put, queue)):
             # TODO: Maybe do something useful here. Debugging? Cleanup?
             # DPG callbacks tend to leak `app_data` and `user_data` refs
             # like `None`, so it's not like there isn't stuff to do.
             _put(recursive_task)
 
-        queue.put(recursive_task)
+        Queue.put(queue, recursive_task)
 
         t_updates = 0.0
         ts_last_update = ts_last_render = perf_counter_ms()
 
+        # Per-frame telemetry. Phases are only timed when there's work to
+        # do, so spinning between frames is counted as idle time.
+        record_frame = Runtime.stats.__self__.value.record  # type: ignore
+        t_tasks = t_callbacks = 0.0
+        n_tasks = n_callbacks = 0
+
+        # Scheduled frame callbacks are run by this loop; stop the fallback
+        # driver (see `Runtime._arm_frame_driver`) before it sees a frame.
+        schedule = Runtime.run_frame_callbacks.__self__  # type: ignore
+        with schedule:
+            schedule.value['runs'] += 1
+
         render_frame()   # initializes DPG item states
 
+        ts_last_frame = perf_counter_ms()
+
         # TODO: isolate ticks and rendering into separate methods
 
         if (
@@ -1568,39 +2468,109 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
 
             while is_running():
 
-                run_queue(get_queue())
+                ts_this_update = perf_counter_ms()
+                cb_queue = get_queue()
+                if cb_queue:
+                    run_queue(cb_queue)
+                    n_callbacks += len(cb_queue)
+                    ts = perf_counter_ms()
+                    t_callbacks += ts - ts_this_update
+                    ts_this_update = ts
+
+                n = run_timers()
+                if n:
+                    n_callbacks += n
+                    ts = perf_counter_ms()
+                    t_callbacks += ts - ts_this_update
+                    ts_this_update = ts
 
-                ts_this_update  = perf_counter_ms()
                 update_interval = rt_config['update_interval']
                 t_updates = trunc_6f(t_updates + ts_this_update - ts_last_update)
                 ts_last_update = ts_this_update
-                while t_updates >= update_interval:
-                    queue.get_nowait()()
-                    queue.task_done()
-                    t_updates -= update_interval
+                if t_updates >= update_interval:
+                    while t_updates >= update_interval:
+                        task = queue.get_nowait()
+                        task()
+                        queue.task_done()
+                        t_updates -= update_interval
+                        if task is not recursive_task:
+                            n_tasks += 1
+                    ts_this_render = perf_counter_ms()
+                    t_tasks += ts_this_render - ts_this_update
+                else:
+                    ts_this_render = ts_this_update
 
-                ts_this_render = perf_counter_ms()
                 if ts_this_render - ts_last_render >= rt_config['render_interval']:
                     ts_last_render = ts_this_render
+                    n_callbacks += run_frame_callbacks() + run_handlers()
+                    ts_render = perf_counter_ms()
+                    t_callbacks += ts_render - ts_this_render
                     render_frame()
+                    ts_rendered = perf_counter_ms()
+                    record_frame(
+                        ts_rendered - ts_last_frame,
+                        t_tasks,
+                        t_callbacks,
+                        ts_rendered - ts_render,
+                        n_tasks,
+                        n_callbacks,
+                        rt_config['render_interval'] or _DEFAULT_FRAME_BUDGET,
+                    )
+                    ts_last_frame = ts_rendered
+                    t_tasks = t_callbacks = 0.0
+                    n_tasks = n_callbacks = 0
 
         else:
 
             while is_running():
 
-                ts_this_update  = perf_counter_ms()
+                ts_this_update = perf_counter_ms()
+                n = run_timers()
+                if n:
+                    n_callbacks += n
+                    ts = perf_counter_ms()
+                    t_callbacks += ts - ts_this_update
+                    ts_this_update = ts
+
                 update_interval = rt_config['update_interval']
                 t_updates = trunc_6f(t_updates + ts_this_update - ts_last_update)
                 ts_last_update = ts_this_update
-                while t_updates >= update_interval:
-                    queue.get_nowait()()
-                    queue.task_done()
-                    t_updates -= update_interval
+                if t_updates >= update_interval:
+                    while t_updates >= update_interval:
+                        task = queue.get_nowait()
+                        task()
+                        queue.task_done()
+                        t_updates -= update_interval
+                        if task is not recursive_task:
+                            n_tasks += 1
+                    ts_this_render = perf_counter_ms()
+                    t_tasks += ts_this_render - ts_this_update
+                else:
+                    ts_this_render = ts_this_update
 
-                ts_this_render  = perf_counter_ms()
                 if ts_this_render - ts_last_render >= rt_config['render_interval']:
                     ts_last_render = ts_this_render
+                    n_callbacks += run_frame_callbacks() + run_handlers()
+                    ts_render = perf_counter_ms()
+                    t_callbacks += ts_render - ts_this_render
                     render_frame()
+                    ts_rendered = perf_counter_ms()
+                    record_frame(
+                        ts_rendered - ts_last_frame,
+                        t_tasks,
+                        t_callbacks,
+                        ts_rendered - ts_render,
+                        n_tasks,
+                        n_callbacks,
+                        rt_config['render_interval'] or _DEFAULT_FRAME_BUDGET,
+                    )
+                    ts_last_frame = ts_rendered
+                    t_tasks = t_callbacks = 0.0
+                    n_tasks = n_callbacks = 0
+
+        # handlers of unfinished tasks will never run
+        Runtime.shutdown_tasks(wait=False, cancel=True)
+        Runtime.shutdown_processes(wait=False, cancel=True)
 
     @staticmethod
     def stop(*args, **kwargs):
@@ -1611,9 +2581,589 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
         if Runtime.is_running():
             _dearpygui.stop_dearpygui()
 
+    __rt_step = Locker({
+        "time"      : 0.0,
+        "clock"     : None,
+        "real_clock": None,
+        "t_updates" : 0.0,
+    })
+
+    @staticmethod
+    @__rt_step
+    def step(locker: Locker, /, frames: int = 1, *, interval: float | None = None) -> int:
+        """Advance the runtime by a fixed number of frames, then return.
+        Return the number of frames rendered.
+
+        Args:
+            * frames: The number of frames to render.
+
+            * interval: Amount of time in fractional milliseconds each
+            frame "lasts". If None, the runtime's *render_interval* is
+            used, or 1/60th of a second when the frame rate is not
+            clamped.
+
+
+        This is an alternative to `Runtime.start` for scripted use, like
+        tests or load testing in CI. Frames are rendered back-to-back
+        without waiting for their interval to elapse. Instead, the
+        runtime keeps a virtual clock that moves forward by *interval*
+        per frame. Each frame runs the same phases as `Runtime.start`
+        does, in the same order:
+            - expired timers (see `Runtime.call_later`), using the virtual
+            clock
+
+            - tasks in `Runtime.queue`, consuming *interval* milliseconds
+            of the *update_interval* fixed time step
+
+            - frame callbacks (see `Runtime.schedule_frame_callback`) and
+            handlers of finished `Runtime.submit` tasks
+
+            - rendering
+
+
+        The runtime is prepared as needed, and the viewport is created
+        with vsync disabled when it does not exist yet. A display is
+        still required. On Linux machines without one, use a virtual
+        X server and software rendering (i.e. `xvfb-run -a` with
+        `LIBGL_ALWAYS_SOFTWARE=1`).
+
+        Frame telemetry is recorded as it is while running (see
+        `Runtime.stats`), using real durations.
+
+        Dear PyGui runs item callbacks in a separate thread unless the
+        `manual_callback_management` application setting is True, in
+        which case they are also executed by this method. Enable it
+        before the first frame is rendered for callbacks to run
+        deterministically.
+
+        Timers scheduled between calls to this method are relative to
+        the virtual clock. `Runtime.start` switches timers back to the
+        real clock; pending timers keep the time they had left.
+        """
+        if frames < 1:
+            return 0
+
+        Application.create_context()
+        if not Application.state()['ok']:
+            Application.prepare()
+        vp_state = Viewport.state()
+        if not vp_state['ok']:
+            Viewport.create(vsync=False)
+        if not vp_state['visible']:
+            Viewport.show()
+
+        state = locker.value
+        with locker:
+            if state['clock'] is None:
+                state['time']       = time.perf_counter()
+                state['real_clock'] = Runtime.timers.clock
+                state['clock']      = lambda _state=state: _state['time']
+                Runtime.timers.set_clock(state['clock'])
+
+        rt_config    = Runtime.configure.__self__.value
+        record_frame = Runtime.stats.__self__.value.record  # type: ignore
+        queue        = Runtime.queue
+        if Application.configuration()['manual_callback_management']:
+            get_queue = Runtime.callback_queue
+        else:
+            get_queue = lambda: None
+
+        def perf_counter_ms(_counter = time.perf_counter):
+            return 1000.0 * _counter()
+
+        rendered = 0
+        while rendered < frames and Runtime.is_running():
+            dt = interval or rt_config['render_interval'] or _DEFAULT_FRAME_BUDGET
+            update_interval = rt_config['update_interval']
+            with locker:
+                state['time']      += dt / 1000.0
+                state['t_updates'] += dt
+                t_updates = state['t_updates']
+
+            ts_frame = perf_counter_ms()
+            n_callbacks = n_tasks = 0
+            cb_queue = get_queue()
+            if cb_queue:
+                Runtime.run_callback_queue(cb_queue)
+                n_callbacks += len(cb_queue)
+            n_callbacks += Runtime.run_timers()
+            ts_tasks = perf_counter_ms()
+
+            while t_updates >= update_interval:
+                try:
+                    task = queue.get_nowait()
+                except Empty:
+                    # Unused time isn't "banked" when the queue is empty.
+                    t_updates %= update_interval
+                    break
+                t_updates -= update_interval
+                task()
+                queue.task_done()
+                n_tasks += 1
+            with locker:
+                state['t_updates'] = t_updates
+            ts_callbacks = perf_counter_ms()
+
+            n_callbacks += Runtime.run_frame_callbacks() + Runtime.run_task_callbacks()
+            ts_render = perf_counter_ms()
+            Runtime.render_frame()
+            ts_rendered = perf_counter_ms()
+            rendered += 1
+
+            record_frame(
+                ts_rendered - ts_frame,
+                ts_callbacks - ts_tasks,
+                (ts_tasks - ts_frame) + (ts_render - ts_callbacks),
+                ts_rendered - ts_render,
+                n_tasks,
+                n_callbacks,
+                dt,
+            )
+        return rendered
+
+    __rt_tasks = Locker({
+        "executor"         : None,
+        "workers"          : 0,
+        "futures"          : set(),
+        "results"          : collections.deque(),
+        "queued"           : 0,
+        "running"          : 0,
+        "submitted"        : 0,
+        "completed"        : 0,
+        "failed"           : 0,
+        "cancelled"        : 0,
+        "delivered"        : 0,
+        "wait_time"        : 0.0,
+        "wait_time_max"    : 0.0,
+        "run_time"         : 0.0,
+        "run_time_max"     : 0.0,
+        "delivery_time"    : 0.0,
+        "delivery_time_max": 0.0,
+    })
+
+    @staticmethod
+    @__rt_tasks
+    def submit(
+        locker  : Locker, /,
+        fn      : Callable[..., _T],
+        *args   : Any,
+        on_done : Callable[[_T], Any] | None            = None,
+        on_error: Callable[[BaseException], Any] | None = None,
+        **kwargs: Any,
+    ) -> Future[_T]:
+        """Execute a callable in a managed worker thread. Return a
+        `concurrent.futures.Future` object representing the task.
+
+        Args:
+            * fn: The callable to execute. Additional positional and
+            keyword arguments are passed to it when called.
+
+            * on_done: Called with the value returned by *fn* when it
+            completes successfully.
+
+            * on_error: Called with the exception raised by *fn* when
+            it fails.
+
+
+        Unlike the future's "done" callbacks, *on_done* and *on_error*
+        are not called by the worker thread. Instead, they are queued
+        and executed in the main thread by the runtime before rendering
+        the next frame. This makes them suitable for updating items
+        with the result of an I/O-bound or otherwise long-running
+        task without blocking Dear PyGui's callback thread. When
+        building the main event loop manually, the handler queue must
+        be processed via `Runtime.run_task_callbacks`.
+
+        The number of tasks executing concurrently is limited by the
+        `task_workers` runtime setting. Remaining tasks are queued in
+        FIFO order. A task can be cancelled via the returned future's
+        `.cancel` method as long as it is still queued. Neither *on_done*
+        nor *on_error* are called for cancelled tasks. When *on_error*
+        is None, exceptions raised by *fn* are not handled, but can be
+        retrieved from the future.
+
+        Queue depth and timing metrics for submitted tasks can be
+        fetched using `Runtime.task_stats`.
+        """
+        ts_submit = _perf_counter_ms()
+        with locker:
+            state    = locker.value
+            # The lock is not held for this read. Worst-case is the pool
+            # is resized on the next submission.
+            workers  = Runtime.configure.__self__.value['task_workers']  # type: ignore
+            executor = state['executor']
+            if executor is None or state['workers'] != workers:
+                if executor is not None:
+                    # queued tasks are unaffected
+                    executor.shutdown(wait=False)
+                executor = state['executor'] = ThreadPoolExecutor(
+                    workers,
+                    thread_name_prefix='dearpypixl-task',
+                )
+                state['workers'] = workers
+            state['queued']    += 1
+            state['submitted'] += 1
+            future = executor.submit(_run_task, locker, fn, args, kwargs, ts_submit)
+            state['futures'].add(future)
+        future.add_done_callback(
+            functools.partial(_task_done_callback, locker, on_done, on_error)
+        )
+        return future
+
+    @staticmethod
+    @__rt_tasks
+    def cancel_tasks(locker: Locker, /) -> int:
+        """Cancel all tasks sent to `Runtime.submit` that have yet to
+        start executing. Return the number of tasks cancelled.
+
+        Tasks that are already executing are not affected.
+        """
+        with locker:
+            futures = tuple(locker.value['futures'])
+        return sum(f.cancel() for f in futures)
+
+    @staticmethod
+    @__rt_tasks
+    def run_task_callbacks(locker: Locker, /) -> int:
+        """Execute queued *on_done* and *on_error* handlers of completed
+        `Runtime.submit` and `Runtime.submit_process` tasks. Return the number of handlers executed.
+
+        Only handlers queued prior to calling this method are executed.
+        `Runtime.start` calls this once per frame automatically, so using
+        this method is only necessary when building the main event loop
+        manually.
+        """
+        results = locker.value['results']
+        if not results:
+            return 0
+
+        popleft = results.popleft
+        count   = len(results)
+        dt_sum  = 0.0
+        dt_max  = 0.0
+        ts_now  = _perf_counter_ms()
+        for _ in range(count):
+            handler, value, ts_done = popleft()
+            dt = ts_now - ts_done
+            dt_sum += dt
+            if dt > dt_max:
+                dt_max = dt
+            handler(value)
+        with locker:
+            stats = locker.value
+            stats['delivered']     += count
+            stats['delivery_time'] += dt_sum
+            if dt_max > stats['delivery_time_max']:
+                stats['delivery_time_max'] = dt_max
+        return count
+
+    @staticmethod
+    @__rt_tasks
+    def task_stats(locker: Locker, /) -> TaskStatsDict:
+        """Return the runtime's task queue depth and timing metrics for
+        tasks sent to `Runtime.submit`.
+
+        Durations are in fractional milliseconds;
+            * wait_time: Time spent queued before starting.
+
+            * run_time: Time spent executing in a worker thread.
+
+            * delivery_time: Time between a task completing and its
+            handler being executed in the main thread.
+        """
+        with locker:
+            stats = locker.value
+            n_started   = stats['submitted'] - stats['queued'] - stats['cancelled']
+            n_finished  = stats['completed'] + stats['failed']
+            n_delivered = stats['delivered']
+            return TaskStatsDict(
+                workers=stats['workers'],
+                queued=stats['queued'],
+                running=stats['running'],
+                pending_callbacks=len(stats['results']),
+                submitted=stats['submitted'],
+                completed=stats['completed'],
+                failed=stats['failed'],
+                cancelled=stats['cancelled'],
+                wait_time_avg=stats['wait_time'] / n_started if n_started else 0.0,
+                wait_time_max=stats['wait_time_max'],
+                run_time_avg=stats['run_time'] / n_finished if n_finished else 0.0,
+                run_time_max=stats['run_time_max'],
+                delivery_time_avg=stats['delivery_time'] / n_delivered if n_delivered else 0.0,
+                delivery_time_max=stats['delivery_time_max'],
+            )
+
+    @staticmethod
+    @__rt_tasks
+    def shutdown_tasks(locker: Locker, /, wait: bool = True, *, cancel: bool = False) -> None:
+        """Release the worker threads used to execute tasks sent to
+        `Runtime.submit`. New worker threads are created as needed
+        on the next submission.
+
+        Args:
+            * wait: If True, block until all queued and executing tasks
+            are finished.
+
+            * cancel: If True, cancel all queued tasks beforehand.
+        """
+        with locker:
+            executor = locker.value['executor']
+            locker.value['executor'] = None
+            locker.value['workers']  = 0
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel)
+
+    __rt_procs = Locker({
+        "executor"     : None,
+        "workers"      : 0,
+        "futures"      : set(),
+        # handlers are delivered by `Runtime.run_task_callbacks`
+        "results"      : __rt_tasks.value["results"],
+        # shared memory payloads of queued results; `token -> payload`
+        "payloads"     : {},
+        "payload_seq"  : itertools.count(),
+        "submitted"    : 0,
+        "completed"    : 0,
+        "failed"       : 0,
+        "cancelled"    : 0,
+        "restarts"     : 0,
+        "wait_time"    : 0.0,
+        "wait_time_max": 0.0,
+        "run_time"     : 0.0,
+        "run_time_max" : 0.0,
+    })
+
+    @staticmethod
+    @__rt_procs
+    def submit_process(
+        locker  : Locker, /,
+        fn      : Callable[..., Any],
+        *args   : Any,
+        on_done : Callable[[Any], Any] | None           = None,
+        on_error: Callable[[BaseException], Any] | None = None,
+        target  : ItemT | None                          = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Execute a callable in a managed worker process. Return a
+        `concurrent.futures.Future` object representing the task.
+
+        Args:
+            * fn: The callable to execute. Additional positional and
+            keyword arguments are passed to it when called. It and its
+            arguments must be picklable.
+
+            * on_done: Called with the value returned by *fn* when it
+            completes successfully.
+
+            * on_error: Called with the exception raised by *fn* when
+            it fails.
+
+            * target: An item to update using the value returned by *fn*.
+            Shared buffers are converted to lists. Ignored when *on_done* is
+            not None.
+
+
+        Useful for CPU-bound work that would otherwise stall rendering
+        due to the GIL. Like `Runtime.submit`, *on_done* and *on_error*
+        are executed in the main thread before rendering the next frame.
+
+        If *fn* returns an object supporting the buffer protocol (i.e.
+        `array.array`, a NumPy array) or a tuple or list of them, each
+        buffer is written to shared memory by the worker instead of
+        being pickled. The handler receives a `memoryview` of the
+        shared block cast to the buffer's format and shape, which
+        Dear PyGui accepts as-is for plot series, textures, etc. The
+        view is released and the block is freed once the handler
+        returns, so the view must be copied if it is needed afterwards.
+        Other results are pickled as normal. The future's result is the
+        internal shared memory descriptor(s) and should not be used.
+
+        Worker processes are started using the "spawn" method, so *fn*
+        must be importable by the worker (i.e. not defined in a
+        `__main__` block). Since starting processes is slow, the pool
+        can be started ahead of time using `Runtime.warm_up_processes`.
+        If a worker dies abruptly, pending tasks fail with
+        `BrokenProcessPool` and a new pool is created on the next
+        submission. The number of workers is limited by the
+        `process_workers` runtime setting.
+
+        Timing metrics for submitted tasks can be fetched using
+        `Runtime.process_task_stats`.
+        """
+        ts_submit = _perf_counter_ms()
+        with locker:
+            state  = locker.value
+            future = _submit_process_task(locker, _run_process_task, fn, args, kwargs)
+            executor = state['executor']
+            state['submitted'] += 1
+            state['futures'].add(future)
+        if on_done is None and target is not None:
+            on_done = functools.partial(_set_value_from_result, target)
+        future.add_done_callback(
+            functools.partial(
+                _process_task_done_callback,
+                locker,
+                executor,
+                on_done,
+                on_error,
+                ts_submit,
+            )
+        )
+        return future
+
+    @staticmethod
+    @__rt_procs
+    def warm_up_processes(locker: Locker, /, wait: bool = True) -> None:
+        """Start the worker processes used to execute tasks sent to
+        `Runtime.submit_process`.
+
+        Args:
+            * wait: If True, block until all workers are running.
+        """
+        with locker:
+            _get_process_executor(locker)
+            futures = [
+                _submit_process_task(locker, _process_warm_up)
+                for _ in range(locker.value['workers'])
+            ]
+        if wait:
+            concurrent.futures.wait(futures)
+
+    @staticmethod
+    @__rt_procs
+    def process_task_stats(locker: Locker, /) -> ProcessTaskStatsDict:
+        """Return timing metrics for tasks sent to `Runtime.submit_process`.
+
+        Durations are in fractional milliseconds;
+            * wait_time: Time spent outside of *fn*; queueing, argument
+            and result transfer.
+
+            * run_time: Time spent executing in a worker process.
+        """
+        with locker:
+            stats = locker.value
+            n_completed = stats['completed']
+            return ProcessTaskStatsDict(
+                workers=stats['workers'],
+                pending=len(stats['futures']),
+                submitted=stats['submitted'],
+                completed=n_completed,
+                failed=stats['failed'],
+                cancelled=stats['cancelled'],
+                restarts=stats['restarts'],
+                wait_time_avg=stats['wait_time'] / n_completed if n_completed else 0.0,
+                wait_time_max=stats['wait_time_max'],
+                run_time_avg=stats['run_time'] / n_completed if n_completed else 0.0,
+                run_time_max=stats['run_time_max'],
+            )
+
+    @staticmethod
+    @__rt_procs
+    def shutdown_processes(locker: Locker, /, wait: bool = True, *, cancel: bool = False) -> None:
+        """Release the worker processes used to execute tasks sent to
+        `Runtime.submit_process`. New workers are started as needed on
+        the next submission.
+
+        Args:
+            * wait: If True, block until all queued and executing tasks
+            are finished.
+
+            * cancel: If True, cancel all queued tasks beforehand. Results
+            of finished tasks whose handlers have not been executed yet are
+            also discarded, and their shared memory is freed.
+
+
+        Shared memory of undelivered results is also freed when the
+        interpreter exits.
+        """
+        with locker:
+            executor = locker.value['executor']
+            locker.value['executor'] = None
+            locker.value['workers']  = 0
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel)
+        if cancel:
+            _release_shared_payloads(locker)
+
+    __rt_stats = Locker(_FrameStats(600))
+
+    @staticmethod
+    @__rt_stats
+    def stats(locker: Locker, /, samples: bool = False) -> RuntimeStatsDict:
+        """Return frame timing metrics recorded by `Runtime.start`.
+
+        Args:
+            * samples: If True, include the raw per-frame samples (oldest
+            first) under the "samples" key.
+
+
+        Durations are in fractional milliseconds. Percentiles are computed
+        over the last *stats_window* frames, while the "frames", "dropped_
+        frames", "tasks", and "callbacks" counters are totals since the
+        runtime started (or statistics were reset). Frame time is split
+        into phases;
+            * task_time: Executing tasks in `Runtime.queue`.
+
+            * callback_time: Executing callbacks in the main thread;
+            Dear PyGui's callback queue (when `manual_callback_management`
+            is True), `Runtime.call_later` timers, frame callbacks and task
+            handlers.
+
+            * render_time: Rendering the frame. Includes time spent
+            waiting for vsync.
+
+            * idle_time: The remaining frame time.
+
+        A frame is considered dropped when it takes longer than 1.5x the
+        frame budget (the render interval when clamping the frame rate,
+        otherwise 1/60th of a second).
+        """
+        return locker.value.summary(samples)
+
+    @staticmethod
+    @__rt_stats
+    def reset_stats(locker: Locker, /) -> None:
+        """Clear all frame timing metrics recorded by `Runtime.start`."""
+        locker.value.reset()
+
+    @staticmethod
+    @__rt_stats
+    def export_stats(
+        locker: Locker, /,
+        file  : str | os.PathLike | IO[str],
+        format: Literal['csv', 'json'] | None = None,
+    ) -> None:
+        """Write frame timing metrics to a file.
+
+        Args:
+            * file: A path or writable text file object.
+
+            * format: Either "csv" or "json". If None, it is inferred
+            from *file*'s extension, and defaults to "json".
+
+
+        JSON output contains the result of `Runtime.stats(samples=True)`.
+        CSV output contains one row per sampled frame.
+        """
+        if format is None:
+            name   = file if isinstance(file, (str, os.PathLike)) else getattr(file, 'name', '')
+            format = 'csv' if os.fspath(name).lower().endswith('.csv') else 'json'
+        if format not in ('csv', 'json'):
+            raise ValueError(f"expected 'csv' or 'json' for `format`, got {format!r}.")
+
+        with contextlib.ExitStack() as stack:
+            if isinstance(file, (str, os.PathLike)):
+                file = stack.enter_context(open(file, 'w', newline='', encoding='utf-8'))
+            if format == 'json':
+                json.dump(locker.value.summary(True), file, indent=2)
+            else:
+                writer = csv.DictWriter(file, FrameSampleDict.__annotations__)
+                writer.writeheader()
+                writer.writerows(locker.value.samples())
+
     @overload
     @staticmethod
-    def configure(*, target_frame_rate: int | None = ..., clamp_frame_rate: bool = ..., update_interval: float = ...): ...  # type: ignore
+    def configure(*, target_frame_rate: int | None = ..., clamp_frame_rate: bool = ..., update_interval: float = ..., task_workers: int = ..., process_workers: int = ..., stats_window: int = ...): ...  # type: ignore
     @staticmethod
     @__rt_config
     def configure(locker, **kwargs):
@@ -1624,6 +3174,18 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
                 kwargs.get('update_interval', config['update_interval']) * (10 ** 3)
             ) / (10 ** 3)
 
+            if 'task_workers' in kwargs:
+                config['task_workers'] = max(
+                    1, int(kwargs['task_workers'] or _default_task_workers())
+                )
+            if 'process_workers' in kwargs:
+                config['process_workers'] = max(
+                    1, int(kwargs['process_workers'] or _default_process_workers())
+                )
+            if 'stats_window' in kwargs:
+                config['stats_window'] = max(1, int(kwargs['stats_window'] or 1))
+                Runtime.stats.__self__.value.resize(config['stats_window'])  # type: ignore
+
             fr_limit = config['target_frame_rate']
             if 'target_frame_rate' in kwargs:
                 fr_limit = kwargs['target_frame_rate']
@@ -1670,6 +3232,11 @@ class Runtime(_typing.ItemInterface, metaclass=_RuntimeMeta):
             return state
 
 
+# Queued `Runtime.submit_process` results may never be delivered; i.e. a
+# manual event loop that doesn't call `Runtime.run_task_callbacks`.
+atexit.register(_release_shared_payloads, Runtime.shutdown_processes.__self__)  # type: ignore
+
+
 
 
 
@@ -2993,3 +4560,22 @@ class ThemeElement:
             e_cfg['target'],
             Item.information(self)['type'],
         )
+
+
+def _drive_frame_callbacks():
+    # Dear PyGui frame callback set by `Runtime._arm_frame_driver`.
+    locker = Runtime.run_frame_callbacks.__self__  # type: ignore
+    state  = locker.value
+    with locker:
+        state['driver'] = -1
+        if state['runs'] != state['driver_runs']:
+            return  # something else runs them
+    try:
+        Runtime.run_frame_callbacks()
+    finally:
+        # re-armed even if a callback raised
+        with locker:
+            state['driver_runs'] = state['runs']
+            pending = bool(state['heap'])
+        if pending:
+            Runtime._arm_frame_driver()
@@ -0,0 +1,636 @@
+"""Benchmarks for Dear PyPixl's performance-sensitive code paths.
+
+Run the suite with `python -m dearpypixl bench`. For options, see
+`python -m dearpypixl bench --help`.
+
+Most benchmarks only need a Dear PyGui context and run anywhere.
+Benchmarks that render frames need a viewport, and are skipped when
+a display is not available. To run them headless on Linux, use a
+virtual X server and software rendering:
+
+    LIBGL_ALWAYS_SOFTWARE=1 xvfb-run -a python -m dearpypixl bench
+
+Results are written as JSON (keys sorted) so they can be saved and
+compared against future runs with `--baseline`. Times are per
+operation, in microseconds.
+"""
+import os
+import sys
+import json
+import time
+import timeit
+import fnmatch
+import itertools
+import platform
+import argparse
+import statistics
+import dearpygui
+import dearpygui.dearpygui as dpg
+from ._typing import (
+    Any,
+    Callable,
+    TypedDict,
+    NotRequired,
+)
+
+
+
+
+# [ REGISTRY ]
+
+class BenchmarkResultDict(TypedDict):
+    number : int
+    repeat : int
+    min    : float
+    median : float
+    mean   : float
+    stdev  : float
+    skipped: NotRequired[str]
+
+
+class BenchmarkReportDict(TypedDict):
+    version    : int
+    environment: dict[str, str]
+    results    : dict[str, BenchmarkResultDict]
+
+
+class BenchmarkComparisonDict(TypedDict):
+    name    : str
+    baseline: float
+    current : float
+    ratio   : float
+    status  : str
+
+
+_REPORT_VERSION = 1
+
+_benchmarks: dict[str, tuple[Callable[[], Callable[[], Any]], bool]] = {}
+
+
+def benchmark(name: str, *, viewport: bool = False):
+    """Register a benchmark.
+
+    Args:
+        * name: A unique, dot-separated name for the benchmark.
+
+        * viewport: If True, the benchmark is skipped when the viewport
+        cannot be shown.
+
+
+    The decorated function is called once to set up the benchmark,
+    and must return a function that performs one operation. The
+    returned function is what is timed.
+    """
+    def register_benchmark(fn: Callable[[], Callable[[], Any]]):
+        if name in _benchmarks:
+            raise ValueError(f'benchmark {name!r} already exists.')
+        _benchmarks[name] = (fn, viewport)
+        return fn
+    return register_benchmark
+
+
+def benchmarks(pattern: str = '*') -> list[str]:
+    """Return the names of registered benchmarks matching a glob
+    pattern."""
+    return sorted(n for n in _benchmarks if fnmatch.fnmatchcase(n, pattern))
+
+
+
+
+# [ RUNNER ]
+
+def _has_display() -> bool:
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+
+_viewport_ready = False
+
+def _setup_viewport():
+    global _viewport_ready
+    if not _viewport_ready:
+        dpg.create_viewport(title='dearpypixl bench', width=800, height=600)
+        dpg.setup_dearpygui()
+        dpg.show_viewport()
+        _viewport_ready = True
+
+
+def environment() -> dict[str, str]:
+    """Return information about the environment the suite runs in."""
+    from importlib import metadata
+    try:
+        dpx_version = metadata.version('dearpypixl')
+    except metadata.PackageNotFoundError:
+        dpx_version = 'unknown'
+    try:  # used by the grid's vector solver when available
+        np_version = metadata.version('numpy')
+    except metadata.PackageNotFoundError:
+        np_version = 'not installed'
+    return {
+        'python'        : platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform'      : platform.platform(),
+        'machine'       : platform.machine(),
+        'dearpygui'     : dearpygui.__version__,
+        'dearpypixl'    : dpx_version,
+        'numpy'         : np_version,
+    }
+
+
+def run_benchmark(name: str, *, repeat: int = 5, min_time: float = 0.2) -> BenchmarkResultDict:
+    """Run one benchmark and return its timings.
+
+    Args:
+        * name: The name of a registered benchmark.
+
+        * repeat: The number of timing rounds.
+
+        * min_time: The minimum duration of a single round, in seconds.
+        The number of operations per round is scaled to meet it.
+
+
+    A Dear PyGui context must exist.
+    """
+    setup, needs_viewport = _benchmarks[name]
+    if needs_viewport:
+        if not _has_display():
+            return BenchmarkResultDict(
+                number=0, repeat=0, min=0.0, median=0.0, mean=0.0, stdev=0.0,
+                skipped='no display available',
+            )
+        _setup_viewport()
+
+    op    = setup()
+    timer = timeit.Timer(op)
+    # calibrate -- `autorange` targets 0.2 seconds
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    rounds = [t / number * 1e6 for t in timer.repeat(repeat, number)]
+    return BenchmarkResultDict(
+        number=number,
+        repeat=repeat,
+        min=min(rounds),
+        median=statistics.median(rounds),
+        mean=statistics.fmean(rounds),
+        stdev=statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+    )
+
+
+def run(
+    pattern : str = '*',
+    *,
+    repeat  : int = 5,
+    min_time: float = 0.2,
+    progress: Callable[[str, BenchmarkResultDict], Any] | None = None,
+) -> BenchmarkReportDict:
+    """Run registered benchmarks and return a report.
+
+    Args:
+        * pattern: A glob pattern used to select benchmarks by name.
+
+        * repeat: The number of timing rounds per benchmark.
+
+        * min_time: The minimum duration of a single round, in seconds.
+
+        * progress: Called with the name and result of each benchmark
+        as it completes.
+
+
+    A Dear PyGui context is created if one does not exist, and is
+    destroyed afterward.
+    """
+    from . import api
+
+    owns_context = not api.Application.state()['ok']
+    if owns_context:
+        dpg.create_context()
+    try:
+        results = {}
+        for name in benchmarks(pattern):
+            results[name] = result = run_benchmark(name, repeat=repeat, min_time=min_time)
+            if progress is not None:
+                progress(name, result)
+    finally:
+        if owns_context:
+            global _viewport_ready
+            dpg.destroy_context()
+            _viewport_ready = False
+    return BenchmarkReportDict(
+        version=_REPORT_VERSION,
+        environment=environment(),
+        results=results,
+    )
+
+
+def compare(
+    baseline : BenchmarkReportDict,
+    report   : BenchmarkReportDict,
+    *,
+    threshold: float = 1.1,
+) -> list[BenchmarkComparisonDict]:
+    """Compare median timings of two reports.
+
+    Args:
+        * baseline: The report to compare against.
+
+        * report: The current report.
+
+        * threshold: A ratio of current to baseline timings. Benchmarks
+        slower than this are "slower", and benchmarks faster than its
+        inverse are "faster".
+
+
+    Benchmarks that were skipped in, or missing from either report are
+    excluded.
+    """
+    rows = []
+    base = baseline['results']
+    for name, result in sorted(report['results'].items()):
+        if name not in base or 'skipped' in result or 'skipped' in base[name]:
+            continue
+        b = base[name]['median']
+        c = result['median']
+        ratio = c / b if b else float('inf')
+        if ratio > threshold:
+            status = 'slower'
+        elif ratio < 1 / threshold:
+            status = 'faster'
+        else:
+            status = 'same'
+        rows.append(BenchmarkComparisonDict(
+            name=name, baseline=b, current=c, ratio=ratio, status=status,
+        ))
+    return rows
+
+
+def save(report: BenchmarkReportDict, file: str | os.PathLike) -> None:
+    """Write a report to a JSON file."""
+    with open(file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load(file: str | os.PathLike) -> BenchmarkReportDict:
+    """Read a report from a JSON file."""
+    with open(file, encoding='utf-8') as f:
+        report = json.load(f)
+    if report.get('version') != _REPORT_VERSION:
+        raise ValueError(
+            f'unsupported report version {report.get("version")!r} '
+            f'(expected {_REPORT_VERSION}).'
+        )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Returns an exit code; 1 if a benchmark
+    is slower than the baseline."""
+    parser = argparse.ArgumentParser(
+        prog='python -m dearpypixl bench',
+        description='Run Dear PyPixl benchmarks.',
+    )
+    parser.add_argument('-k', '--pattern', default='*', help='glob pattern used to select benchmarks (default: *)')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='timing rounds per benchmark (default: 5)')
+    parser.add_argument('-t', '--min-time', type=float, default=0.2, help='minimum seconds per round (default: 0.2)')
+    parser.add_argument('-o', '--output', help='write the report to this JSON file')
+    parser.add_argument('-b', '--baseline', help='compare against a saved JSON report')
+    parser.add_argument('--threshold', type=float, default=1.1, help='slowdown ratio reported as a regression (default: 1.1)')
+    parser.add_argument('-l', '--list', action='store_true', help='list benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in benchmarks(args.pattern):
+            print(name)
+        return 0
+
+    baseline = load(args.baseline) if args.baseline else None
+
+    def progress(name: str, result: BenchmarkResultDict):
+        if 'skipped' in result:
+            print(f'{name:<40} skipped ({result["skipped"]})', file=sys.stderr)
+        else:
+            print(
+                f'{name:<40} {result["median"]:>12.3f} us  '
+                f'(min {result["min"]:.3f}, stdev {result["stdev"]:.3f}, n={result["number"]})',
+                file=sys.stderr,
+            )
+
+    report = run(args.pattern, repeat=args.repeat, min_time=args.min_time, progress=progress)
+    if args.output:
+        save(report, args.output)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+    if baseline is None:
+        return 0
+    rows = compare(baseline, report, threshold=args.threshold)
+    print(file=sys.stderr)
+    for row in rows:
+        print(
+            f'{row["name"]:<40} {row["baseline"]:>12.3f} -> {row["current"]:>12.3f} us  '
+            f'x{row["ratio"]:.2f}  {row["status"]}',
+            file=sys.stderr,
+        )
+    return int(any(row['status'] == 'slower' for row in rows))
+
+
+
+
+# [ BENCHMARKS ]
+
+def _window():
+    return dpg.add_window(show=False)
+
+
+@benchmark('interface.create_item')
+def _():
+    from .items import mvButton
+    parent = _window()
+    def op():
+        dpg.delete_item(mvButton(parent=parent))
+    return op
+
+
+@benchmark('interface.wrap_item')
+def _():
+    from ._interface import interface
+    item = dpg.add_button(parent=_window())
+    return lambda: interface(item)
+
+
+@benchmark('interface.init')
+def _():
+    from .items import mvButton
+    parent = _window()
+    item   = dpg.add_button(parent=parent)
+    # existing item -- only the generated `__init__` runs
+    return lambda: mvButton(tag=item)
+
+
+@benchmark('interface.configure')
+def _():
+    from .items import mvButton
+    item = mvButton(parent=_window())
+    return lambda: item.configure(label='label', width=100)
+
+
+@benchmark('interface.configuration')
+def _():
+    from .items import mvButton
+    item = mvButton(parent=_window())
+    return item.configuration
+
+
+@benchmark('interface.itemconfig_get')
+def _():
+    from .items import mvButton
+    item = mvButton(parent=_window())
+    def op():
+        return item.label
+    return op
+
+
+@benchmark('interface.itemconfig_set')
+def _():
+    from .items import mvButton
+    item = mvButton(parent=_window())
+    def op():
+        item.width = 100
+    return op
+
+
+@benchmark('events.callback_dispatch')
+def _():
+    from .events import Callback
+    cb = Callback(lambda sender, app_data: None)
+    cb.prepare()
+    return lambda: cb(0, None, None)
+
+
+def _callstack_benchmark(fused: bool):
+    from .events import CallStack
+    stack = CallStack([lambda sender, app_data, user_data: None] * 20, user_data=0, fused=fused)
+    stack(0, None, None)
+    return lambda: stack(0, None, None)
+
+
+@benchmark('events.callstack_call')
+def _():
+    return _callstack_benchmark(False)
+
+
+@benchmark('events.callstack_call_fused')
+def _():
+    return _callstack_benchmark(True)
+
+
+@benchmark('events.callback_queue')
+def _():
+    from .api import Runtime
+    def s(sender): ...
+    def sa(sender, app_data): ...
+    def sau(sender, app_data, user_data): ...
+    queue = [(s, 1, 2, 3), (sa, 1, 2, 3), (sau, 1, 2, 3), (None, 1, 2, 3)] * 25
+    return lambda: Runtime.run_callback_queue(queue)
+
+
+def _grid_benchmark(count: int, solver: str = 'scalar', rect_getter: Callable[[Any], tuple] = lambda _: (800, 600, 0, 0, True), *, placeholders: bool = False, **kwargs):
+    # With *placeholders*, items are reserved uuids instead of buttons;
+    # creating tens of thousands of DPG items takes longer than the
+    # benchmark itself. Requires a *rect_setter* that ignores the item.
+    from .grid import Grid
+    window = dpg.add_window(width=800, height=600)
+    grid   = Grid(10, max(1, count // 10), window, rect_getter=rect_getter, solver=solver)
+    for i in range(count):
+        item = dpg.generate_uuid() if placeholders else dpg.add_button(parent=window)
+        grid.push(item, i % 10, i // 10, **kwargs)
+    return grid
+
+
+def _grid_call_benchmark(count: int):
+    # Times a full draw pass; unchanged layouts are otherwise skipped.
+    # Rects are re-applied to every item.
+    grid = _grid_benchmark(count)
+    grid()
+    def op():
+        grid.invalidate(force=True)
+        grid()
+    return op
+
+
+def _grid_solver_benchmark(count: int, solver: str, *, resize: bool = False):
+    # Times a full layout pass. Without *resize*, rects are already applied
+    # so item setters aren't called, and the vector solver repacks its
+    # arrays (`Grid.invalidate`). With *resize*, the grid area alternates
+    # between two sizes so every rect changes, and nothing is repacked.
+    # Items are placeholders and rects are passed to a no-op setter;
+    # creating and configuring the items would dwarf the solver. The
+    # "array" solver is the vector solver without NumPy.
+    if resize:
+        sizes = itertools.cycle(((800, 600, 0, 0, True), (820, 620, 0, 0, True)))
+        rect_getter = lambda _: next(sizes)
+    else:
+        rect_getter = lambda _: (800, 600, 0, 0, True)
+    grid = _grid_benchmark(
+        count,
+        'scalar' if solver == 'scalar' else 'vector',
+        rect_getter,
+        placeholders=True,
+        rect_setter=lambda item, x_pos, y_pos, width, height, show: None,
+    )
+    if solver == 'array':
+        grid._vector_solver._np = None  # type: ignore
+    grid()
+    if resize:
+        return grid
+    def op():
+        grid.invalidate()
+        grid()
+    return op
+
+
+@benchmark('grid.call_10')
+def _():
+    return _grid_call_benchmark(10)
+
+
+@benchmark('grid.call_100')
+def _():
+    return _grid_call_benchmark(100)
+
+
+@benchmark('grid.call_1000')
+def _():
+    return _grid_call_benchmark(1000)
+
+
+@benchmark('grid.solve_scalar_1k')
+def _():
+    return _grid_solver_benchmark(1_000, 'scalar')
+
+
+@benchmark('grid.solve_scalar_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'scalar')
+
+
+@benchmark('grid.solve_scalar_50k')
+def _():
+    return _grid_solver_benchmark(50_000, 'scalar')
+
+
+@benchmark('grid.solve_vector_1k')
+def _():
+    return _grid_solver_benchmark(1_000, 'vector')
+
+
+@benchmark('grid.solve_vector_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'vector')
+
+
+@benchmark('grid.solve_vector_50k')
+def _():
+    return _grid_solver_benchmark(50_000, 'vector')
+
+
+@benchmark('grid.solve_array_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'array')
+
+
+@benchmark('grid.resize_scalar_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'scalar', resize=True)
+
+
+@benchmark('grid.resize_vector_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'vector', resize=True)
+
+
+@benchmark('grid.resize_array_10k')
+def _():
+    return _grid_solver_benchmark(10_000, 'array', resize=True)
+
+
+@benchmark('console.filestream_write')
+def _():
+    from .console import FileStream
+    stream = FileStream(max_len=1000)
+    return lambda: stream.write('line')
+
+
+@benchmark('interface.value_array_setitem')
+def _():
+    from .items import mvValueRegistry, mvFloatVectValue
+    item = mvFloatVectValue(parent=mvValueRegistry(), default_value=[0.0] * 100)
+    # `SupportsValueArray` methods on a plain vector value item
+    from ._interface import SupportsValueArray
+    setitem = SupportsValueArray.__setitem__
+    return lambda: setitem(item, 50, 1.0)  # type: ignore
+
+
+@benchmark('interface.value_array_iadd')
+def _():
+    from .items import mvValueRegistry, mvFloatVectValue
+    from ._interface import SupportsValueArray
+    item = mvFloatVectValue(parent=mvValueRegistry(), default_value=[0.0] * 100)
+    iadd = SupportsValueArray.__iadd__
+    def op():
+        iadd(item, (1.0,))  # type: ignore
+        SupportsValueArray.__delitem__(item, -1)  # type: ignore
+    return op
+
+
+def _tree(depth: int, width: int):
+    from .items import mvGroup
+    root = parent = mvGroup(parent=_window())
+    for _ in range(depth):
+        for _ in range(width - 1):
+            dpg.add_text(parent=parent)
+        parent = mvGroup(parent=parent)
+    return root, parent
+
+
+@benchmark('tree.children')
+def _():
+    root, _ = _tree(1, 100)
+    return lambda: root.children(1)
+
+
+@benchmark('tree.root_parent')
+def _():
+    _, leaf = _tree(20, 1)
+    return lambda: leaf.root_parent
+
+
+@benchmark('tree.item_branch')
+def _():
+    _, leaf = _tree(20, 1)
+    return leaf.item_branch
+
+
+@benchmark('runtime.loop_overhead')
+def _():
+    # One iteration of `Runtime.start`'s loop, minus rendering.
+    from .api import Runtime
+    run_timers          = Runtime.run_timers
+    run_frame_callbacks = Runtime.run_frame_callbacks
+    run_task_callbacks  = Runtime.run_task_callbacks
+    clock               = time.perf_counter
+    def op():
+        clock()
+        run_timers()
+        run_frame_callbacks(0)
+        run_task_callbacks()
+        clock()
+    return op
+
+
+@benchmark('runtime.render_frame', viewport=True)
+def _():
+    return dpg.render_dearpygui_frame
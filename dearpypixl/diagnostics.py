@@ -0,0 +1,1014 @@
+"""Profiling and debugging utilities for Dear PyPixl and Dear PyGui
+applications."""
+import os
+import sys
+import json
+import time
+import types
+import weakref
+import itertools
+import threading
+import collections
+import tracemalloc
+from dearpygui import _dearpygui
+from . import api
+from ._typing import (
+    Any,
+    Item,
+    Literal,
+    Callable,
+    TypedDict,
+    NotRequired,
+    Self,
+    IO,
+)
+
+
+
+
+
+
+
+
+# [ CALLBACK HOOKS ]
+
+# `api._callback_hook` only holds one function; diagnostic tools that
+# wrap callbacks are chained in the order they were started.
+_callback_hooks: list[Callable[[Callable], Callable]] = []
+_callback_hooks_lock = threading.Lock()
+
+
+def _chain_callback_hooks(callback: Callable) -> Callable:
+    for hook in tuple(_callback_hooks):
+        callback = hook(callback)
+    return callback
+
+
+def _add_callback_hook(hook: Callable[[Callable], Callable]):
+    with _callback_hooks_lock:
+        if hook not in _callback_hooks:
+            _callback_hooks.append(hook)
+        api._callback_hook = _chain_callback_hooks
+
+
+def _remove_callback_hook(hook: Callable[[Callable], Callable]):
+    with _callback_hooks_lock:
+        if hook in _callback_hooks:
+            _callback_hooks.remove(hook)
+        if not _callback_hooks:
+            api._callback_hook = None
+
+
+
+
+# [ CALLBACK PROFILER ]
+
+class CallbackProfileDict(TypedDict):
+    name      : str
+    calls     : int
+    sampled   : int
+    total_time: float
+    avg_time  : float
+    max_time  : float
+
+
+def _callback_name(callback: Callable) -> str:
+    # unwrap `events.Callback`, `functools.wraps`, etc.
+    seen = set()
+    while hasattr(callback, '__wrapped__') and id(callback) not in seen:
+        seen.add(id(callback))
+        wrapped = callback.__wrapped__  # type: ignore
+        if wrapped is None:
+            break
+        callback = wrapped
+    name = getattr(callback, '__qualname__', None)
+    if name is None:
+        return repr(callback)
+    module = getattr(callback, '__module__', None)
+    return f'{module}.{name}' if module else name
+
+
+def _callback_caller(callback: Callable) -> Callable[[Any, Any, Any], Any]:
+    # Diagnostic wrappers always accept three arguments, and forward only
+    # the ones the wrapped callback accepts. `_callback_arity` reports 3
+    # for variadic (`*args`) callbacks, so they receive all three.
+    arity = api._callback_arity(callback)
+    if arity >= 3:
+        return callback
+    elif arity == 2:
+        return lambda s, a, u: callback(s, a)
+    elif arity == 1:
+        return lambda s, a, u: callback(s)
+    return lambda s, a, u: callback()
+
+
+class CallbackProfiler:
+    """Records call counts and latency of callbacks registered through
+    Dear PyPixl while active.
+
+    While the profiler is running, callbacks registered via an item's
+    `callback` configuration option (including the `.callback` property
+    and item constructors), `events.HandlerRegistry`/`ItemHandlerRegistry`
+    handler methods, and `events.Callback` objects (including the contents
+    of `events.CallStack` objects) are wrapped before being registered.
+    Callbacks registered beforehand, or through Dear PyGui's API, are not
+    profiled. The wrappers remain after the profiler is stopped, but
+    stop recording.
+        >>> profiler = CallbackProfiler()
+        >>> with profiler:
+        ...     build_ui()
+        >>> Runtime.start()
+        >>> for row in profiler.report(limit=10):
+        ...     print(row)
+
+    Every call is counted, but only one in *sample_every* calls is
+    timed. Results are aggregated per callback and per sender item type
+    (see `.report`). Durations are in fractional milliseconds.
+
+    The profiler does not keep callbacks alive. When a profiled callback
+    is garbage-collected (i.e. its item was deleted), its metrics are
+    merged with those of other collected callbacks of the same name.
+
+    Multiple profilers can be active at once.
+    """
+    __slots__ = (
+        'sample_every',
+        '_active',
+        '_lock',
+        '_by_callback',
+        '_names',
+        '_retired',
+        '_by_type',
+        '_sender_types',
+        '__weakref__',
+    )
+
+    def __init__(self, sample_every: int = 1):
+        """Args:
+            * sample_every: Time one of every *sample_every* calls to
+            each callback. Higher values reduce overhead.
+        """
+        self.sample_every = max(1, int(sample_every))
+        self._active      = False
+        self._lock        = threading.Lock()
+        # [calls, sampled, total, max]; keyed by `id(callback)`
+        self._by_callback: dict[int, list] = {}
+        self._names      : dict[int, str]  = {}
+        # collected callbacks, keyed by name
+        self._retired    : dict[str, list] = {}
+        self._by_type    : dict[str, list] = {}
+        self._sender_types: dict[Any, str] = {}
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Return True if the profiler is running."""
+        return self._active
+
+    def start(self) -> None:
+        """Start wrapping newly-registered callbacks."""
+        self._active = True
+        _add_callback_hook(self.wrap)
+
+    def stop(self) -> None:
+        """Stop wrapping newly-registered callbacks and stop recording
+        calls to wrapped callbacks."""
+        self._active = False
+        _remove_callback_hook(self.wrap)
+
+    def clear(self) -> None:
+        """Reset all recorded metrics."""
+        with self._lock:
+            for stats in self._by_callback.values():
+                stats[:] = (0, 0, 0.0, 0.0)
+            self._retired.clear()
+            self._by_type.clear()
+            self._sender_types.clear()
+
+    @staticmethod
+    def _retire(profiler_ref: 'weakref.ref[CallbackProfiler]', key: int):
+        # Called when a profiled callback is garbage-collected.
+        self = profiler_ref()
+        if self is None:
+            return
+        with self._lock:
+            stats = self._by_callback.pop(key, None)
+            name  = self._names.pop(key, '')
+            if not stats or not stats[0]:
+                return
+            try:
+                retired = self._retired[name]
+            except KeyError:
+                self._retired[name] = stats
+            else:
+                retired[0] += stats[0]
+                retired[1] += stats[1]
+                retired[2] += stats[2]
+                if stats[3] > retired[3]:
+                    retired[3] = stats[3]
+
+    def _sender_type(self, sender: Item) -> str:
+        try:
+            return self._sender_types[sender]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable override
+            return 'unknown'
+        try:
+            tp = _dearpygui.get_item_info(sender)['type'].removeprefix('mvAppItemType::')
+        except Exception:
+            tp = 'unknown'
+        with self._lock:
+            self._sender_types[sender] = tp
+        return tp
+
+    def _record(self, stats: list, sender: Item, dt: float):
+        tp = self._sender_type(sender)
+        with self._lock:
+            stats[1] += 1
+            stats[2] += dt
+            if dt > stats[3]:
+                stats[3] = dt
+            try:
+                tp_stats = self._by_type[tp]
+            except KeyError:
+                tp_stats = self._by_type[tp] = [0, 0, 0.0, 0.0]
+            tp_stats[0] += 1
+            tp_stats[1] += 1
+            tp_stats[2] += dt
+            if dt > tp_stats[3]:
+                tp_stats[3] = dt
+
+    def wrap(self, callback: Callable) -> Callable:
+        """Return a profiled wrapper for a callback. The wrapper can be
+        called by Dear PyGui, and forwards only the arguments *callback*
+        accepts.
+        """
+        if getattr(callback, '__profiler__', None) is self:
+            return callback
+        key  = id(callback)
+        name = _callback_name(callback)
+
+        call        = _callback_caller(callback)
+        profiler    = self
+        lock        = self._lock
+        by_callback = self._by_callback
+        names       = self._names
+        record      = self._record
+        counter     = itertools.count(1)
+        clock       = time.perf_counter
+
+        def profiled(sender=None, app_data=None, user_data=None):
+            if not profiler._active:
+                return call(sender, app_data, user_data)
+            # looked up per call; entries are removed when retired
+            with lock:
+                try:
+                    stats = by_callback[key]
+                except KeyError:
+                    stats = by_callback[key] = [0, 0, 0.0, 0.0]
+                    names[key] = name
+                stats[0] += 1
+            if next(counter) % profiler.sample_every:
+                return call(sender, app_data, user_data)
+            ts = clock()
+            try:
+                return call(sender, app_data, user_data)
+            finally:
+                record(stats, sender, 1000.0 * (clock() - ts))
+
+        profiled.__wrapped__  = callback  # type: ignore
+        profiled.__profiler__ = self      # type: ignore
+        profiled.__name__     = getattr(callback, '__name__', profiled.__name__)
+        profiled.__qualname__ = getattr(callback, '__qualname__', profiled.__qualname__)
+
+        # The wrapper keeps *callback* alive, so its id is unique until
+        # both are collected. Callbacks that can't be weak-referenced
+        # (i.e. `events.Callback`) are retired with their wrapper.
+        try:
+            weakref.finalize(callback, self._retire, weakref.ref(self), key)
+        except TypeError:
+            weakref.finalize(profiled, self._retire, weakref.ref(self), key)
+        return profiled
+
+    def report(
+        self,
+        *,
+        by   : Literal['callback', 'type'] = 'callback',
+        sort : Literal['total_time', 'avg_time', 'max_time', 'calls'] = 'total_time',
+        limit: int | None = None,
+    ) -> list[CallbackProfileDict]:
+        """Return recorded metrics, sorted in descending order.
+
+        Args:
+            * by: Aggregate metrics per "callback", or per sender item
+            "type".
+
+            * sort: The metric to sort by.
+
+            * limit: The maximum number of rows to return.
+
+
+        *total_time* is the sum of timed (sampled) calls only. Multiply
+        *avg_time* by *calls* to estimate the actual total. Sender types
+        are only resolved for sampled calls, so *calls* and *sampled* are
+        equal when aggregating by type.
+        """
+        with self._lock:
+            if by == 'callback':
+                names = self._names
+                rows  = [(names[k], *v) for k, v in self._by_callback.items() if v[0]]
+                rows.extend((k, *v) for k, v in self._retired.items() if v[0])
+            elif by == 'type':
+                rows = [(k, *v) for k, v in self._by_type.items()]
+            else:
+                raise ValueError(f"expected 'callback' or 'type' for `by`, got {by!r}.")
+        report = [
+            CallbackProfileDict(
+                name=name,
+                calls=calls,
+                sampled=sampled,
+                total_time=total,
+                avg_time=total / sampled if sampled else 0.0,
+                max_time=max_dt,
+            )
+            for name, calls, sampled, total, max_dt in rows
+        ]
+        report.sort(key=lambda r: r[sort], reverse=True)
+        return report[:limit]
+
+
+
+
+# [ TRACING ]
+
+class TraceEventDict(TypedDict):
+    name: str
+    cat : NotRequired[str]
+    ph  : str
+    ts  : NotRequired[float]
+    dur : NotRequired[float]
+    pid : int
+    tid : int
+    args: NotRequired[dict[str, Any]]
+
+
+_TRACED_PREFIXES = ('add_', 'draw_', 'get_item_', 'set_item_', 'bind_item_')
+_TRACED_NAMES = frozenset((
+    'configure_item',
+    'delete_item',
+    'does_item_exist',
+    'move_item',
+    'set_value',
+    'get_value',
+    'get_values',
+    'render_dearpygui_frame',
+))
+
+
+def _traced_dpg_functions() -> dict[int, tuple[str, Callable]]:
+    return {
+        id(fn): (name, fn)
+        for name, fn in vars(_dearpygui).items()
+        if (name in _TRACED_NAMES or name.startswith(_TRACED_PREFIXES))
+        and type(fn) is types.BuiltinFunctionType
+    }
+
+
+class Tracer:
+    """Records the duration of Dear PyGui calls, callbacks and runtime
+    tasks, and exports them in Chrome's trace event format. Saved traces
+    can be opened in `chrome://tracing`, Perfetto, etc.
+
+    When started, references to Dear PyGui functions that create
+    (`add_*`, `draw_*`), configure, query (`get_item_*`, `get_value`),
+    update (`set_value`), or delete items are replaced with tracing
+    wrappers throughout Dear PyPixl and in Dear PyGui's `_dearpygui`
+    module (which `dearpygui.dearpygui` calls into). The originals are
+    restored when stopped, so tracing costs nothing while disabled.
+    In addition, the following are traced while active;
+        - callbacks registered through Dear PyPixl (see `CallbackProfiler`)
+
+        - tasks sent to `Runtime.submit` and `Runtime.queue`
+
+        - rendering, when the tracer is started before `Runtime.start`
+
+    Events are appended to a bounded buffer owned by the recording
+    thread, so threads never contend while tracing. Timestamps are in
+    microseconds.
+        >>> with Tracer() as tracer:
+        ...     Runtime.start()
+        >>> tracer.save("trace.json")
+
+    Only one tracer can be active at a time.
+    """
+    __slots__ = (
+        'max_events',
+        '_active',
+        '_local',
+        '_buffers',
+        '_lock',
+        '_patches',
+    )
+
+    _current: 'Tracer | None' = None
+
+    def __init__(self, max_events: int = 1_000_000):
+        """Args:
+            * max_events: The maximum number of events kept per thread.
+            Older events are discarded first.
+        """
+        self.max_events = max_events
+        self._active    = False
+        self._local     = threading.local()
+        self._buffers: list[tuple[int, str, collections.deque]] = []
+        self._lock      = threading.Lock()
+        self._patches: list[tuple[Callable[[Any], None], Any]] = []
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Return True if the tracer is running."""
+        return self._active
+
+    def _buffer(self) -> collections.deque:
+        try:
+            return self._local.buffer
+        except AttributeError:
+            pass
+        buffer = self._local.buffer = collections.deque(maxlen=self.max_events)
+        thread = threading.current_thread()
+        with self._lock:
+            self._buffers.append((threading.get_ident(), thread.name, buffer))
+        return buffer
+
+    def _emit(self, name: str, cat: str, ts: float, te: float):
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._buffer()
+        buffer.append((name, cat, ts, te - ts))
+
+    def _traced(self, fn: Callable, name: str, cat: str) -> Callable:
+        emit  = self._emit
+        clock = _trace_clock
+
+        def traced(*args, **kwargs):
+            ts = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                emit(name, cat, ts, clock())
+
+        traced.__wrapped__  = fn    # type: ignore
+        traced.__name__     = getattr(fn, '__name__', name)
+        traced.__qualname__ = getattr(fn, '__qualname__', name)
+        traced.__doc__      = getattr(fn, '__doc__', None)
+        return traced
+
+    def wrap(self, callback: Callable) -> Callable:
+        """Return a traced wrapper for a callback. The wrapper can be
+        called by Dear PyGui, and forwards only the arguments *callback*
+        accepts.
+        """
+        call   = _callback_caller(callback)
+        tracer = self
+        name   = _callback_name(callback)
+        emit   = self._emit
+        clock  = _trace_clock
+
+        def traced(sender=None, app_data=None, user_data=None):
+            if not tracer._active:
+                return call(sender, app_data, user_data)
+            ts = clock()
+            try:
+                return call(sender, app_data, user_data)
+            finally:
+                emit(name, 'callback', ts, clock())
+
+        traced.__wrapped__  = callback  # type: ignore
+        traced.__name__     = getattr(callback, '__name__', traced.__name__)
+        traced.__qualname__ = getattr(callback, '__qualname__', traced.__qualname__)
+        return traced
+
+    # [ PATCHING ]
+
+    def _patch(self, restore: Callable[[Any], None], original: Any, patched: Any):
+        restore(patched)
+        self._patches.append((restore, original))
+
+    def _patch_function(self, fn: types.FunctionType, targets: dict[int, Callable]):
+        # closure cells and default values
+        for cell in fn.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:  # empty
+                continue
+            if id(value) in targets:
+                self._patch(
+                    lambda v, c=cell: setattr(c, 'cell_contents', v),
+                    value,
+                    targets[id(value)],
+                )
+        if fn.__defaults__ and any(id(v) in targets for v in fn.__defaults__):
+            self._patch(
+                lambda v, f=fn: setattr(f, '__defaults__', v),
+                fn.__defaults__,
+                tuple(targets.get(id(v), v) for v in fn.__defaults__),
+            )
+        if fn.__kwdefaults__ and any(id(v) in targets for v in fn.__kwdefaults__.values()):
+            self._patch(
+                lambda v, f=fn: setattr(f, '__kwdefaults__', v),
+                fn.__kwdefaults__,
+                {k: targets.get(id(v), v) for k, v in fn.__kwdefaults__.items()},
+            )
+
+    def _patch_namespace(self, obj: Any, targets: dict[int, Callable], seen: set[int]):
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        is_module = isinstance(obj, types.ModuleType)
+        for name, value in tuple(vars(obj).items()):
+            if id(value) in targets:
+                if is_module:
+                    restore = lambda v, d=vars(obj), k=name: d.__setitem__(k, v)
+                else:
+                    restore = lambda v, o=obj, k=name: setattr(o, k, v)
+                self._patch(restore, value, targets[id(value)])
+                continue
+            if isinstance(value, (staticmethod, classmethod)):
+                func = value.__func__
+                if id(func) in targets:
+                    self._patch(
+                        lambda v, o=obj, k=name, tp=type(value): setattr(o, k, tp(v)),
+                        func,
+                        targets[id(func)],
+                    )
+                    continue
+                value = func
+            if isinstance(value, types.FunctionType):
+                if value.__module__ and value.__module__.startswith(__package__):
+                    self._patch_function(value, targets)
+            elif isinstance(value, type) and value.__module__.startswith(__package__):
+                self._patch_namespace(value, targets, seen)
+
+    def start(self) -> None:
+        """Start recording events. Raises `RuntimeError` if another tracer
+        is active."""
+        if Tracer._current is not None:
+            if Tracer._current is self:
+                return
+            raise RuntimeError('another tracer is active.')
+        Tracer._current = self
+        self._active    = True
+
+        targets = {
+            k: self._traced(fn, name, 'dearpygui')
+            for k, (name, fn) in _traced_dpg_functions().items()
+        }
+        self._patch_namespace(_dearpygui, targets, set())
+        seen = set()
+        for name, module in tuple(sys.modules.items()):
+            if name == __package__ or name.startswith(f'{__package__}.'):
+                self._patch_namespace(module, targets, seen)
+
+        # runtime tasks
+        self._patch(
+            lambda v: setattr(api, '_run_task', v),
+            api._run_task,
+            self._traced_task_runner(api._run_task),
+        )
+        queue = api.Runtime.queue
+        self._patch(
+            lambda v: setattr(queue, 'put', v) if v is not None else vars(queue).pop('put', None),
+            vars(queue).get('put'),
+            self._traced_queue_put(queue.put),
+        )
+
+        _add_callback_hook(self.wrap)
+
+    def stop(self) -> None:
+        """Stop recording events and restore all patched references."""
+        if Tracer._current is not self:
+            return
+        _remove_callback_hook(self.wrap)
+        while self._patches:
+            restore, original = self._patches.pop()
+            restore(original)
+        self._active    = False
+        Tracer._current = None
+
+    def _traced_task_runner(self, run_task: Callable) -> Callable:
+        emit  = self._emit
+        clock = _trace_clock
+
+        def _run_task(locker, fn, args, kwargs, ts_submit):
+            ts = clock()
+            try:
+                return run_task(locker, fn, args, kwargs, ts_submit)
+            finally:
+                emit(_callback_name(fn), 'task', ts, clock())
+
+        return _run_task
+
+    def _traced_queue_put(self, put: Callable) -> Callable:
+        # NOTE: The runtime's own per-tick task is queued via `Queue.put`
+        # and never passes through here.
+        emit  = self._emit
+        clock = _trace_clock
+
+        def traced_put(item, block=True, timeout=None):
+            name = _callback_name(item)
+
+            def task():
+                ts = clock()
+                try:
+                    return item()
+                finally:
+                    emit(name, 'task', ts, clock())
+
+            put(task, block, timeout)
+
+        return traced_put
+
+    # [ OUTPUT ]
+
+    def clear(self) -> None:
+        """Discard all recorded events."""
+        with self._lock:
+            for _, _, buffer in self._buffers:
+                buffer.clear()
+
+    def events(self) -> list[TraceEventDict]:
+        """Return recorded events as a list of Chrome trace event
+        dictionaries, including thread name metadata."""
+        pid = os.getpid()
+        with self._lock:
+            buffers = [(tid, name, tuple(buffer)) for tid, name, buffer in self._buffers]
+        events: list[Any] = []
+        for tid, thread_name, buffer in buffers:
+            events.append({
+                'name': 'thread_name',
+                'ph'  : 'M',
+                'pid' : pid,
+                'tid' : tid,
+                'args': {'name': thread_name},
+            })
+            events.extend(
+                {
+                    'name': name,
+                    'cat' : cat,
+                    'ph'  : 'X',
+                    'ts'  : ts,
+                    'dur' : dur,
+                    'pid' : pid,
+                    'tid' : tid,
+                }
+                for name, cat, ts, dur in buffer
+            )
+        return events
+
+    def save(self, file: str | os.PathLike | IO[str]) -> None:
+        """Write recorded events to a file in Chrome's JSON trace event
+        format.
+
+        Args:
+            * file: A path or writable text file object.
+        """
+        trace = {'traceEvents': self.events(), 'displayTimeUnit': 'ms'}
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'w', encoding='utf-8') as f:
+                json.dump(trace, f)
+        else:
+            json.dump(trace, file)
+
+
+def _trace_clock(_counter=time.perf_counter) -> float:
+    return _counter() * 1_000_000.0
+
+
+
+
+# [ ITEM ACCOUNTING ]
+
+class ItemSnapshotDict(TypedDict):
+    time              : float
+    items             : int
+    types             : dict[str, int]
+    aliases           : int
+    stale_aliases     : list[str]
+    unbound_registries: list[int]
+    unbound_themes    : list[int]
+
+
+ItemDeltaDict = ItemSnapshotDict
+
+
+def item_snapshot() -> ItemSnapshotDict:
+    """Return an accounting of items that currently exist.
+
+    The returned dictionary contains the following;
+        * time: The value of `time.perf_counter` when the snapshot was
+        taken.
+
+        * items: The number of items that exist.
+
+        * types: The number of items that exist per item type
+        (i.e. "mvButton").
+
+        * aliases: The number of registered aliases.
+
+        * stale_aliases: Aliases whose item no longer exists. These are
+        left behind when `Application.manual_alias_management` is enabled
+        and items are deleted without removing their alias.
+
+        * unbound_registries: Item handler registries not bound to any
+        item.
+
+        * unbound_themes: Themes not bound to any item, or to the
+        application.
+
+
+    Orphaned registries and themes are not necessarily leaks since they
+    may be bound later, but a count that grows over time usually means
+    they are being re-created instead of reused. Use `item_delta` to
+    compare two snapshots.
+    """
+    get_item_info = _dearpygui.get_item_info
+    types_: dict[str, int] = {}
+    bound = set()
+    registries = []
+    themes = []
+    items = _dearpygui.get_all_items()
+    for item in items:
+        info = get_item_info(item)
+        tp   = info['type'].removeprefix('mvAppItemType::')
+        types_[tp] = types_.get(tp, 0) + 1
+        if tp == 'mvItemHandlerRegistry':
+            registries.append(item)
+        elif tp == 'mvTheme':
+            themes.append(item)
+        if info['handlers'] is not None:
+            bound.add(info['handlers'])
+        if info['theme'] is not None:
+            bound.add(info['theme'])
+    app_theme = api.Application.get_theme()
+    if app_theme is not None:
+        bound.add(app_theme)
+    # bound items may be referenced by alias
+    bound.update([_dearpygui.get_alias_id(i) for i in bound if isinstance(i, str)])
+
+    aliases = _dearpygui.get_aliases()
+    stale   = [
+        alias for alias in aliases
+        if not _dearpygui.does_item_exist(_dearpygui.get_alias_id(alias))
+    ]
+    return ItemSnapshotDict(
+        time=time.perf_counter(),
+        items=len(items),
+        types=types_,
+        aliases=len(aliases),
+        stale_aliases=stale,
+        unbound_registries=[i for i in registries if i not in bound],
+        unbound_themes=[i for i in themes if i not in bound],
+    )
+
+
+def item_delta(before: ItemSnapshotDict, after: ItemSnapshotDict | None = None) -> ItemDeltaDict:
+    """Return the difference between two snapshots returned from
+    `item_snapshot`.
+
+    Args:
+        * before: The older snapshot.
+
+        * after: The newer snapshot. If not included, a new snapshot
+        is taken.
+
+
+    Counts are the difference between *after* and *before*, and item
+    types whose count did not change are excluded. Lists only include
+    entries found in *after* but not in *before*.
+    """
+    if after is None:
+        after = item_snapshot()
+    b_types = before['types']
+    a_types = after['types']
+    types_  = {
+        tp: a_types.get(tp, 0) - b_types.get(tp, 0)
+        for tp in a_types.keys() | b_types.keys()
+    }
+    return ItemDeltaDict(
+        time=after['time'] - before['time'],
+        items=after['items'] - before['items'],
+        types={tp: d for tp, d in sorted(types_.items()) if d},
+        aliases=after['aliases'] - before['aliases'],
+        **{  # type: ignore
+            k: [v for v in after[k] if v not in b_set]
+            for k in ('stale_aliases', 'unbound_registries', 'unbound_themes')
+            for b_set in (set(before[k]),)
+        },
+    )
+
+
+
+
+# [ ALLOCATION TRACKING ]
+
+class CallbackAllocationDict(TypedDict):
+    name    : str
+    calls   : int
+    retained: int
+    peak    : int
+
+
+class CallbackAllocationTracker:
+    """Uses `tracemalloc` to attribute Python memory allocations to
+    callbacks registered through Dear PyPixl while active (see
+    `CallbackProfiler` for which callbacks are included).
+
+    For every callback, the tracker records the net number of bytes
+    still allocated when the callback returns (*retained*), and the
+    largest temporary allocation made during any single call (*peak*).
+    A callback whose *retained* total grows with every call is likely
+    holding references to its arguments (i.e. `app_data`), or caching
+    objects without bounds.
+        >>> tracker = CallbackAllocationTracker()
+        >>> with tracker:
+        ...     build_ui()
+        ...     Runtime.start()
+        >>> for row in tracker.report(limit=10):
+        ...     print(row)
+
+    `tracemalloc` is started with the tracker if it is not already
+    tracing, and is stopped with it. Tracing allocations significantly
+    slows down Python code, so this is not meant to be used routinely.
+    Allocations are measured process-wide; allocations made by other
+    threads while a callback runs are attributed to it.
+
+    Like `CallbackProfiler`, the tracker does not keep callbacks alive.
+    Metrics of collected callbacks are merged by name.
+    """
+    __slots__ = (
+        '_active',
+        '_started_tracemalloc',
+        '_lock',
+        '_stats',
+        '_retired',
+        '__weakref__',
+    )
+
+    def __init__(self):
+        self._active = False
+        self._started_tracemalloc = False
+        self._lock = threading.Lock()
+        # (name, [calls, retained, peak]); keyed by `id(callback)`
+        self._stats: dict[int, tuple[str, list]] = {}
+        # collected callbacks, keyed by name
+        self._retired: dict[str, list] = {}
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Return True if the tracker is running."""
+        return self._active
+
+    def start(self) -> None:
+        """Start tracing allocations and wrapping newly-registered
+        callbacks."""
+        if self._active:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._active = True
+        _add_callback_hook(self.wrap)
+
+    def stop(self) -> None:
+        """Stop tracing allocations and wrapping newly-registered
+        callbacks."""
+        if not self._active:
+            return
+        self._active = False
+        _remove_callback_hook(self.wrap)
+        if self._started_tracemalloc:
+            self._started_tracemalloc = False
+            tracemalloc.stop()
+
+    def clear(self) -> None:
+        """Reset all recorded metrics."""
+        with self._lock:
+            for _, stats in self._stats.values():
+                stats[:] = (0, 0, 0)
+            self._retired.clear()
+
+    @staticmethod
+    def _retire(tracker_ref: 'weakref.ref[CallbackAllocationTracker]', key: int):
+        # Called when a tracked callback is garbage-collected.
+        self = tracker_ref()
+        if self is None:
+            return
+        with self._lock:
+            name, stats = self._stats.pop(key, ('', None))
+            if not stats or not stats[0]:
+                return
+            try:
+                retired = self._retired[name]
+            except KeyError:
+                self._retired[name] = stats
+            else:
+                retired[0] += stats[0]
+                retired[1] += stats[1]
+                if stats[2] > retired[2]:
+                    retired[2] = stats[2]
+
+    def wrap(self, callback: Callable) -> Callable:
+        """Return a wrapper for a callback that records its allocations.
+        The wrapper can be called by Dear PyGui, and forwards only the
+        arguments *callback* accepts.
+        """
+        key  = id(callback)
+        name = _callback_name(callback)
+
+        call    = _callback_caller(callback)
+        tracker = self
+        lock    = self._lock
+        entries = self._stats
+        traced_memory = tracemalloc.get_traced_memory
+        reset_peak    = tracemalloc.reset_peak
+
+        def tracked(sender=None, app_data=None, user_data=None):
+            if not tracker._active:
+                return call(sender, app_data, user_data)
+            reset_peak()
+            current, _ = traced_memory()
+            try:
+                return call(sender, app_data, user_data)
+            finally:
+                after, peak = traced_memory()
+                # looked up per call; entries are removed when retired
+                with lock:
+                    try:
+                        stats = entries[key][1]
+                    except KeyError:
+                        stats = [0, 0, 0]
+                        entries[key] = (name, stats)
+                    stats[0] += 1
+                    stats[1] += after - current
+                    if peak - current > stats[2]:
+                        stats[2] = peak - current
+
+        tracked.__wrapped__  = callback  # type: ignore
+        tracked.__name__     = getattr(callback, '__name__', tracked.__name__)
+        tracked.__qualname__ = getattr(callback, '__qualname__', tracked.__qualname__)
+
+        # see `CallbackProfiler.wrap`
+        try:
+            weakref.finalize(callback, self._retire, weakref.ref(self), key)
+        except TypeError:
+            weakref.finalize(tracked, self._retire, weakref.ref(self), key)
+        return tracked
+
+    def report(
+        self,
+        *,
+        sort : Literal['retained', 'peak', 'calls'] = 'retained',
+        limit: int | None = None,
+    ) -> list[CallbackAllocationDict]:
+        """Return recorded metrics, sorted in descending order. Sizes are
+        in bytes.
+
+        Args:
+            * sort: The metric to sort by.
+
+            * limit: The maximum number of rows to return.
+        """
+        with self._lock:
+            report = [
+                CallbackAllocationDict(
+                    name=name, calls=calls, retained=retained, peak=peak,
+                )
+                for name, (calls, retained, peak) in (
+                    *self._stats.values(), *self._retired.items()
+                )
+                if calls
+            ]
+        report.sort(key=lambda r: r[sort], reverse=True)
+        return report[:limit]
@@ -1,7 +1,12 @@
 """Callback and event-related utilities for Dear PyPixl
 and Dear PyGui."""
+import os
 import time
 import enum
+import types
+import json
+import array
+import struct
 import inspect
 import functools
 import threading
@@ -20,7 +25,7 @@ from . import (
 # even if these do leak, they're not the primary concern.
 # Containters though...we decref those. We decref those to
 # *heck*.
-from ._tools import Py_DECREF
+from ._tools import Py_DECREF, Py_INCREF
 from ._typing import (
     Any,
     Item,
@@ -29,8 +34,10 @@ from ._typing import (
     ItemConfig,
     Property,
     Iterable,
+    Iterator,
     Collection,
     Sequence,
+    Literal,
     Callable,
     MethodType,
     SupportsIndex,
@@ -41,6 +48,7 @@ from ._typing import (
     overload,
     override,
     cast,
+    IO,
 )
 from . import items
 
@@ -113,7 +121,10 @@ def handler_hook(handler_fn: Any, protocol: Callable[_P, _T] = _handler) -> Call
         def mthd_add_handler(self, callback = None, *args, parent: Item = 0, **kwargs):
             def add_handler(callback):
                 handler_fn(
-                    callback=callback,
+                    callback=(
+                        callback if api._callback_hook is None or callback is None
+                        else api._callback_hook(callback)
+                    ),
                     parent=parent or self,
                     **kwargs
                 )
@@ -318,6 +329,8 @@ class ItemHandlerRegistry(items.mvItemHandlerRegistry):
         """Schedules a callback to run when an item bound to this
         registry is not disabled.
 
+        To only run callbacks when this changes, see `StateWatcher`.
+
         Command: `dearpygui.add_item_active_handler`
         """
 
@@ -326,6 +339,8 @@ class ItemHandlerRegistry(items.mvItemHandlerRegistry):
         """Schedules a callback to run when an item bound to
         this registry is visible.
 
+        To only run callbacks when this changes, see `StateWatcher`.
+
         Command: `dearpygui.add_item_visible_handler`
         """
 
@@ -334,6 +349,8 @@ class ItemHandlerRegistry(items.mvItemHandlerRegistry):
         """Schedules a callback to run when an item bound to
         this registry is focused.
 
+        To only run callbacks when this changes, see `StateWatcher`.
+
         Command: `dearpygui.add_item_focus_handler`
         """
 
@@ -342,18 +359,481 @@ class ItemHandlerRegistry(items.mvItemHandlerRegistry):
         """Schedules a callback to run when an item bound to
         this registry is hovered.
 
+        To only run callbacks when this changes, see `StateWatcher`.
+
         Command: `dearpygui.add_item_hover_handler`
         """
 
 
 
 
+# item handler name (see `ItemHandlerRegistry`) -> DPG command
+_ITEM_HANDLERS = {
+    'on_resize'                 : dearpygui.add_item_resize_handler,
+    'on_click'                  : dearpygui.add_item_clicked_handler,
+    'on_toggle_open'            : dearpygui.add_item_toggled_open_handler,
+    'on_edit'                   : dearpygui.add_item_edited_handler,
+    'on_deactivation_after_edit': dearpygui.add_item_deactivated_after_edit_handler,
+    'on_activation'             : dearpygui.add_item_activated_handler,
+    'on_deactivation'           : dearpygui.add_item_deactivated_handler,
+    'while_enabled'             : dearpygui.add_item_active_handler,
+    'while_visible'             : dearpygui.add_item_visible_handler,
+    'while_focused'             : dearpygui.add_item_focus_handler,
+    'while_hovered'             : dearpygui.add_item_hover_handler,
+}
+# handlers that send `[button, item]` as `app_data`
+_ITEM_BUTTON_HANDLERS = frozenset(('on_click',))
+
+
+class ItemHandlerMux:
+    """Shares item handler registries between items.
+
+    Binding handlers to many items (i.e. the rows of a list) usually
+    means creating a registry and a set of handlers for each of them.
+    Instead, the multiplexer binds every item to a shared registry
+    containing one handler for each kind of handler the item uses. All
+    items using the same kinds of handlers share a registry, so the
+    number of registries and handler items depends on the number of
+    handler kinds used, not on the number of items. When a shared
+    handler runs, the multiplexer calls the callbacks bound to the
+    item that triggered it.
+        >>> mux = item_handler_mux()
+        >>> for row in rows:
+        ...     mux.bind(row, 'while_hovered', on_row_hovered)
+        ...     mux.bind(row, 'on_click', on_row_clicked, button=MouseInput.RIGHT)
+
+    Handler kinds are named after `ItemHandlerRegistry` methods. Callbacks
+    are sent the item as `sender`, the `app_data` Dear PyGui sends the
+    handler (`[button, item]` for click handlers, otherwise the item),
+    and the *user_data* they were bound with.
+
+    Binding a handler replaces any handler registry bound to the item.
+    Callbacks bound to items that are deleted are discarded when the
+    multiplexer finds them while binding, or by `.prune()`. A shared
+    registry is deleted once no item is bound to it.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # item -> {handler kind: ((callback, button, user_data), ...)}
+        self._bindings: dict[Item, dict[str, tuple[tuple[Callable, int, Any], ...]]] = {}
+        self._registries: dict[frozenset[str], Item] = {}
+        # item -> signature of the registry bound to it, and the number
+        # of items bound to each registry
+        self._signatures: dict[Item, frozenset[str]] = {}
+        self._users: dict[frozenset[str], int] = {}
+        # number of bound items after the last prune
+        self._pruned_at = 0
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._bindings)
+
+    def __contains__(self, item: Item) -> bool:
+        if isinstance(item, str):
+            item = dearpygui.get_alias_id(item)
+        return item in self._bindings
+
+    def registries(self) -> dict[frozenset[str], Item]:
+        """Return the shared registries by the handler kinds they contain."""
+        with self.lock:
+            return self._registries.copy()
+
+    @overload
+    def bind(self, item: Item, handler: str, callback: Callable, /, *, button: int = -1, user_data: Any = None) -> Callable: ...
+    @overload
+    def bind(self, item: Item, handler: str, /, *, button: int = -1, user_data: Any = None) -> Callable[[Callable], Callable]: ...
+    def bind(self, item: Item, handler: str, callback: Callable | None = None, /, *, button: int = -1, user_data: Any = None) -> Any:
+        """Bind a handler callback to an item. Return the callback.
+
+        Args:
+            * item: The item to handle.
+
+            * handler: The kind of handler, named after an
+            `ItemHandlerRegistry` method (i.e. "on_click", "while_hovered").
+
+            * callback: The callback to run. If not included, this method
+            returns a decorator.
+
+            * button: For click handlers, the mouse button to filter for.
+            The default (-1) accepts all buttons.
+
+            * user_data: Sent to the callback as `user_data`.
+
+
+        Raises `ValueError` if *handler* is not a known handler kind, or
+        if *item* does not exist.
+        """
+        if handler not in _ITEM_HANDLERS:
+            raise ValueError(f'unknown item handler {handler!r}.')
+        if isinstance(item, str):
+            item = dearpygui.get_alias_id(item)
+        if not dearpygui.does_item_exist(item):
+            raise ValueError(f'item {item!r} does not exist.')
+
+        def bind_handler(callback: Callable):
+            with self.lock:
+                if item not in self._bindings and len(self._bindings) >= 2 * self._pruned_at + 64:
+                    # amortized; bound items are usually deleted in bulk
+                    self._prune()
+                kinds = self._bindings.setdefault(item, {})
+                kinds[handler] = kinds.get(handler, ()) + ((callback, button, user_data),)
+                if len(kinds[handler]) == 1:
+                    self._rebind(item, kinds)
+            return callback
+
+        if callback is None:
+            return bind_handler
+        return bind_handler(callback)
+
+    def unbind(self, item: Item, handler: str | None = None, callback: Callable | None = None) -> int:
+        """Remove handler callbacks bound to an item. Return the number
+        of callbacks removed.
+
+        Args:
+            * item: The item.
+
+            * handler: The kind of handler. If None, callbacks of all
+            kinds are removed.
+
+            * callback: The callback to remove. If None, all callbacks
+            of *handler* are removed.
+        """
+        if isinstance(item, str):
+            item = dearpygui.get_alias_id(item)
+        with self.lock:
+            try:
+                kinds = self._bindings[item]
+            except KeyError:
+                return 0
+            count = 0
+            for kind in (tuple(kinds) if handler is None else (handler,)):
+                entries = kinds.get(kind, ())
+                kept = tuple(e for e in entries if callback is not None and e[0] != callback)
+                count += len(entries) - len(kept)
+                if kept:
+                    kinds[kind] = kept
+                else:
+                    kinds.pop(kind, None)
+            if count:
+                if not kinds:
+                    del self._bindings[item]
+                self._rebind(item, kinds)
+            return count
+
+    def prune(self) -> int:
+        """Discard the callbacks of items that no longer exist. Return
+        the number of items discarded."""
+        with self.lock:
+            return self._prune()
+
+    def _prune(self) -> int:
+        # lock held by caller
+        deleted = [item for item in self._bindings if not dearpygui.does_item_exist(item)]
+        for item in deleted:
+            del self._bindings[item]
+            self._release(self._signatures.pop(item, None))
+        self._pruned_at = len(self._bindings)
+        return len(deleted)
+
+    def _release(self, signature: frozenset[str] | None):
+        # lock held by caller
+        if signature is None:
+            return
+        self._users[signature] -= 1
+        if self._users[signature]:
+            return
+        del self._users[signature]
+        registry = self._registries.pop(signature, None)
+        if registry is not None and dearpygui.does_item_exist(registry):
+            dearpygui.delete_item(registry)
+
+    def _rebind(self, item: Item, kinds: dict[str, Any]):
+        # lock held by caller
+        previous = self._signatures.pop(item, None)
+        if not dearpygui.does_item_exist(item):
+            self._bindings.pop(item, None)
+            self._release(previous)
+            self._prune()
+            return
+        if not kinds:
+            dearpygui.bind_item_handler_registry(item, 0)
+        else:
+            signature = frozenset(kinds)
+            registry  = self._registries.get(signature)
+            if registry is None or not dearpygui.does_item_exist(registry):
+                registry = dearpygui.add_item_handler_registry(label=f'[{type(self).__name__}]')
+                for kind in sorted(signature):
+                    _ITEM_HANDLERS[kind](callback=self._dispatcher(kind), parent=registry)
+                self._registries[signature] = registry
+            dearpygui.bind_item_handler_registry(item, registry)
+            self._signatures[item] = signature
+            self._users[signature] = self._users.get(signature, 0) + 1
+        # released after binding so the registry isn't recreated when
+        # the signature didn't change
+        self._release(previous)
+
+    def _dispatcher(self, kind: str) -> Callable[[Item, Any], None]:
+        bindings = self._bindings
+
+        if kind in _ITEM_BUTTON_HANDLERS:
+            def dispatch(sender: Item, app_data: Any):
+                button, item = app_data
+                try:
+                    entries = bindings[item][kind]
+                except KeyError:
+                    Py_DECREF(app_data)
+                    return
+                queue = [
+                    (callback, item, app_data, user_data)
+                    for callback, h_button, user_data in entries
+                    if h_button == -1 or h_button == button
+                ]
+                api.Runtime.run_callback_queue(queue)
+                Py_DECREF(app_data)
+        else:
+            def dispatch(sender: Item, item: Any):
+                try:
+                    entries = bindings[item][kind]
+                except KeyError:
+                    return
+                api.Runtime.run_callback_queue([
+                    (callback, item, item, user_data)
+                    for callback, _, user_data in entries
+                ])
+
+        return dispatch
+
+
+_item_handler_mux = ItemHandlerMux()
+
+def item_handler_mux() -> ItemHandlerMux:
+    """Return the process-wide `ItemHandlerMux`."""
+    return _item_handler_mux
+
+
+
+
+class StateWatcher:
+    """Dispatches callbacks when the states of items change.
+
+    Handlers such as `ItemHandlerRegistry.while_hovered` run their
+    callback every frame for every item bound to them, whether or not
+    anything changed. Instead, the watcher samples the states of its
+    items once per frame (using a frame callback, see
+    `Runtime.schedule_frame_callback`), compares them to those of
+    the previous frame, and only runs callbacks for the states that
+    changed -- i.e. when an item starts or stops being hovered, or
+    becomes visible:
+        >>> watcher = StateWatcher(rows, ('hovered',))
+        >>> @watcher.on('hovered')
+        ... def highlight(sender, hovered):
+        ...     ...
+
+    State keys are those of the mapping returned by
+    `dearpygui.get_item_state` (i.e. "hovered", "visible", "focused",
+    "active", "rect_size"). Callbacks are sent the item as `sender`, the
+    new value of the state as `app_data` (True on enter/False on leave
+    for boolean states), and the *user_data* they were registered with.
+    Items are first compared to a "blank" state, so states that are
+    True (or non-empty) when an item is first sampled are dispatched.
+
+    Sampling reads the state of each watched item once per frame, but
+    callbacks (the expensive part) only run for the changes. Items
+    that no longer exist are automatically removed.
+
+    Sampling runs in the main thread under `Runtime.start` and
+    `Runtime.step`. Under `dearpygui.start_dearpygui()` or a manual
+    loop that doesn't call `Runtime.run_frame_callbacks`, it runs as a
+    Dear PyGui frame callback, in the thread Dear PyGui runs callbacks
+    in.
+    """
+
+    def __init__(self, items: Iterable[Item] = (), states: Iterable[str] = ('hovered',), *, start: bool = True) -> None:
+        """Args:
+            * items: The items to watch.
+
+            * states: The state keys to watch on *items*, and on items
+            later passed to `.watch` without any.
+
+            * start: If True, start sampling immediately.
+        """
+        self.lock       = threading.Lock()
+        # item -> {state key: last value}
+        self._items     : dict[Item, dict[str, Any]] = {}
+        self._callbacks : dict[str, tuple[tuple[Callable, Any], ...]] = {}
+        self._handle    : api.ScheduledCallback | None = None
+        self._states    = tuple(states)
+        self.watch(items)
+        if start:
+            self.start()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self._items
+
+    @property
+    def active(self) -> bool:
+        """[get] Return True if the watcher is sampling item states."""
+        return self._handle is not None
+
+    def watch(self, items: Item | Iterable[Item], *states: str) -> None:
+        """Watch states of one or more items. Items already being watched
+        also watch *states*.
+
+        Args:
+            * items: An item or iterable of items.
+
+            * states: State keys to watch. If none are included, the
+            states the watcher was created with are watched.
+
+
+        Raises `ValueError` if there are no states to watch.
+        """
+        if isinstance(items, (int, str)):
+            items = (items,)
+        states = states or self._states
+        if not states:
+            items = tuple(items)
+            if items:
+                raise ValueError('no states to watch.')
+        with self.lock:
+            for item in items:
+                if isinstance(item, str):
+                    item = dearpygui.get_alias_id(item)
+                last = self._items.setdefault(item, {})
+                for state in states:
+                    last.setdefault(state, None)
+
+    def unwatch(self, items: Item | Iterable[Item], *states: str) -> None:
+        """Stop watching item states.
+
+        Args:
+            * items: An item or iterable of items.
+
+            * states: State keys to stop watching. If none are included,
+            the items are no longer watched at all.
+        """
+        if isinstance(items, (int, str)):
+            items = (items,)
+        with self.lock:
+            for item in items:
+                if isinstance(item, str):
+                    item = dearpygui.get_alias_id(item)
+                if not states:
+                    self._items.pop(item, None)
+                elif item in self._items:
+                    last = self._items[item]
+                    for state in states:
+                        last.pop(state, None)
+                    if not last:
+                        del self._items[item]
+
+    @overload
+    def on(self, state: str, callback: Callable, /, *, user_data: Any = None) -> Callable: ...
+    @overload
+    def on(self, state: str, /, *, user_data: Any = None) -> Callable[[Callable], Callable]: ...
+    def on(self, state: str, callback: Callable | None = None, /, *, user_data: Any = None) -> Any:
+        """Register a callback to run when *state* changes on a watched
+        item. Return the callback.
+
+        Args:
+            * state: The state key.
+
+            * callback: The callback. If not included, this method returns
+            a decorator.
+
+            * user_data: Sent to the callback as `user_data`.
+        """
+        def register(callback: Callable):
+            with self.lock:
+                self._callbacks[state] = self._callbacks.get(state, ()) + ((callback, user_data),)
+            return callback
+
+        if callback is None:
+            return register
+        return register(callback)
+
+    def off(self, state: str, callback: Callable | None = None) -> int:
+        """Remove callbacks registered to a state. Return the number of
+        callbacks removed.
+
+        Args:
+            * state: The state key.
+
+            * callback: The callback to remove. If None, all callbacks of
+            *state* are removed.
+        """
+        with self.lock:
+            entries = self._callbacks.get(state, ())
+            kept = tuple(e for e in entries if callback is not None and e[0] != callback)
+            if kept:
+                self._callbacks[state] = kept
+            else:
+                self._callbacks.pop(state, None)
+            return len(entries) - len(kept)
+
+    def start(self) -> None:
+        """Sample item states every frame."""
+        with self.lock:
+            if self._handle is None:
+                self._handle = api.Runtime.schedule_frame_callback(self.sample, interval=1)
+
+    def stop(self) -> None:
+        """Stop sampling item states."""
+        with self.lock:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+
+    def sample(self) -> int:
+        """Sample the states of watched items and run the callbacks of
+        those that changed. Return the number of callbacks run. Must be
+        called from the main thread.
+        """
+        get_item_state = dearpygui.get_item_state
+        callbacks = self._callbacks
+        changes   = []
+        deleted   = []
+        with self.lock:
+            for item, last in self._items.items():
+                try:
+                    state = get_item_state(item)
+                except SystemError:
+                    deleted.append(item)
+                    continue
+                for key, prev in last.items():
+                    value = state.get(key)
+                    if value != prev:
+                        last[key] = value
+                        if prev is None and not value:
+                            continue  # first sample
+                        for callback, user_data in callbacks.get(key, ()):
+                            changes.append((callback, item, value, user_data))
+            for item in deleted:
+                del self._items[item]
+        if changes:
+            api.Runtime.run_callback_queue(changes)
+        return len(changes)
+
+
+
+
 # enum conversions are a little slow, so the associations
 # are cached for quicker access
 _KEYCODE_MAP = {m.value: m for m in KeyInput}
 _PTRCODE_MAP = {m.value: m for m in MouseInput}
 
 class _InputPoller(items.mvHandlerRegistry):
+    # Pollers receive input events from the shared `InputHub` instead
+    # of adding handlers to their own registry. Like a registry's own
+    # handlers, events are ignored while the poller is hidden. The
+    # subscriptions end when `.delete()`/`.destroy()` is called, or on
+    # the first event after the poller was deleted some other way (i.e.
+    # `dearpygui.delete_item`, or deleting its parent).
+
     def __init__(self, *args, **kwargs) -> None:
         if not 'label' in kwargs:
             kwargs['label'] = f'[{type(self).__name__}]'
@@ -362,6 +842,40 @@ class _InputPoller(items.mvHandlerRegistry):
         # thread, so the necessity of this lock is questionable.
         self.lock = threading.RLock()
         self._inputs = []
+        self._subscriptions: list[tuple['InputEvent', Callable]] = []
+
+    def _subscribe(self, event: 'InputEvent', callback: Callable[[Item, Any], Any], *, coalesce: bool = False):
+        tag = int(self)
+        does_item_exist = dearpygui.does_item_exist
+        is_item_shown   = dearpygui.is_item_shown
+
+        def dispatch(sender: Item, app_data: Any):
+            if not does_item_exist(tag):
+                self._unsubscribe_all()
+            elif is_item_shown(tag):
+                callback(sender, app_data)
+
+        _input_hub.subscribe(event, dispatch, coalesce=coalesce)
+        with self.lock:
+            self._subscriptions.append((event, dispatch))
+
+    def _unsubscribe_all(self):
+        with self.lock:
+            subscriptions = self._subscriptions
+            self._subscriptions = []
+        for subscription in subscriptions:
+            _input_hub.unsubscribe(*subscription)
+
+    @override
+    def delete(self, *, children_only: bool = False, slot: Literal[-1, 0, 1, 2, 3] = -1) -> None:
+        if not children_only:
+            self._unsubscribe_all()
+        super().delete(children_only=children_only, slot=slot)
+
+    @override
+    def destroy(self):
+        self._unsubscribe_all()
+        super().destroy()
 
     def __iter__(self):
         with self.lock:
@@ -397,6 +911,435 @@ class InputEvent(enum.StrEnum):
     MOUSE_V_SCROLL = "MOUSE_V_SCROLL"
 
 
+_INPUT_EVENTS = tuple(InputEvent)
+_INPUT_EVENT_INDEX = {e: i for i, e in enumerate(_INPUT_EVENTS)}
+
+
+def _decode_input(ts: float, code: int, p0: float, p1: float, p2: float) -> tuple[float, InputEvent, Any]:
+    # stored (columnar) input event -> `InputRecorder` tuple
+    event = _INPUT_EVENTS[code]
+    if event is InputEvent.KEY_DOWN:
+        value = (_KEYCODE_MAP.get(int(p0), int(p0)), p1)
+    elif event is InputEvent.MOUSE_DOWN:
+        value = (_PTRCODE_MAP.get(int(p0), int(p0)), p1)
+    elif event is InputEvent.KEY_UP or event is InputEvent.KEY_PRESS:
+        value = _KEYCODE_MAP.get(int(p0), int(p0))
+    elif event is InputEvent.MOUSE_UP:
+        value = _PTRCODE_MAP.get(int(p0), int(p0))
+    elif event is InputEvent.MOUSE_MOVE:
+        value = (p0, p1)
+    elif event is InputEvent.MOUSE_DRAG:
+        value = (_PTRCODE_MAP.get(int(p0), int(p0)), p1, p2)
+    else:
+        value = int(p0)
+    return ts, event, value
+
+
+# [ INPUT HUB ]
+
+class InputHub:
+    """Process-wide dispatcher for global input events.
+
+    Dear PyGui runs the callback of every global input handler for
+    each input event, so handler registries that each add their own
+    `mvKeyDownHandler` and friends multiply the handler items and
+    callback invocations per event. The hub owns a single handler
+    registry with at most one handler per `InputEvent` kind, and fans
+    events out to its subscribers in Python. The number of handler
+    items and Dear PyGui callback invocations stays the same regardless
+    of the number of subscribers. Input pollers (`KeyPoller`,
+    `MousePoller`, `InputRecorder`, `Hotkeys`) subscribe to the hub
+    returned by `input_hub()`.
+
+    Subscribers are called with the same `sender` and `app_data` values
+    Dear PyGui sends handler callbacks. The hub releases the leaked
+    `app_data` reference after all subscribers have run, so subscribers
+    must not `Py_DECREF` it. A handler is only created for an event
+    kind while it has subscribers.
+
+    Mouse move, drag, and wheel events fire at input rate. Subscribers
+    of these can instead ask for *coalesced* events, which are delivered
+    at most once per frame by a scheduled frame callback (see
+    `Runtime.schedule_frame_callback`). They are delivered from the main
+    thread under `Runtime.start`, and from Dear PyGui's callback thread
+    under `dearpygui.start_dearpygui()`. A coalesced move or drag event
+    carries the latest cursor position or drag delta (drag deltas are
+    relative to where the drag started, so the latest one includes all
+    prior deltas), and a coalesced wheel event carries the sum of the
+    wheel inputs captured since the last frame.
+    """
+
+    # event -> (handler type, release `app_data`)
+    __EVENT_HANDLERS = {
+        InputEvent.KEY_DOWN      : (items.mvKeyDownHandler, True),
+        InputEvent.KEY_UP        : (items.mvKeyReleaseHandler, False),
+        InputEvent.KEY_PRESS     : (items.mvKeyPressHandler, False),
+        InputEvent.MOUSE_DOWN    : (items.mvMouseDownHandler, True),
+        InputEvent.MOUSE_UP      : (items.mvMouseReleaseHandler, False),
+        InputEvent.MOUSE_MOVE    : (items.mvMouseMoveHandler, True),
+        InputEvent.MOUSE_DRAG    : (items.mvMouseDragHandler, True),
+        InputEvent.MOUSE_V_SCROLL: (items.mvMouseWheelHandler, False),
+    }
+    __COALESCIBLE_EVENTS = (
+        InputEvent.MOUSE_MOVE,
+        InputEvent.MOUSE_DRAG,
+        InputEvent.MOUSE_V_SCROLL,
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._registry: items.mvHandlerRegistry | None = None
+        self._handlers: dict[InputEvent, Item] = {}
+        # Subscriber tuples are replaced, never mutated, so dispatching
+        # doesn't need the lock.
+        self._subscribers: dict[InputEvent, tuple[Callable[[Item, Any], Any], ...]] = {
+            event: () for event in self.__EVENT_HANDLERS
+        }
+        self._coalesced = self._subscribers.copy()
+        # event -> (sender, app_data) to deliver to coalesced subscribers
+        self._pending: dict[InputEvent, tuple[Item, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_handle: api.ScheduledCallback | None = None
+
+    @property
+    def registry(self) -> items.mvHandlerRegistry | None:
+        """[get] Return the hub's handler registry, or None if it
+        has not been created."""
+        return self._registry
+
+    def handlers(self) -> dict[InputEvent, Item]:
+        """Return the hub's handler items by event kind."""
+        with self.lock:
+            return self._handlers.copy()
+
+    def subscribers(self, event: InputEvent) -> tuple[Callable[[Item, Any], Any], ...]:
+        """Return the subscribers of an event kind, including those
+        receiving coalesced events."""
+        event = InputEvent(event)
+        return self._subscribers[event] + self._coalesced[event]
+
+    def subscribe(self, event: InputEvent, callback: Callable[[Item, Any], Any], *, coalesce: bool = False) -> None:
+        """Call *callback* with `sender` and `app_data` for each *event*.
+
+        Args:
+            * event: An `InputEvent` member other than `InputEvent.NONE`.
+
+            * callback: A callable accepting two positional arguments.
+
+            * coalesce: If True, *callback* receives at most one *event*
+            per frame. Only supported for `InputEvent.MOUSE_MOVE`,
+            `InputEvent.MOUSE_DRAG`, and `InputEvent.MOUSE_V_SCROLL`.
+        """
+        event = InputEvent(event)
+        if event not in self.__EVENT_HANDLERS:
+            raise ValueError(f'cannot subscribe to {event!r}.')
+        if coalesce and event not in self.__COALESCIBLE_EVENTS:
+            raise ValueError(f'{event!r} events cannot be coalesced.')
+        with self.lock:
+            registry = self._registry
+            if registry is None or not dearpygui.does_item_exist(registry):
+                # New (or destroyed) context. Subscribers of the old one
+                # are dropped along with its handlers.
+                self._registry = registry = items.mvHandlerRegistry(label=f'[{type(self).__name__}]')
+                self._handlers.clear()
+                for subscribed in self._subscribers:
+                    self._subscribers[subscribed] = ()
+                    self._coalesced[subscribed] = ()
+                self._stop_flushing()
+            if coalesce:
+                self._coalesced[event] += (callback,)
+                if self._flush_handle is None:
+                    self._flush_handle = api.Runtime.schedule_frame_callback(self._flush, interval=1)
+            else:
+                self._subscribers[event] += (callback,)
+            if event not in self._handlers:
+                h_factory, release = self.__EVENT_HANDLERS[event]
+                self._handlers[event] = h_factory(
+                    callback=self._dispatcher(event, release),
+                    parent=registry,
+                )
+
+    def unsubscribe(self, event: InputEvent, callback: Callable[[Item, Any], Any]) -> bool:
+        """Remove a subscriber. Return True if *callback* was subscribed
+        to *event*.
+
+        Args:
+            * event: The event kind.
+
+            * callback: The subscriber.
+        """
+        event = InputEvent(event)
+        with self.lock:
+            for subscriptions in (self._subscribers, self._coalesced):
+                subscribers = list(subscriptions.get(event, ()))
+                try:
+                    subscribers.remove(callback)
+                except ValueError:
+                    continue
+                subscriptions[event] = tuple(subscribers)
+                break
+            else:
+                return False
+            if not any(self._coalesced.values()):
+                self._stop_flushing()
+            if not self.subscribers(event) and event in self._handlers:
+                handler = self._handlers.pop(event)
+                if dearpygui.does_item_exist(handler):
+                    dearpygui.delete_item(handler)
+            return True
+
+    def _stop_flushing(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        with self._pending_lock:
+            self._pending.clear()
+
+    def _flush(self):
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending = self._pending.copy()
+            self._pending.clear()
+        coalesced = self._coalesced
+        for event, (sender, app_data) in pending.items():
+            for callback in coalesced[event]:
+                callback(sender, app_data)
+
+    def _dispatcher(self, event: InputEvent, release: bool) -> Callable[[Item, Any], None]:
+        subscribers  = self._subscribers
+        coalesced    = self._coalesced
+        pending      = self._pending
+        pending_lock = self._pending_lock
+        accumulate   = event == InputEvent.MOUSE_V_SCROLL
+
+        def dispatch(sender: Item, app_data: Any):
+            try:
+                for callback in subscribers[event]:
+                    callback(sender, app_data)
+                if coalesced[event]:
+                    with pending_lock:
+                        if accumulate and event in pending:
+                            pending[event] = (sender, pending[event][1] + app_data)
+                        else:
+                            pending[event] = (sender, app_data)
+            finally:
+                if release:
+                    Py_DECREF(app_data)
+
+        # read by `InputReplayer`, which leaks a reference only for these
+        dispatch._releases_app_data = release  # type: ignore
+        return dispatch
+
+
+_input_hub = InputHub()
+
+def input_hub() -> InputHub:
+    """Return the process-wide `InputHub`."""
+    return _input_hub
+
+
+
+
+class InputBufferView(Sequence[tuple[float, InputEvent, Any]]):
+    """A lazy, read-only view of a range of events in an `InputBuffer`.
+    Events are decoded into tuples when accessed.
+
+    Views are not copies. Indexing an event that has since been
+    overwritten raises `IndexError`, and iterating skips it.
+    """
+    __slots__ = ('_buffer', '_range')
+
+    def __init__(self, buffer: 'InputBuffer', seqs: range):
+        self._buffer = buffer
+        self._range  = seqs
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> tuple[float, InputEvent, Any]: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'InputBufferView': ...
+    def __getitem__(self, index: Any):
+        if isinstance(index, slice):
+            return InputBufferView(self._buffer, self._range[index])
+        return self._buffer._decode(self._range[index])
+
+    def __iter__(self):
+        return self._buffer._iter_range(self._range)
+
+    def __repr__(self):
+        return f'{type(self).__qualname__}({list(self)!r})'
+
+
+class InputBuffer(Sequence[tuple[float, InputEvent, Any]]):
+    """A fixed-capacity ring buffer of input events, stored in columns of
+    `array.array` objects. Appending an event does not create any objects,
+    and the oldest event is overwritten once the buffer is full.
+
+    The buffer behaves like a read-only sequence of 3-item tuples
+    `(time, event, app_data)` (see `InputRecorder` for the shape of
+    *app_data* per event). Tuples are decoded when accessed; slicing
+    returns a lazy `InputBufferView`.
+
+    Each event is stored as a timestamp (`"d"`), an event code (`"B"`,
+    the index of the event in `InputEvent`), and three numeric payload
+    slots (`"d"`). Use `.columns`, `.tobytes` or `.to_numpy` for bulk
+    access.
+
+    The buffer does not synchronize access.
+    """
+    __slots__ = (
+        'maxlen',
+        '_ts',
+        '_event',
+        '_p0',
+        '_p1',
+        '_p2',
+        '_count',
+        '_len',
+    )
+
+    COLUMNS = ('time', 'event', 'p0', 'p1', 'p2')
+
+    def __init__(self, maxlen: int | None = 10000):
+        """Args:
+            * maxlen: The number of events the buffer can hold. When 0
+            or None, the buffer grows without bound.
+        """
+        self.maxlen = maxlen = max(0, int(maxlen or 0))
+        self._ts    = array.array('d', bytes(8 * maxlen))
+        self._event = array.array('B', bytes(maxlen))
+        self._p0    = array.array('d', bytes(8 * maxlen))
+        self._p1    = array.array('d', bytes(8 * maxlen))
+        self._p2    = array.array('d', bytes(8 * maxlen))
+        # sequence number of the next event
+        self._count = 0
+        self._len   = 0
+
+    def append(self, ts: float, event: InputEvent, p0: float = 0.0, p1: float = 0.0, p2: float = 0.0) -> None:
+        """Add an event to the buffer, overwriting the oldest event when
+        full.
+
+        Args:
+            * ts: Time of the event.
+
+            * event: Type of event.
+
+            * p0, p1, p2: Numeric payload. For events whose *app_data* is
+            a sequence, these are its values in order. Otherwise, *p0*
+            is the *app_data* value.
+        """
+        maxlen = self.maxlen
+        if maxlen:
+            i = self._count % maxlen
+            self._ts[i]    = ts
+            self._event[i] = _INPUT_EVENT_INDEX[event]
+            self._p0[i]    = p0
+            self._p1[i]    = p1
+            self._p2[i]    = p2
+            if self._len < maxlen:
+                self._len += 1
+        else:
+            self._ts.append(ts)
+            self._event.append(_INPUT_EVENT_INDEX[event])
+            self._p0.append(p0)
+            self._p1.append(p1)
+            self._p2.append(p2)
+            self._len += 1
+        self._count += 1
+
+    def clear(self) -> None:
+        """Remove all events."""
+        if not self.maxlen:
+            for column in (self._ts, self._event, self._p0, self._p1, self._p2):
+                del column[:]
+        self._count = self._len = 0
+
+    def _index(self, seq: int) -> int:
+        if not self._count - self._len <= seq < self._count:
+            raise IndexError('event is no longer in the buffer.')
+        return seq % self.maxlen if self.maxlen else seq
+
+    def _decode(self, seq: int) -> tuple[float, InputEvent, Any]:
+        i = self._index(seq)
+        return _decode_input(
+            self._ts[i], self._event[i], self._p0[i], self._p1[i], self._p2[i]
+        )
+
+    def _iter_range(self, seqs: range):
+        for seq in seqs:
+            try:
+                yield self._decode(seq)
+            except IndexError:
+                continue
+
+    def _range(self) -> range:
+        return range(self._count - self._len, self._count)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> tuple[float, InputEvent, Any]: ...
+    @overload
+    def __getitem__(self, index: slice) -> InputBufferView: ...
+    def __getitem__(self, index: Any):
+        if isinstance(index, slice):
+            return InputBufferView(self, self._range()[index])
+        return self._decode(self._range()[index])
+
+    def __iter__(self):
+        return self._iter_range(self._range())
+
+    def __repr__(self):
+        return f'{type(self).__qualname__}({list(self)!r}, maxlen={self.maxlen})'
+
+    def columns(self) -> dict[str, array.array]:
+        """Return copies of the buffer's columns with events in order from
+        oldest to newest. Keys are the names in `InputBuffer.COLUMNS`."""
+        columns = (self._ts, self._event, self._p0, self._p1, self._p2)
+        if not self.maxlen or self._len < self.maxlen:
+            start = self._count - self._len if self.maxlen else 0
+            stop  = start + self._len
+            return {
+                name: column[start:stop]
+                for name, column in zip(self.COLUMNS, columns)
+            }
+        split = self._count % self.maxlen
+        return {
+            name: column[split:] + column[:split]
+            for name, column in zip(self.COLUMNS, columns)
+        }
+
+    def tobytes(self) -> bytes:
+        """Return the contents of the buffer as bytes.
+
+        The result is each column from `.columns` in the order of
+        `InputBuffer.COLUMNS`, in native byte order; *n* doubles of time,
+        *n* unsigned bytes of event codes, then *n* doubles for each
+        payload slot.
+        """
+        return b''.join(column.tobytes() for column in self.columns().values())
+
+    def to_numpy(self) -> Any:
+        """Return the contents of the buffer as a NumPy structured array
+        with fields named after `InputBuffer.COLUMNS`.
+
+        Requires NumPy.
+        """
+        import numpy
+
+        columns = self.columns()
+        result  = numpy.empty(self._len, dtype=[
+            ('time', 'f8'), ('event', 'u1'), ('p0', 'f8'), ('p1', 'f8'), ('p2', 'f8'),
+        ])
+        for name, column in columns.items():
+            result[name] = numpy.frombuffer(column, dtype=column.typecode)
+        return result
+
+
 class InputRecorder(_InputPoller):
     """A global handler registry that records input events.
     Useful for logging and debugging.
@@ -445,85 +1388,86 @@ class InputRecorder(_InputPoller):
 
     "Push"/"click" events are captured as individual "down"
     and "up" events.
+
+    Events are stored in an `InputBuffer` (see `.buffer`), which
+    records them without allocating objects and decodes the above
+    tuples only when accessed.
     """
 
+    def _record(self, event: InputEvent, p0: float = 0.0, p1: float = 0.0, p2: float = 0.0):
+        ts = time.time()
+        with self.lock:
+            self._inputs.append(ts, event, p0, p1, p2)
+        if self.sink is not None:
+            self.sink.write(ts, event, p0, p1, p2)
+
+
     KEY_DOWN = InputEvent.KEY_DOWN
 
     def _cb_key_down(self, handler: Item, key_info: tuple[int, float]):
-        with self.lock:
-            self._inputs.append(
-                (time.time(), self.KEY_DOWN, (_KEYCODE_MAP[key_info[0]], key_info[1]))
-            )
-            Py_DECREF(key_info)
+        key, duration = key_info
+        self._record(self.KEY_DOWN, key, duration)
 
 
     MOUSE_DOWN = InputEvent.MOUSE_DOWN
 
     def _cb_mouse_down(self, handler: Item, key_info: tuple[int, float]):
-        with self.lock:
-            self._inputs.append(
-                (time.time(), self.MOUSE_DOWN, (_PTRCODE_MAP[key_info[0]], key_info[1]))
-            )
-            Py_DECREF(key_info)
+        key, duration = key_info
+        self._record(self.MOUSE_DOWN, key, duration)
 
 
     KEY_UP = InputEvent.KEY_UP
 
     def _cb_key_up(self, handler: Item, key: int):
-        with self.lock:
-            self._inputs.append((time.time(), self.KEY_UP, _KEYCODE_MAP[key]))
+        self._record(self.KEY_UP, key)
 
 
     MOUSE_UP = InputEvent.MOUSE_UP
 
     def _cb_mouse_up(self, handler: Item, key: int):
-        with self.lock:
-            self._inputs.append((time.time(), self.MOUSE_UP, _PTRCODE_MAP[key]))
+        self._record(self.MOUSE_UP, key)
 
 
     MOUSE_MOVE = InputEvent.MOUSE_MOVE
 
     def _cb_mouse_move(self, handler:  Item, cursor_pos: tuple[float, float]):
-        with self.lock:
-            self._inputs.append((time.time(), self.MOUSE_MOVE, tuple(cursor_pos)))
-            Py_DECREF(cursor_pos)
+        x_pos, y_pos = cursor_pos
+        self._record(self.MOUSE_MOVE, x_pos, y_pos)
 
 
     MOUSE_DRAG = InputEvent.MOUSE_DRAG
 
     def _cb_mouse_drag(self, handler: Item, drag_data: tuple[int, float, float]):
         key, x_pos_dt, y_pos_dt = drag_data
-        with self.lock:
-            self._inputs.append((time.time(), self.MOUSE_DRAG, (_PTRCODE_MAP[key], x_pos_dt, y_pos_dt)))
-            Py_DECREF(drag_data)
+        self._record(self.MOUSE_DRAG, key, x_pos_dt, y_pos_dt)
 
 
     MOUSE_V_SCROLL = InputEvent.MOUSE_V_SCROLL
 
     def _cb_mouse_v_scroll(self, handler: Item, value: int):
-        with self.lock:
-            self._inputs.append((time.time(), self.MOUSE_V_SCROLL, value))
+        self._record(self.MOUSE_V_SCROLL, value)
 
 
-    __INPUT_HOOK_MAP = {
-        KEY_DOWN      : items.mvKeyDownHandler,
-        KEY_UP        : items.mvKeyReleaseHandler,
-        MOUSE_DOWN    : items.mvMouseDownHandler,
-        MOUSE_UP      : items.mvMouseReleaseHandler,
-        MOUSE_MOVE    : items.mvMouseMoveHandler,
-        MOUSE_DRAG    : items.mvMouseDragHandler,
-        MOUSE_V_SCROLL: items.mvMouseWheelHandler,
-    }
+    __INPUT_EVENTS = (
+        KEY_DOWN,
+        KEY_UP,
+        MOUSE_DOWN,
+        MOUSE_UP,
+        MOUSE_MOVE,
+        MOUSE_DRAG,
+        MOUSE_V_SCROLL,
+    )
 
-    _inputs: collections.deque[tuple[float, InputEvent, Any]]
+    _inputs: InputBuffer  # type: ignore
 
     @overload
     def __init__(   # type: ignore
         self,
-        maxlen   : int                    = 10000,
+        maxlen   : int | None             = 10000,
         events   : Collection[InputEvent] = InputEvent,
         inclusive: bool                   = True,
         *,
+        sink              : 'InputLogSink | None' = None,
         label             : str  = ...,
         user_data         : Any  = ...,
         use_internal_label: bool = ...,
@@ -531,10 +1475,11 @@ class InputRecorder(_InputPoller):
         show              : bool = ...,
         **kwargs
     ) -> None: ...
-    def __init__(self, maxlen: int = 10000, events: Collection[InputEvent] = InputEvent, inclusive: bool = True, **kwargs):
+    def __init__(self, maxlen: int | None = 10000, events: Collection[InputEvent] = InputEvent, inclusive: bool = True, *, sink: 'InputLogSink | None' = None, **kwargs):
         """Args:
             * maxlen: The length of the cache. Will grow to an
-            arbitrary length when set to 0 (note: not a good idea).
+            arbitrary length when set to 0 or None (note: not a good
+            idea).
 
             * events: A collection of `InputEvent` members of events
             to capture or ignore, depending on the value of *inclusive*.
@@ -542,19 +1487,24 @@ class InputRecorder(_InputPoller):
             * inclusive: If True, only capture inputs specified in
             *events*. If False, capture all inputs except those
             specified in *events*.
+
+            * sink: An `InputLogSink` that every captured event is also
+            written to. Unlike the cache, the sink keeps the full
+            history of events.
         """
         super().__init__(**kwargs)
-        self._inputs = collections.deque(
-            [(time.time(), InputEvent.NONE, 0)],
-            maxlen=maxlen
-        )
-        with self:
-            for input_tp, h_factory in self.__INPUT_HOOK_MAP.items():
-                if inclusive:
-                    if input_tp in events:
-                        h_factory(callback=getattr(self, f'_cb_{input_tp.lower()}'))
-                elif input_tp not in events:
-                    h_factory(callback=getattr(self, f'_cb_{input_tp.lower()}'))
+        self.sink    = sink
+        self._inputs = InputBuffer(maxlen)
+        self._record(InputEvent.NONE)
+        for input_tp in self.__INPUT_EVENTS:
+            if (input_tp in events) == inclusive:
+                self._subscribe(input_tp, getattr(self, f'_cb_{input_tp.lower()}'))
+
+    @property
+    def buffer(self) -> InputBuffer:
+        """[get] Return the buffer events are recorded to. Hold `.lock`
+        while reading it if the recorder is active."""
+        return self._inputs
 
     @property
     def oldest(self):
@@ -566,6 +1516,527 @@ class InputRecorder(_InputPoller):
         with self.lock:
             return self._inputs[-1]
 
+    def save(self, file: str | os.PathLike | IO[str]) -> int:
+        """Write the recorded events to an input trace file (see
+        `save_input_trace`). Return the number of events written.
+
+        Args:
+            * file: A path or writable text file object.
+        """
+        with self.lock:
+            events = tuple(self._inputs)
+        return save_input_trace(events, file)
+
+
+# [ INPUT TRACES ]
+
+_TRACE_FORMAT  = 'dearpypixl-input-trace'
+_TRACE_VERSION = 1
+
+InputTraceEntry = tuple[float, InputEvent, Any]
+
+
+def _to_trace_value(value: Any) -> Any:
+    if isinstance(value, (tuple, list)):
+        return [int(v) if isinstance(v, enum.IntEnum) else v for v in value]
+    if isinstance(value, enum.IntEnum):
+        return int(value)
+    return value
+
+
+def save_input_trace(events: Iterable[InputTraceEntry], file: str | os.PathLike | IO[str]) -> int:
+    """Write recorded input events to a trace file. Return the number
+    of events written.
+
+    Args:
+        * events: An iterable of 3-item tuples as yielded by iterating an
+        `InputRecorder`.
+
+        * file: A path or writable text file object.
+
+
+    Traces are newline-delimited JSON. The first line is a header
+    object, and every following line is a `[time, event, app_data]`
+    array. Times are in fractional seconds, relative to the first
+    event. Event codes are written as integers.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'w', encoding='utf-8') as f:
+            return save_input_trace(events, f)
+
+    events = iter(events)
+    file.write(json.dumps({'format': _TRACE_FORMAT, 'version': _TRACE_VERSION}))
+    file.write('\n')
+    count = 0
+    ts_first = None
+    for ts, event, app_data in events:
+        if ts_first is None:
+            ts_first = ts
+        file.write(json.dumps([
+            round(ts - ts_first, 6), str(event), _to_trace_value(app_data)
+        ]))
+        file.write('\n')
+        count += 1
+    return count
+
+
+def load_input_trace(file: str | os.PathLike | IO[str]) -> list[InputTraceEntry]:
+    """Read input events from a trace file written by `save_input_trace`
+    or `InputRecorder.save`.
+
+    Args:
+        * file: A path or readable text file object.
+
+
+    Events are returned in the same shape as those recorded by
+    `InputRecorder`, with times relative to the first event.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, encoding='utf-8') as f:
+            return load_input_trace(f)
+
+    header = json.loads(file.readline() or 'null')
+    if not isinstance(header, dict) or header.get('format') != _TRACE_FORMAT:
+        raise ValueError('file is not an input trace.')
+    if header.get('version') != _TRACE_VERSION:
+        raise ValueError(
+            f"unsupported input trace version {header.get('version')!r} "
+            f"(expected {_TRACE_VERSION})."
+        )
+    trace = []
+    for line in file:
+        if not line.strip():
+            continue
+        ts, event, app_data = json.loads(line)
+        event = InputEvent(event)
+        if event in (InputEvent.KEY_DOWN, InputEvent.MOUSE_DOWN, InputEvent.MOUSE_DRAG):
+            code_map = _KEYCODE_MAP if event == InputEvent.KEY_DOWN else _PTRCODE_MAP
+            app_data = (code_map[app_data[0]], *app_data[1:])
+        elif event in (InputEvent.KEY_UP, InputEvent.KEY_PRESS):
+            app_data = _KEYCODE_MAP[app_data]
+        elif event == InputEvent.MOUSE_UP:
+            app_data = _PTRCODE_MAP[app_data]
+        elif event == InputEvent.MOUSE_MOVE:
+            app_data = tuple(app_data)
+        trace.append((ts, event, app_data))
+    return trace
+
+
+class InputReplayer:
+    """Replays recorded input events by sending them to the callbacks of
+    global input handlers (`mvHandlerRegistry` children), as Dear PyGui
+    would.
+
+    Each event is delivered to every handler of the matching type whose
+    *key* or *button* setting matches it, with `app_data` shaped the
+    way Dear PyGui sends it. Handlers and registries that are hidden
+    (`show=False`) are skipped.
+        >>> recorder = InputRecorder()
+        >>> Runtime.start()    # interact with the application
+        >>> recorder.save("session.trace")
+        ...
+        >>> replayer = InputReplayer(load_input_trace("session.trace"), speed=4.0)
+        >>> replayer.start()
+        >>> while not replayer.done:
+        ...     Runtime.step(60)
+        >>> Runtime.stats()
+
+    While replaying, events are dispatched in the main thread by a frame
+    callback (see `Runtime.schedule_frame_callback`). Every frame, all
+    events due by then are delivered in order. Elapsed time is read from
+    the clock of `Runtime.timers`, which is virtual while
+    stepping the runtime using `Runtime.step`. A replay driven by
+    `Runtime.step` delivers the same events on the same frames every
+    time.
+
+    Only callbacks receive events. Dear PyGui's own input state (i.e.
+    `get_mouse_pos`, widget interaction) is not affected. Handlers are
+    collected when the replay starts; use `.refresh` to pick up handlers
+    added afterward.
+    """
+    __slots__ = (
+        'trace',
+        'speed',
+        'on_done',
+        '_index',
+        '_ts_start',
+        '_handle',
+        '_handlers',
+    )
+
+    _HANDLER_TYPES = {
+        InputEvent.KEY_DOWN      : ('mvKeyDownHandler', 'key'),
+        InputEvent.KEY_UP        : ('mvKeyReleaseHandler', 'key'),
+        InputEvent.KEY_PRESS     : ('mvKeyPressHandler', 'key'),
+        InputEvent.MOUSE_DOWN    : ('mvMouseDownHandler', 'button'),
+        InputEvent.MOUSE_UP      : ('mvMouseReleaseHandler', 'button'),
+        InputEvent.MOUSE_MOVE    : ('mvMouseMoveHandler', None),
+        InputEvent.MOUSE_DRAG    : ('mvMouseDragHandler', 'button'),
+        InputEvent.MOUSE_V_SCROLL: ('mvMouseWheelHandler', None),
+    }
+
+    def __init__(
+        self,
+        trace  : Iterable[InputTraceEntry],
+        *,
+        speed  : float                 = 1.0,
+        on_done: Callable[[], Any] | None = None,
+    ):
+        """Args:
+            * trace: Input events to replay, as returned from
+            `load_input_trace`, or yielded by iterating an
+            `InputRecorder`.
+
+            * speed: Playback speed multiplier. Values greater than
+            1.0 replay faster than recorded.
+
+            * on_done: Called without arguments in the main thread
+            after the last event is delivered.
+        """
+        if speed <= 0:
+            raise ValueError(f'expected a positive number for `speed`, got {speed!r}.')
+        trace = list(trace)
+        ts_first = trace[0][0] if trace else 0.0
+        self.trace   = [(ts - ts_first, event, app_data) for ts, event, app_data in trace]
+        self.speed   = speed
+        self.on_done = on_done
+        self._index    = 0
+        self._ts_start = 0.0
+        self._handle: api.ScheduledCallback | None = None
+        self._handlers: dict[InputEvent, list[tuple[Item, str | None, Callable, Any, bool]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.trace)
+
+    @property
+    def done(self) -> bool:
+        """[get] Return True if all events were delivered."""
+        return self._index >= len(self.trace)
+
+    @property
+    def position(self) -> int:
+        """[get] Return the number of events delivered."""
+        return self._index
+
+    def refresh(self) -> None:
+        """Collect the input handlers events are sent to."""
+        get_item_info   = dearpygui.get_item_info
+        get_item_config = dearpygui.get_item_configuration
+        by_type = {tp: event for event, (tp, _) in self._HANDLER_TYPES.items()}
+        handlers: dict[InputEvent, list] = {event: [] for event in self._HANDLER_TYPES}
+        for registry in dearpygui.get_all_items():
+            info = get_item_info(registry)
+            if info['type'] != 'mvAppItemType::mvHandlerRegistry':
+                continue
+            if not get_item_config(registry)['show']:
+                continue
+            for handler in info['children'][1]:
+                tp = get_item_info(handler)['type'].removeprefix('mvAppItemType::')
+                if tp not in by_type:
+                    continue
+                config = get_item_config(handler)
+                if not config['show'] or config['callback'] is None:
+                    continue
+                event = by_type[tp]
+                key   = self._HANDLER_TYPES[event][1]
+                handlers[event].append((
+                    handler,
+                    config[key] if key else -1,
+                    config['callback'],
+                    config['user_data'],
+                    getattr(config['callback'], '_releases_app_data', False),
+                ))
+        self._handlers = handlers
+
+    def start(self) -> None:
+        """Start (or restart) replaying events from the beginning."""
+        self.stop()
+        self.refresh()
+        self._index    = 0
+        self._ts_start = api.Runtime.timers.now()
+        self._handle   = api.Runtime.schedule_frame_callback(self._deliver, interval=1)
+
+    def stop(self) -> None:
+        """Stop replaying events."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _deliver(self):
+        elapsed  = (api.Runtime.timers.now() - self._ts_start) * self.speed
+        trace    = self.trace
+        handlers = self._handlers
+        index    = self._index
+        queue    = []
+        while index < len(trace) and trace[index][0] <= elapsed:
+            _, event, app_data = trace[index]
+            index += 1
+            try:
+                targets = handlers[event]
+            except KeyError:  # `InputEvent.NONE`
+                continue
+            if not targets:
+                continue
+            if isinstance(app_data, tuple):
+                code = app_data[0] if event != InputEvent.MOUSE_MOVE else -1
+            elif event != InputEvent.MOUSE_V_SCROLL:
+                code = app_data
+            else:
+                code = -1
+            for handler, h_code, callback, user_data, release in targets:
+                if h_code == -1 or h_code == code:
+                    # Like Dear PyGui, send each callback its own `app_data`
+                    # object. `InputHub` dispatchers release a reference
+                    # (see the note on `Py_DECREF` above), so they're sent
+                    # one to release. Other callbacks aren't leaked one.
+                    value = _to_trace_value(app_data)
+                    if release:
+                        Py_INCREF(value)
+                    queue.append((callback, handler, value, user_data))
+        self._index = index
+        api.Runtime.run_callback_queue(queue)
+        if index >= len(trace):
+            self.stop()
+            if self.on_done is not None:
+                self.on_done()
+
+
+# [ INPUT LOGS ]
+
+_INPUT_LOG_MAGIC  = b'DPXINP\x00\x01'  # format version 1
+_INPUT_LOG_RECORD = struct.Struct('<dBddd')
+
+
+class InputLogSink:
+    """Streams input events to a binary log file, with rotation.
+
+    Events are buffered in memory and written in batches by a daemon
+    thread, so writing an event never waits on disk I/O. The buffer is
+    bounded; when it is full (i.e. the disk cannot keep up), new events
+    are dropped and counted in `.dropped`.
+
+    The log starts with an 8-byte header, followed by fixed-size 33 byte
+    little-endian records: a timestamp (double), event code (unsigned
+    byte; the index of the event in `InputEvent`), and three payload
+    values (doubles). See `InputBuffer` for the payload layout.
+
+    Once the log cannot grow by another record without exceeding
+    *max_bytes*, it is rotated as `logging.handlers.RotatingFileHandler` does; "input.log"
+    is renamed to "input.log.1", "input.log.1" to "input.log.2", etc.,
+    and the oldest file past *backup_count* is deleted. Use
+    `read_input_log` to read logs back.
+        >>> sink = InputLogSink("input.log")
+        >>> recorder = InputRecorder(sink=sink)
+        >>> Runtime.start()
+        >>> sink.close()
+
+    Sinks can be used as context managers, which close them on exit.
+    """
+    __slots__ = (
+        'path',
+        'max_bytes',
+        'backup_count',
+        'buffer_size',
+        'batch_size',
+        'flush_interval',
+        'dropped',
+        '_pending',
+        '_cond',
+        '_closed',
+        '_file',
+        '_io_lock',
+        '_thread',
+    )
+
+    def __init__(
+        self,
+        path          : str | os.PathLike,
+        *,
+        max_bytes     : int   = 64 * 1024 * 1024,
+        backup_count  : int   = 5,
+        buffer_size   : int   = 65536,
+        batch_size    : int   = 1024,
+        flush_interval: float = 1.0,
+    ):
+        """Args:
+            * path: Path of the log file. Events are appended if it
+            already exists.
+
+            * max_bytes: The maximum size of a log file. When 0, the log
+            is never rotated.
+
+            * backup_count: The number of rotated log files to keep.
+
+            * buffer_size: The maximum number of events waiting to be
+            written.
+
+            * batch_size: The number of waiting events that wakes the
+            writer thread before *flush_interval* elapses.
+
+            * flush_interval: The maximum time in fractional seconds
+            events wait to be written.
+        """
+        self.path           = os.fspath(path)
+        self.max_bytes      = max(0, max_bytes)
+        self.backup_count   = max(0, backup_count)
+        self.buffer_size    = max(1, buffer_size)
+        self.batch_size     = max(1, min(batch_size, self.buffer_size))
+        self.flush_interval = flush_interval
+        self.dropped        = 0
+        self._pending: list[tuple[float, int, float, float, float]] = []
+        self._cond   = threading.Condition(threading.Lock())
+        self._closed = False
+        self._file: IO[bytes] | None = None
+        self._io_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f'{type(self).__name__}({self.path!r})', daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """[get] Return True if the sink was closed."""
+        return self._closed
+
+    def write(self, ts: float, event: InputEvent, p0: float = 0.0, p1: float = 0.0, p2: float = 0.0) -> bool:
+        """Queue an event to be written. Return False if the event was
+        dropped.
+
+        Args:
+            * ts: Time of the event.
+
+            * event: Type of event.
+
+            * p0, p1, p2: Numeric payload (see `InputBuffer.append`).
+        """
+        with self._cond:
+            pending = self._pending
+            if self._closed or len(pending) >= self.buffer_size:
+                self.dropped += 1
+                return False
+            pending.append((ts, _INPUT_EVENT_INDEX[event], p0, p1, p2))
+            if len(pending) == self.batch_size:
+                self._cond.notify()
+        return True
+
+    def flush(self) -> None:
+        """Write all waiting events, blocking until done."""
+        # Batches are taken and written under the I/O lock so they're
+        # written in order.
+        with self._io_lock:
+            with self._cond:
+                batch = self._pending
+                self._pending = []
+            self._write(batch)
+
+    def close(self) -> None:
+        """Write all waiting events, then stop the writer thread and
+        close the log file. Events written afterward are dropped."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        cond = self._cond
+        while True:
+            with cond:
+                cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    self.flush_interval,
+                )
+                closed = self._closed
+            self.flush()
+            if closed:
+                break
+
+    def _open(self) -> IO[bytes]:
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+            if not self._file.tell():
+                self._file.write(_INPUT_LOG_MAGIC)
+        return self._file
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.backup_count:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f'{self.path}.{i}'
+                if os.path.exists(src):
+                    os.replace(src, f'{self.path}.{i + 1}')
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+
+    def _write(self, batch: list[tuple[float, int, float, float, float]]):
+        # I/O lock must be held
+        if not batch:
+            return
+        record = _INPUT_LOG_RECORD
+        data   = bytearray(record.size * len(batch))
+        offset = 0
+        for values in batch:
+            record.pack_into(data, offset, *values)
+            offset += record.size
+        file = self._open()
+        if self.max_bytes:
+            view = memoryview(data)
+            while len(view):
+                size = (self.max_bytes - file.tell()) // record.size * record.size
+                if size <= 0:
+                    if file.tell() > len(_INPUT_LOG_MAGIC):
+                        self._rotate()
+                        file = self._open()
+                        continue
+                    size = record.size  # *max_bytes* is smaller than a record
+                file.write(view[:size])
+                view = view[size:]
+        else:
+            file.write(data)
+        file.flush()
+
+
+def read_input_log(path: str | os.PathLike, *, rotated: bool = False) -> Iterator[tuple[float, InputEvent, Any]]:
+    """Read events from a log written by `InputLogSink`. Yield the same
+    tuples as iterating an `InputRecorder`.
+
+    Args:
+        * path: Path of the log file.
+
+        * rotated: If True, also read rotated logs ("{path}.1",
+        "{path}.2", etc.) that exist, from oldest to newest.
+    """
+    path  = os.fspath(path)
+    paths = [path]
+    if rotated:
+        i = 1
+        while os.path.exists(f'{path}.{i}'):
+            paths.insert(0, f'{path}.{i}')
+            i += 1
+    record = _INPUT_LOG_RECORD
+    for fpath in paths:
+        with open(fpath, 'rb') as f:
+            if f.read(len(_INPUT_LOG_MAGIC)) != _INPUT_LOG_MAGIC:
+                raise ValueError(f'{fpath!r} is not an input log.')
+            while chunk := f.read(record.size * 4096):
+                # ignore a partially-written trailing record
+                size = len(chunk) - len(chunk) % record.size
+                for values in record.iter_unpack(chunk[:size]):
+                    yield _decode_input(*values)
+
 
 class KeyPoller(_InputPoller):
     """A global handler registry that polls and caches keycode
@@ -589,9 +2060,11 @@ class KeyPoller(_InputPoller):
     """
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        with self:
-            items.mvKeyDownHandler(callback=self._cb_key_down)
-            items.mvKeyReleaseHandler(callback=self._cb_key_up)
+        # key -> press number; consecutive presses have consecutive numbers
+        self._presses: dict[int, int] = {}
+        self._press_count = 0
+        self._subscribe(InputEvent.KEY_DOWN, self._cb_key_down)
+        self._subscribe(InputEvent.KEY_UP, self._cb_key_up)
 
     def to_chars(self) -> str:
         with self.lock:
@@ -599,14 +2072,22 @@ class KeyPoller(_InputPoller):
 
     def keys_pressed(self, *keys: int) -> bool:
         """Return True if a series of keys are currently pressed
-        and were pressed in order.
+        and were pressed in order, one after another.
+
+        For example, if 'l_ctrl', 'l_shift', and 'f' were pressed in
+        order and are held down, passing `(l_ctrl, f)` returns False
+        since 'l_shift' was pressed between them, even after 'l_shift'
+        is released.
+
+        For keyboard shortcuts, see `Hotkeys`.
         """
-        # BUG: This can return a false positive in niche situations.
-        # For example; 'l_ctrl', 'l_shift', and 'f' are pressed in order
-        # and are held down. Then, 'l_shift' is released -- passing a
-        # key set of `(l_ctrl, f)` at this time would return True.
         with self.lock:
-            return ' '.join(str(k) for k in keys) in ' '.join(str(i) for i in self._inputs)
+            presses = self._presses
+            try:
+                first = presses[keys[0]]
+                return all(presses[k] == first + i for i, k in enumerate(keys))
+            except (KeyError, IndexError):
+                return False
 
 
     last_pressed = 0
@@ -615,9 +2096,10 @@ class KeyPoller(_InputPoller):
         key = _KEYCODE_MAP[key_info[0]]
         with self.lock:
             self.last_pressed = key
-            if key not in self._inputs:
+            if key not in self._presses:
                 self._inputs.append(key)
-            Py_DECREF(key_info)
+                self._presses[key] = self._press_count
+                self._press_count += 1
 
 
     last_released = 0
@@ -626,10 +2108,278 @@ class KeyPoller(_InputPoller):
         key = _KEYCODE_MAP[key]
         with self.lock:
             self.last_released = key
-            if key in self._inputs:
+            if self._presses.pop(key, None) is not None:
                 self._inputs.remove(key)
 
 
+# [ HOTKEYS ]
+
+_MOD_CTRL  = 1
+_MOD_SHIFT = 2
+_MOD_ALT   = 4
+_MOD_META  = 8
+
+_MODIFIER_KEYS = {
+    KeyInput.CTRL   : _MOD_CTRL,
+    KeyInput.L_CTRL : _MOD_CTRL,
+    KeyInput.R_CTRL : _MOD_CTRL,
+    KeyInput.SHIFT  : _MOD_SHIFT,
+    KeyInput.L_SHIFT: _MOD_SHIFT,
+    KeyInput.R_SHIFT: _MOD_SHIFT,
+    KeyInput.ALT    : _MOD_ALT,
+    KeyInput.L_MENU : _MOD_ALT,
+    KeyInput.R_MENU : _MOD_ALT,
+    KeyInput.L_META : _MOD_META,
+    KeyInput.R_META : _MOD_META,
+}
+_MODIFIER_NAMES = {
+    'CTRL'   : _MOD_CTRL,
+    'CONTROL': _MOD_CTRL,
+    'SHIFT'  : _MOD_SHIFT,
+    'ALT'    : _MOD_ALT,
+    'OPTION' : _MOD_ALT,
+    'META'   : _MOD_META,
+    'WIN'    : _MOD_META,
+    'SUPER'  : _MOD_META,
+    'CMD'    : _MOD_META,
+}
+_KEY_NAME_ALIASES = {
+    '-': 'MINUS',
+    '=': 'PLUS',
+    '.': 'PERIOD',
+    '/': 'FORWARD_SLASH',
+    '\\': 'BACKSLASH',
+    ';': 'SEMICOLON',
+    "'": 'QUOTE',
+    '[': 'BRACKET_OPEN',
+    ']': 'BRACKET_CLOSE',
+    '`': 'TILDE',
+    'UP': 'ARROW_UP',
+    'DOWN': 'ARROW_DN',
+    'LEFT': 'ARROW_LEFT',
+    'RIGHT': 'ARROW_RIGHT',
+    'ESCAPE': 'ESC',
+    'PAGEUP': 'PAGE_UP',
+    'PAGEDOWN': 'PAGE_DN',
+}
+
+
+def _parse_chord(chord: str) -> int:
+    mask = 0
+    key  = None
+    for name in chord.split('+'):
+        name = name.strip().upper()
+        if not name:
+            raise ValueError(f'empty key name in hotkey {chord!r}.')
+        if name in _MODIFIER_NAMES:
+            mask |= _MODIFIER_NAMES[name]
+            continue
+        if key is not None:
+            raise ValueError(f'hotkey chord {chord!r} has more than one non-modifier key.')
+        name = _KEY_NAME_ALIASES.get(name, name)
+        if name.isdigit() and len(name) == 1:
+            name = f'DIGIT_{name}'
+        try:
+            key = KeyInput[name.replace(' ', '_')]
+        except KeyError:
+            raise ValueError(f'unknown key {name!r} in hotkey {chord!r}.') from None
+    if key is None:
+        raise ValueError(f'hotkey chord {chord!r} has no non-modifier key.')
+    return mask << 16 | key
+
+
+def _parse_hotkey(hotkey: str) -> tuple[int, ...]:
+    return tuple(_parse_chord(chord) for chord in hotkey.split(','))
+
+
+class _HotkeyNode:
+    __slots__ = ('children', 'callbacks')
+
+    def __init__(self):
+        self.children : dict[int, '_HotkeyNode'] = {}
+        self.callbacks: list[tuple[str, Callable, Any]] = []
+
+
+class Hotkeys(_InputPoller):
+    """A global handler registry that dispatches callbacks bound to
+    keyboard shortcuts.
+
+    Shortcuts are written as one or more comma-separated chords. A chord
+    is any number of modifier keys (Ctrl, Shift, Alt, Meta) and exactly
+    one other key, joined by "+":
+        >>> hotkeys = Hotkeys()
+        >>> @hotkeys.bind("Ctrl+Shift+P")
+        ... def command_palette(sender, app_data, user_data): ...
+        >>> hotkeys.bind("Ctrl+K, Ctrl+S", save_all)
+
+    Key names are `KeyInput` member names, and are case-insensitive.
+    Digits and some punctuation can be written as-is ("Ctrl+1",
+    "Ctrl+/"). Left and right modifier keys are treated the same, and
+    chords only match when exactly the chord's modifiers are held, so
+    "Ctrl+K" does not match while Shift is also held.
+
+    Shortcuts are stored in a trie that is walked one chord at a time,
+    as keys are pressed, so matching takes constant time per event and
+    does not depend on the number of bound shortcuts. Nothing is polled
+    per frame. A sequence in progress is abandoned when a chord does not
+    continue it (in which case the chord may start another sequence),
+    or when the next chord isn't pressed within *timeout* seconds.
+    Holding a key down does not repeat it.
+
+    Callbacks run in the thread that runs handler callbacks. They
+    are sent the registry as `sender`, the shortcut they were bound to
+    as `app_data`, and the *user_data* they were bound with. When one
+    shortcut is the beginning of another (i.e. "Ctrl+K" and "Ctrl+K,
+    Ctrl+S"), callbacks of the shorter one run when it is pressed, and
+    the longer sequence can still be completed.
+
+    Like `KeyPoller`, iterating the registry yields the keys held down
+    from oldest to newest.
+    """
+    def __init__(self, *args, timeout: float = 1.5, **kwargs) -> None:
+        """Args:
+            * timeout: The maximum time between chords of a sequence, in
+            fractional seconds.
+        """
+        super().__init__(*args, **kwargs)
+        self.timeout    = timeout
+        self._root      = _HotkeyNode()
+        self._node      = self._root
+        self._ts_chord  = 0.0
+        self._modifiers = 0
+        self._held: dict[int, int] = {}
+        self._subscribe(InputEvent.KEY_DOWN, self._cb_key_down)
+        self._subscribe(InputEvent.KEY_UP, self._cb_key_up)
+
+    @overload
+    def bind(self, hotkey: str, callback: Callable, /, *, user_data: Any = None) -> Callable: ...
+    @overload
+    def bind(self, hotkey: str, /, *, user_data: Any = None) -> Callable[[Callable], Callable]: ...
+    def bind(self, hotkey: str, callback: Callable | None = None, /, *, user_data: Any = None) -> Any:
+        """Bind a callback to a shortcut. Return the callback.
+
+        Args:
+            * hotkey: A shortcut, i.e. "Ctrl+S" or "Ctrl+K, Ctrl+S".
+
+            * callback: The callback to run when the shortcut is
+            pressed. If not included, this method returns a decorator.
+
+            * user_data: Sent to the callback as `user_data`.
+
+
+        Raises `ValueError` if *hotkey* cannot be parsed.
+        """
+        chords = _parse_hotkey(hotkey)
+
+        def bind_hotkey(callback: Callable):
+            with self.lock:
+                node = self._root
+                for chord in chords:
+                    try:
+                        node = node.children[chord]
+                    except KeyError:
+                        node.children[chord] = child = _HotkeyNode()
+                        node = child
+                node.callbacks.append((hotkey, callback, user_data))
+            return callback
+
+        if callback is None:
+            return bind_hotkey
+        return bind_hotkey(callback)
+
+    def unbind(self, hotkey: str, callback: Callable | None = None) -> int:
+        """Remove callbacks bound to a shortcut. Return the number of
+        callbacks removed.
+
+        Args:
+            * hotkey: The shortcut.
+
+            * callback: The callback to remove. If None, all callbacks
+            bound to the shortcut are removed.
+        """
+        chords = _parse_hotkey(hotkey)
+        with self.lock:
+            path = [self._root]
+            for chord in chords:
+                try:
+                    path.append(path[-1].children[chord])
+                except KeyError:
+                    return 0
+            node  = path[-1]
+            count = len(node.callbacks)
+            node.callbacks[:] = [
+                entry for entry in node.callbacks
+                if callback is not None and entry[1] != callback
+            ]
+            count -= len(node.callbacks)
+            # prune empty branches
+            for chord, (parent, child) in zip(reversed(chords), reversed(tuple(zip(path, path[1:])))):
+                if child.children or child.callbacks:
+                    break
+                del parent.children[chord]
+                if self._node is child:
+                    self._node = self._root
+        return count
+
+    def hotkeys(self) -> list[str]:
+        """Return all bound shortcuts."""
+        with self.lock:
+            result = []
+            nodes  = [self._root]
+            while nodes:
+                node = nodes.pop()
+                result.extend(dict.fromkeys(h for h, _, _ in node.callbacks))
+                nodes.extend(node.children.values())
+            return result
+
+    def reset(self) -> None:
+        """Abandon the sequence in progress."""
+        with self.lock:
+            self._node = self._root
+
+    def _cb_key_down(self, handler: Item, key_info: tuple[int, float]):
+        key = key_info[0]
+        with self.lock:
+            if key in self._held:
+                return  # held down
+            mod = _MODIFIER_KEYS.get(key, 0)  # type: ignore
+            self._held[key] = mod
+            self._inputs.append(_KEYCODE_MAP.get(key, key))
+            if mod:
+                self._modifiers |= mod
+                return
+
+            chord = self._modifiers << 16 | key
+            ts    = time.perf_counter()
+            node  = self._node
+            if node is not self._root and ts - self._ts_chord > self.timeout:
+                node = self._root
+            try:
+                node = node.children[chord]
+            except KeyError:
+                # may start another sequence
+                node = self._root.children.get(chord, self._root)
+            self._ts_chord = ts
+            self._node = node if node.children else self._root
+            callbacks = node.callbacks[:]
+
+        if callbacks:
+            api.Runtime.run_callback_queue([
+                (callback, self, hotkey, user_data)
+                for hotkey, callback, user_data in callbacks
+            ])
+
+    def _cb_key_up(self, handler: Item, key: int):
+        with self.lock:
+            if key not in self._held:
+                return
+            self._inputs.remove(key)
+            if self._held.pop(key):
+                self._modifiers = 0
+                for mod in self._held.values():
+                    self._modifiers |= mod
+
+
 class MousePoller(_InputPoller):
     """A global handler registry that polls and caches mouse
     inputs.
@@ -666,14 +2416,19 @@ class MousePoller(_InputPoller):
     "Push"/"click" events are captured as individual "down"
     and "up" events.
     """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, coalesce: bool = False, **kwargs) -> None:
+        """Args:
+            * coalesce: If True, `cursor_pos`, `last_drag_delta`, and
+            `last_scroll` are updated at most once per frame instead of
+            for every input (see `InputHub`). `last_scroll` is then the
+            sum of the wheel inputs of the frame.
+        """
         super().__init__(*args, **kwargs)
-        with self:
-            items.mvMouseDownHandler(callback=self._cb_mouse_down)
-            items.mvMouseReleaseHandler(callback=self._cb_mouse_up)
-            items.mvMouseWheelHandler(callback=self._cb_mouse_scroll)
-            items.mvMouseMoveHandler(callback=self._cb_mouse_move)
-            items.mvMouseDragHandler(callback=self._cb_mouse_drag)
+        self._subscribe(InputEvent.MOUSE_DOWN, self._cb_mouse_down)
+        self._subscribe(InputEvent.MOUSE_UP, self._cb_mouse_up)
+        self._subscribe(InputEvent.MOUSE_V_SCROLL, self._cb_mouse_scroll, coalesce=coalesce)
+        self._subscribe(InputEvent.MOUSE_MOVE, self._cb_mouse_move, coalesce=coalesce)
+        self._subscribe(InputEvent.MOUSE_DRAG, self._cb_mouse_drag, coalesce=coalesce)
 
 
     last_pressed = 0
@@ -684,7 +2439,6 @@ class MousePoller(_InputPoller):
             self.last_pressed = mkey
             if mkey not in self._inputs:
                 self._inputs.append(mkey)
-            Py_DECREF(key_info)
 
 
     last_released = 0
@@ -701,7 +2455,6 @@ class MousePoller(_InputPoller):
 
     def _cb_mouse_scroll(self, handler: Item, mscroll: int):
         self.last_scroll = mscroll
-        Py_DECREF(mscroll)
 
 
     last_drag_delta = (0, 0.0, 0.0)
@@ -709,14 +2462,12 @@ class MousePoller(_InputPoller):
     def _cb_mouse_drag(self, handler: Item, mdrag_info: tuple[int, float, float]):
         mkey, dt_xpos, dt_ypos =  mdrag_info
         self.last_drag_delta = _PTRCODE_MAP[mkey], dt_xpos, dt_ypos
-        Py_DECREF(mdrag_info)
 
 
     cursor_pos = (0.0, 0.0)
 
     def _cb_mouse_move(self, handler: Item, pos: tuple[float, float]):
         self.cursor_pos = pos
-        Py_DECREF(pos)
 
 
 
@@ -769,6 +2520,10 @@ def _count_pargs(_callable: Callable):
     return pos_arg_cnt
 
 
+# (positional argument count, override bitmask) -> compiled `Callback.__call__`
+_callback_trampolines: dict[tuple[int, int], Callable] = {}
+
+
 
 
 class Callback(ItemInterface):
@@ -796,10 +2551,13 @@ class Callback(ItemInterface):
     logic, no comparisons - no other code is executed. Instead, the
     overhead is "front-loaded" onto the first call to the wrapper
     proceeding an update to the assigned callback or overridding
-    arguments; compiling a new `__call__` method using the current
+    arguments; creating a new `__call__` method using the current
     state of the wrapper. Updating the wrapper's state will force the
     creation of a new `__call__` method on the next call to the wrapper.
     This can be done beforehand by calling the `.prepare` method.
+    The code of these methods is compiled once per "shape" (number of
+    arguments sent to the callback and which are overridden) and shared
+    by all wrappers, so creating one is cheap.
 
     The wrapper holds a non-reentrant lock for all reads and writes
     to help maintain thread safety. The lock is not held when the
@@ -983,9 +2741,34 @@ class Callback(ItemInterface):
             self.prepare()
             self.__call__(*args)
 
+    @classmethod
+    def _trampoline(cls, arg_count: int, overrides: int) -> Callable:
+        # Return the shared `__call__` template for a wrapper shape. The
+        # template's closure holds placeholders; wrappers create functions
+        # from its code with their own closure cells.
+        try:
+            return _callback_trampolines[arg_count, overrides]
+        except KeyError:
+            pass
+        # mimic what DPG does and only send args if the callback
+        # can accept them
+        callback_args = (
+            ovrrd_arg if overrides & (1 << i) else passed_arg
+            for i, (passed_arg, ovrrd_arg) in enumerate(cls.__CALLBACK_ARGS[:arg_count])
+        )
+        trampoline = _tools.create_function(
+            '__call__',
+            cls.__CALL_ARGS,
+            (f'_callback({", ".join(callback_args)})',),
+            None,
+            globals=globals(),
+            locals=dict.fromkeys(('_callback', *cls.__CALL_LCLS)),
+        )
+        return _callback_trampolines.setdefault((arg_count, overrides), trampoline)
+
     def prepare(self):
-        """Write, compile, and set this object's `__call__` method, binding
-        any positional argument overrides.
+        """Create and set this object's `__call__` method, binding any
+        positional argument overrides.
 
         This is done automatically when the object is first called after
         updating the "callback" or positional argument override attributes.
@@ -994,30 +2777,69 @@ class Callback(ItemInterface):
         with self._lock:
             callback = self.__wrapped__
             try:
-                arg_count = _count_pargs(callback)  # type:ignore
+                arg_count = api._callback_arity(callback)  # type:ignore
             except TypeError:
                 raise TypeError(f"`callback` value must be callable.")
             except ValueError:
                 raise ValueError(f"unable to get `callback` value signature")
 
-            # mimic what DPG does and only send args if the callback
-            # can accept them
-            call_locals = dict(zip(self.__CALL_LCLS, self._call_args))
-            call_locals['_callback'] = callback
-            callback_args = (
-                passed_arg if call_locals[ovrrd_arg] is _empty else ovrrd_arg
-                for passed_arg, ovrrd_arg in self.__CALLBACK_ARGS[:arg_count]
+            call_args = self._call_args
+            overrides = 0
+            for i in range(arg_count):
+                if call_args[i] is not _empty:
+                    overrides |= 1 << i
+            trampoline = self._trampoline(arg_count, overrides)
+
+            cell_values = dict(zip(self.__CALL_LCLS, call_args))
+            cell_values['_callback'] = (
+                callback if api._callback_hook is None else api._callback_hook(callback)
             )
-            __call__ = _tools.create_function(
+            code     = trampoline.__code__
+            __call__ = types.FunctionType(
+                code,
+                trampoline.__globals__,
                 '__call__',
-                self.__CALL_ARGS,
-                (f'_callback({", ".join(callback_args)})',),
-                None,
-                globals=globals(),
-                locals=call_locals,
+                trampoline.__defaults__,
+                tuple(types.CellType(cell_values[name]) for name in code.co_freevars),
             )
             self.__call__ = MethodType(__call__, self)
-            self.__code__ = self.__call__.__code__  # type:ignore
+            self.__code__ = code
+
+
+class _CallStackList(list):
+    # `CallStack.callbacks`. Editing it clears the stack's fused function,
+    # so kept references to the list can't leave the stack calling stale
+    # contents.
+    __slots__ = ('_stack',)
+
+    def __init__(self, stack: 'CallStack'):
+        super().__init__()
+        self._stack = stack
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    for _name in (
+        '__setitem__',
+        '__delitem__',
+        '__iadd__',
+        '__imul__',
+        'append',
+        'extend',
+        'insert',
+        'pop',
+        'remove',
+        'clear',
+        'sort',
+        'reverse',
+    ):
+        def _edit(self, *args, __method=getattr(list, _name), **kwargs):
+            result = __method(self, *args, **kwargs)
+            self._stack._fused_call = None
+            return result
+        _edit.__name__ = _edit.__qualname__ = _name
+        locals()[_name] = _edit
+    del _name, _edit
 
 
 class CallStack(Callback):
@@ -1068,8 +2890,19 @@ class CallStack(Callback):
 
     The underlying lock IS reentrant, unlike the lock used by
     `Callback` objects.
+
+    Stacks created with `fused=True` (or whose `.fused` attribute is
+    set to True) compile their contents into a single function that
+    calls each callback in turn, with stack-level argument overrides
+    resolved beforehand. Calling the stack then only calls that
+    function; the lock is not acquired and the stack is not copied.
+    The function is rebuilt on the next call after the stack is
+    changed (including through `.callbacks`), which makes this mode a good fit for stacks that are
+    called much more often than they are edited. Like the above
+    "snapshot", changes made while the stack is running only apply
+    to the next call.
     """
-    __slots__ = ("_callbacks",)
+    __slots__ = ("_callbacks", "_fused_call", "fused")
 
     def __init_subclass__(cls):
         super().__init_subclass__()
@@ -1086,6 +2919,7 @@ class CallStack(Callback):
         user_data: Any  | Empty = _empty,
         *,
         priority : int         = 1,
+        fused    : bool        = False,
     ) -> None:
         """Args:
             * iterable: Inital contents for the stack.
@@ -1101,6 +2935,9 @@ class CallStack(Callback):
 
             * priority: Numeric value used for rich comparisons.
 
+            * fused: If True, call the stack's contents through a single
+            compiled function.
+
         The *priority* value is used when comparing the wrapper to other
         objects; useful when used with priority queues.
         """
@@ -1108,6 +2945,9 @@ class CallStack(Callback):
         # of deadlocking -- mainly due to the object being iterable
         self._lock       = threading.RLock()
         self._call_args  = (sender, app_data, user_data)
+        self._callbacks  = _CallStackList(self)
+        self._fused_call = None
+        self.fused       = fused
         self.priority    = priority
         self.extend(iterable)
 
@@ -1119,13 +2959,19 @@ class CallStack(Callback):
     @overload
     def __call__(self, sender: Item = 0, app_data: Any = None, user_data: Any = None, /) -> None: ...  # type:ignore
     def __call__(self, sender: Item = 0, app_data: Any = None, user_data: Any = None, *args) -> None:
+        if self.fused:
+            fused_call = self._fused_call
+            if fused_call is None:
+                fused_call = self._fuse()
+            fused_call(sender, app_data, user_data)
+            return
         # The lock is not held during execution so callbacks can
         # edit the stack without issue.
         with self._lock:
             # Creating a shallow-copy of the queue is the easiest
             # way to make this op thread-safe while solving key
             # problems. Not the most performant, though...
-            callbacks = self.callbacks.copy()
+            callbacks = self._callbacks.copy()
             sender, app_data, user_data = [  # type: ignore
                 passed_arg if ovrrd_arg is _empty else ovrrd_arg
                 for passed_arg, ovrrd_arg in zip((sender, app_data, user_data), self._call_args)
@@ -1142,7 +2988,10 @@ class CallStack(Callback):
     def __exit__(self, *args):
         self._lock.release()
 
-    callbacks: Property[list[Callable]] = _tools.simpleproperty()
+    @property
+    def callbacks(self) -> list[Callable]:
+        """[get] Return the underlying callback container."""
+        return self._callbacks
 
     @property
     def callback(self):
@@ -1160,7 +3009,7 @@ class CallStack(Callback):
     @override
     def configure(self, **kwargs):
         with self._lock:
-            call_args = (
+            call_args = tuple(
                 kwargs.pop(k, v)
                 for k, v in zip(
                     (_CallArgs.SENDER, _CallArgs.APP_DATA, _CallArgs.USER_DATA),
@@ -1172,7 +3021,8 @@ class CallStack(Callback):
                     f'{self.configure.__name__}() got unexpected keyword '
                     f'argument(s) {", ".join(repr(k) for k in kwargs)}.'
                 )
-            self._call_args  = tuple(call_args)
+            self._call_args  = call_args
+            self._fused_call = None
 
     @override
     def configuration(self):
@@ -1188,6 +3038,37 @@ class CallStack(Callback):
 
     # [ INTERNAL HELPERS ]
 
+    __FUSED_LCLS = (
+        f'_{_CallArgs.SENDER}_OVERRIDE',
+        f'_{_CallArgs.APP_DATA}_OVERRIDE',
+        f'_{_CallArgs.USER_DATA}_OVERRIDE',
+    )
+
+    def _fuse(self) -> Callable[[Item, Any, Any], None]:
+        # compile the current contents and overrides into one function
+        with self._lock:
+            callbacks = self._callbacks
+            call_locals = {f'_callback_{i}': cb for i, cb in enumerate(callbacks)}
+            call_args = ', '.join(
+                passed_arg if ovrrd_value is _empty else ovrrd_arg
+                for passed_arg, ovrrd_arg, ovrrd_value in zip(
+                    (_CallArgs.SENDER, _CallArgs.APP_DATA, _CallArgs.USER_DATA),
+                    self.__FUSED_LCLS,
+                    self._call_args,
+                )
+            )
+            call_locals.update(zip(self.__FUSED_LCLS, self._call_args))
+            fused_call = _tools.create_function(
+                'fused_call',
+                (_CallArgs.SENDER, _CallArgs.APP_DATA, _CallArgs.USER_DATA),
+                [f'_callback_{i}({call_args})' for i in range(len(callbacks))] or ['pass'],
+                None,
+                globals=globals(),
+                locals=call_locals,
+            )
+            self._fused_call = fused_call
+        return fused_call
+
     def _prepped_callback(self, value: Callable):
         if (
             not hasattr(value, _CALLBACK_MARKER)
@@ -1205,27 +3086,27 @@ class CallStack(Callback):
 
     def __bool__(self) -> bool:
         with self._lock:
-            return len(self.callbacks) == 0
+            return len(self._callbacks) == 0
 
     def __len__(self) -> int:
         with self._lock:
-            return len(self.callbacks)
+            return len(self._callbacks)
 
     def __iter__(self):
         with self._lock:
-            yield from self.callbacks
+            yield from self._callbacks
 
     def __reversed__(self):
         with self._lock:
-            yield from self.callbacks.__reversed__()
+            yield from self._callbacks.__reversed__()
 
     def __contains__(self, value: Any):
         with self._lock:
-            return value in self.callbacks
+            return value in self._callbacks
 
     def __getitem__(self, index: SupportsIndex):
         with self._lock:
-            return self.callbacks[index]
+            return self._callbacks[index]
 
     def __setitem__(self, index: SupportsIndex, value: Callable):
         with self._lock:
@@ -1237,7 +3118,7 @@ class CallStack(Callback):
 
     def count(self, value: Any):
         with self._lock:
-            return self.callbacks.count(value)
+            return self._callbacks.count(value)
 
     def insert(self, index: SupportsIndex, value: Callable):
         value = self._prepped_callback(value)
@@ -1289,6 +3170,7 @@ class CallStack(Callback):
         copy = type(self)(
             (),
             priority=self.priority,
+            fused=self.fused,
             **self.configuration()  # holds lock
         )
         with self._lock:
@@ -1373,44 +3255,31 @@ def cooldown(timer_fn: Callable[[], _N], interval: _N, callback: Any = None, /,
 
     By default, the target callback's metadata is passed onto
     the returned wrapper via `functools.wraps`. When the *no_args*
-    flag is set, the `.__next__` method of the underlying generator
-    object is returned instead of a wrapper function. In this case,
-    metadata is not copied over.
+    flag is set, metadata is not copied over.
 
     This function does not create or utilize threads.
     """
     def capture_callback(callback: Callable) -> Callable:
-        if no_args:
+        ts_last_update = timer_fn() - interval
 
-            def recurring_tasker():  # type: ignore
-                ts_last_update = timer_fn() - interval
-                while True:
-                    ts_this_update = timer_fn()
-                    if ts_this_update - ts_last_update >= interval:
-                        ts_last_update = ts_this_update
-                        callback()
-                    yield
+        if no_args:
 
-            dispatcher = recurring_tasker().__next__  # type: ignore
+            def dispatcher() -> None:  # type: ignore
+                nonlocal ts_last_update
+                ts_this_update = timer_fn()
+                if ts_this_update - ts_last_update >= interval:
+                    ts_last_update = ts_this_update
+                    callback()
 
         else:
 
-            def recurring_tasker():
-                ts_last_update = timer_fn() - interval
-                args, kwds = yield
-                while True:
-                    ts_this_update = timer_fn()
-                    if ts_this_update - ts_last_update >= interval:
-                        ts_last_update = ts_this_update
-                        callback(*args, **kwds)
-                    args, kwds = yield
-
             @functools.wraps(callback)
             def dispatcher(*args, **kwargs) -> None:
-                _dispatcher.send((args, kwargs))
-
-            _dispatcher = recurring_tasker()
-            next(_dispatcher)  # prime generator
+                nonlocal ts_last_update
+                ts_this_update = timer_fn()
+                if ts_this_update - ts_last_update >= interval:
+                    ts_last_update = ts_this_update
+                    callback(*args, **kwargs)
 
         return dispatcher
 
@@ -1436,6 +3305,172 @@ def cooldown_s(interval: _N, callback: Any = None, /, no_args: bool = False):  #
     return cooldown(time.perf_counter, interval, callback, no_args=no_args)
 
 
+def _dpg_dispatcher(callback: Callable, dispatch: Callable[[tuple], Any]) -> Callable:
+    # Dear PyGui sends positional arguments based on the callable's
+    # `__code__.co_argcount`, so the wrapper must accept exactly what
+    # the target callback does.
+    try:
+        arg_count = _count_pargs(callback)
+    except ValueError:  # built-in
+        arg_count = 3
+    params = (_CallArgs.SENDER, _CallArgs.APP_DATA, _CallArgs.USER_DATA)[:arg_count]
+    dispatcher = _tools.create_function(
+        'dispatcher',
+        tuple(f'{p}=None' for p in params),
+        (f'_dispatch(({"".join(f"{p}, " for p in params)}))',),
+        None,
+        globals=globals(),
+        locals={'_dispatch': dispatch},
+    )
+    # `__code__` is not copied
+    functools.update_wrapper(dispatcher, callback)
+    return dispatcher
+
+
+@overload
+def throttle(interval: float, /, *, leading: bool = True, trailing: bool = True) -> Callable[[Callable[_P, Any]], Callable[_P, None]]: ...
+@overload
+def throttle(interval: float, callback: Callable[_P, Any], /, *, leading: bool = True, trailing: bool = True) -> Callable[_P, None]: ...
+def throttle(interval: float, callback: Any = None, /, *, leading: bool = True, trailing: bool = True):
+    """Return a wrapper that executes the target callable at most once
+    per *interval* seconds, regardless of how often the wrapper is
+    called.
+
+    Can be used as a function decorator.
+
+    Args:
+        * interval: Minimum time between executions, in fractional
+        seconds.
+
+        * callback: The target callable to throttle. The wrapper
+        accepts the same positional arguments as it (up to three), and
+        is callable by Dear PyGui.
+
+        * leading: If True, the first call in a burst executes the
+        target immediately.
+
+        * trailing: If True, the last call made while the target is
+        throttled executes it when the interval elapses.
+
+
+    Trailing calls are executed using `api.Runtime.call_later`, so
+    they run in the main thread and require the runtime's event loop
+    to be running (or `api.Runtime.run_timers` to be called in a
+    manual loop). When *leading* is True, leading calls execute in
+    the calling thread.
+    """
+    def capture_callback(callback: Callable) -> Callable:
+        lock     = threading.Lock()
+        pending  = None   # arguments of the latest throttled call
+        cooling  = False
+        call_later = api.Runtime.call_later
+
+        def on_cooldown():
+            nonlocal pending, cooling
+            with lock:
+                args, pending = pending, None
+                if args is None or not trailing:
+                    cooling = False
+                    return
+                call_later(interval, on_cooldown)
+            callback(*args)
+
+        def dispatch(args: tuple):
+            nonlocal pending, cooling
+            with lock:
+                if cooling:
+                    pending = args
+                    return
+                cooling = True
+                call_later(interval, on_cooldown)
+                if not leading:
+                    pending = args
+                    return
+            callback(*args)
+
+        return _dpg_dispatcher(callback, dispatch)
+
+    if callback is None:
+        return capture_callback
+    return capture_callback(callback)
+
+
+@overload
+def debounce(interval: float, /, *, leading: bool = False, trailing: bool = True) -> Callable[[Callable[_P, Any]], Callable[_P, None]]: ...
+@overload
+def debounce(interval: float, callback: Callable[_P, Any], /, *, leading: bool = False, trailing: bool = True) -> Callable[_P, None]: ...
+def debounce(interval: float, callback: Any = None, /, *, leading: bool = False, trailing: bool = True):
+    """Return a wrapper that delays executing the target callable
+    until *interval* seconds have passed since the wrapper was last
+    called. Useful for reacting to text input, resizing, etc. only
+    once the user is done.
+
+    Can be used as a function decorator.
+
+    Args:
+        * interval: Quiet period required before executing, in
+        fractional seconds.
+
+        * callback: The target callable to debounce. The wrapper
+        accepts the same positional arguments as it (up to three), and
+        is callable by Dear PyGui.
+
+        * leading: If True, the first call in a burst executes the
+        target immediately.
+
+        * trailing: If True, the target is executed using the
+        arguments of the last call in a burst once the burst ends.
+
+
+    Each burst schedules a single timer via `api.Runtime.call_later`
+    regardless of how many calls it contains; calls only update the
+    deadline. Trailing calls run in the main thread and require the
+    runtime's event loop to be running (or `api.Runtime.run_timers`
+    to be called in a manual loop).
+    """
+    def capture_callback(callback: Callable) -> Callable:
+        lock     = threading.Lock()
+        pending  = None   # arguments of the latest call
+        deadline = 0.0
+        armed    = False
+        # read at call time; `Runtime.step` and `Runtime.start` swap the
+        # wheel's clock
+        clock    = api.Runtime.timers.now
+        call_later = api.Runtime.call_later
+
+        def on_timer():
+            nonlocal pending, armed
+            with lock:
+                remaining = deadline - clock()
+                if remaining > 0:
+                    call_later(remaining, on_timer)
+                    return
+                armed = False
+                args, pending = pending, None
+            if args is not None and trailing:
+                callback(*args)
+
+        def dispatch(args: tuple):
+            nonlocal pending, deadline, armed
+            with lock:
+                deadline = clock() + interval
+                if armed:
+                    pending = args
+                    return
+                armed = True
+                call_later(interval, on_timer)
+                if not leading:
+                    pending = args
+                    return
+            callback(*args)
+
+        return _dpg_dispatcher(callback, dispatch)
+
+    if callback is None:
+        return capture_callback
+    return capture_callback(callback)
+
+
 def root_ihandler_registry(item: Item) -> items.mvItemHandlerRegistry:
     """Return the item handler registry bound to an item's
     root parent. If unbound, create a new registry,
@@ -1450,12 +3485,275 @@ def root_ihandler_registry(item: Item) -> items.mvItemHandlerRegistry:
     return items.mvItemHandlerRegistry.new(root_ihr)
 
 
+class FillTarget:
+    """A handle to a target of a `FillLayout` service."""
+    __slots__ = ('item', '_layout')
+
+    def __init__(self, layout: 'FillLayout', item: Item):
+        self.item    = item
+        self._layout = layout
+
+    def __repr__(self):
+        return f"<{type(self).__qualname__}(item={self.item!r}, active={self.active})>"
+
+    @property
+    def active(self) -> bool:
+        """Return True if the item is still sized through this handle."""
+        return self._layout._handle_of(self.item) is self
+
+    def remove(self) -> bool:
+        """Stop sizing the item. Return False if it was already removed,
+        otherwise return True. Other targets of the same root parent
+        are unaffected."""
+        return self._layout._remove(self.item, self)
+
+
+class FillLayout:
+    """Service that sizes items to fill the content region of their
+    parent whenever their root parent is resized (see
+    `resized_fill_content_region`).
+
+    Targets are grouped by root parent. Each root parent gets a single
+    `mvResizeHandler`, no matter how many targets it contains. Resizing
+    a root parent marks it as "dirty", and all targets of dirty roots
+    are then sized together in one pass from a frame callback (see
+    `Runtime.schedule_frame_callback`). Since the available space of a
+    parent is only updated once a frame is rendered, a second pass on
+    the next frame trims the targets by the scroll extents of their
+    parent. Neither pass waits on a frame, so resizing a window with
+    many targets never stalls the callback thread. Passes run under any
+    event loop, including `dearpygui.start_dearpygui()`.
+
+    Targets and parents that no longer exist are removed during the
+    next pass. A root parent's resize handler is owned by the service
+    and shared by all of its targets; it is deleted when the root
+    parent no longer has any targets. Remove a single target using the
+    `FillTarget` handle returned by `.add`, or `.remove`.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # root -> (resize handler, {target: (parent, autosize_x, autosize_y, scrolls, handle)})
+        self._roots: dict[Item, tuple[items.ResizeHandler, dict[Item, tuple[Item, bool, bool, bool, FillTarget]]]] = {}
+        self._dirty: set[Item] = set()
+        self._settling: set[Item] = set()
+        self._handle: api.ScheduledCallback | None = None
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(len(targets) for _, targets in self._roots.values())
+
+    def __contains__(self, item: Item) -> bool:
+        with self.lock:
+            return any(item in targets for _, targets in self._roots.values())
+
+    def add(self, item: Item, *, autosize_x: bool = True, autosize_y: bool = True) -> FillTarget:
+        """Add a target. Return a handle that can be used to remove it.
+        The target is sized on the next frame, and whenever the root
+        parent is resized. Adding a target again replaces it.
+
+        Args:
+            * item: Target item to resize.
+
+            * autosize_x: If True, the target item's width will be
+            adjusted to fill its' parent's available space.
+
+            * autosize_y: If True, the target item's height will be
+            adjusted to fill its' parent's available space.
+
+
+        Raises `TypeError` if the target cannot be sized (refer to
+        `resized_fill_content_region`).
+        """
+        item        = _interface.mvAll(item)
+        item_config = item.configuration()
+        item_info   = item.information()
+        if (
+            (autosize_x and "width" not in item_config) or
+            (autosize_y and "height" not in item_config)
+        ):
+            raise TypeError(
+                f"{item_info['type'].split('::')[1]!r} item {item!r} cannot be sized."
+            )
+
+        parent = item_info['parent']
+        if not parent:
+            raise TypeError(
+                f"target cannot be a top-level root item."
+            )
+        parent = _interface.mvAll(parent)
+
+        if not parent.state()['content_region_avail']:
+            _parent_tp = parent.information()['type'].split('::')[1]
+            raise TypeError(
+                f"parent {_parent_tp!r} item does not have a content region."
+            )
+
+        try:
+            parent.get_x_scroll_pos()
+        except:
+            scrolls = False
+        else:
+            scrolls = True
+
+        root_parent = cast(_interface.mvAll, item.root_parent)
+        root_info   = root_parent.information()
+        if not root_info['resized_handler_applicable']:
+            raise TypeError(
+                f"top-level parent {root_info['type'].split('::')[1]!r} item "
+                f"does not support resize handlers."
+            )
+
+        with self.lock:
+            try:
+                handler, targets = self._roots[root_parent]
+            except KeyError:
+                handler = None
+            if handler is None or not dearpygui.does_item_exist(handler):
+                root_ihr = root_info['handlers']
+                if not root_ihr:
+                    root_ihr = ItemHandlerRegistry()
+                    api.Item.set_handlers(root_parent, root_ihr)
+                handler = items.ResizeHandler(
+                    callback=self._cb_root_resized,
+                    user_data=root_parent,
+                    parent=root_ihr,
+                )
+                targets = {}
+                self._roots[root_parent] = (handler, targets)
+            # a target is only in one root's targets
+            for root, (_, root_targets) in tuple(self._roots.items()):
+                if item in root_targets and root_targets is not targets:
+                    del root_targets[item]
+                    if not root_targets:
+                        self._release_root(root)
+            handle = FillTarget(self, item)
+            targets[item] = (parent, autosize_x, autosize_y, scrolls, handle)
+            self._schedule(root_parent)
+        return handle
+
+    def remove(self, item: Item) -> bool:
+        """Remove a target. Return True if *item* was a target.
+
+        Args:
+            * item: The target item.
+        """
+        return self._remove(item, None)
+
+    def update(self) -> None:
+        """Size all targets now. Must be called from the main thread."""
+        with self.lock:
+            self._dirty.update(self._roots)
+        self._run()
+
+    # [ INTERNAL HELPERS ]
+
+    def _handle_of(self, item: Item) -> FillTarget | None:
+        with self.lock:
+            for _, targets in self._roots.values():
+                if item in targets:
+                    return targets[item][4]
+        return None
+
+    def _remove(self, item: Item, handle: FillTarget | None) -> bool:
+        with self.lock:
+            for root, (_, targets) in tuple(self._roots.items()):
+                if item in targets:
+                    if handle is not None and targets[item][4] is not handle:
+                        return False
+                    del targets[item]
+                    if not targets:
+                        self._release_root(root)
+                    return True
+        return False
+
+    def _cb_root_resized(self, sender: Item, app_data: Any, root: Item):
+        with self.lock:
+            self._schedule(root)
+
+    def _schedule(self, root: Item):
+        # lock held by caller
+        self._dirty.add(root)
+        if self._handle is None:
+            self._handle = api.Runtime.schedule_frame_callback(self._run)
+
+    def _release_root(self, root: Item):
+        # lock held by caller
+        handler, _ = self._roots.pop(root)
+        self._dirty.discard(root)
+        self._settling.discard(root)
+        if dearpygui.does_item_exist(handler):
+            dearpygui.delete_item(handler)
+
+    def _run(self):
+        with self.lock:
+            self._handle = None
+            settling, self._settling = self._settling, set()
+            dirty, self._dirty = self._dirty, set()
+            # roots sized this frame are trimmed on the next one
+            self._settling.update(dirty)
+            if self._settling:
+                self._handle = api.Runtime.schedule_frame_callback(self._run, delay=1)
+            work = [
+                (root, tuple(self._roots[root][1].items()), root in dirty)
+                for root in (*settling, *dirty.difference(settling))
+                if root in self._roots
+            ]
+
+        get_item_state   = dearpygui.get_item_state
+        configure_item   = dearpygui.configure_item
+        does_item_exist  = dearpygui.does_item_exist
+        get_x_scroll_max = dearpygui.get_x_scroll_max
+        get_y_scroll_max = dearpygui.get_y_scroll_max
+        removed = []
+        for root, targets, resize in work:
+            avail_cache: dict[Item, tuple[int, int]] = {}
+            for item, (parent, autosize_x, autosize_y, scrolls, _) in targets:
+                try:
+                    try:
+                        avail_wt, avail_ht = avail_cache[parent]
+                    except KeyError:
+                        avail_wt, avail_ht = avail_cache[parent] = get_item_state(parent)['content_region_avail']
+                    if not resize and scrolls:
+                        # settling pass
+                        avail_wt = max(1, avail_wt - get_x_scroll_max(parent))
+                        avail_ht = max(1, avail_ht - get_y_scroll_max(parent))
+                    if autosize_x and autosize_y:
+                        configure_item(item, width=avail_wt, height=avail_ht)
+                    elif autosize_x:
+                        configure_item(item, width=avail_wt)
+                    elif autosize_y:
+                        configure_item(item, height=avail_ht)
+                except SystemError:
+                    if does_item_exist(item) and does_item_exist(parent):
+                        raise
+                    removed.append((root, item))
+
+        if removed:
+            with self.lock:
+                for root, item in removed:
+                    try:
+                        targets = self._roots[root][1]
+                    except KeyError:
+                        continue
+                    targets.pop(item, None)
+                    if not targets:
+                        self._release_root(root)
+
+
+_fill_layout = FillLayout()
+
+def fill_layout() -> FillLayout:
+    """Return the `FillLayout` service used by `resized_fill_content_region`."""
+    return _fill_layout
+
+
 def resized_fill_content_region(
     item: Item,
     *,
     autosize_x : bool = True,
     autosize_y : bool = True,
-) -> items.ResizeHandler:
+) -> FillTarget:
     """Emulate the behavior of assigning a "stretch" policy
     onto the target item; when its' root parent is resized,
     the target will be sized to consume the available space
@@ -1485,13 +3783,20 @@ def resized_fill_content_region(
         - the target item's root parent must support the
         'resized' state
 
-    This function attaches a `mvResizeHandler` onto the
-    target item's root parent. If the root parent does not
-    have a bound item handler registry, one is created and
-    assigned prior to creating and attaching the handler.
-    The created `mvResizeHandler` item is destroyed when the
-    callback is triggered and either the target item or its'
-    direct parent are destroyed.
+    The target is added to the `FillLayout` service (see
+    `fill_layout`), which attaches a single `mvResizeHandler`
+    onto the root parent for all of its' targets. If the root
+    parent does not have a bound item handler registry, one is
+    created and assigned prior to creating and attaching the
+    handler. Targets are sized on the frame following a resize,
+    and are removed from the service once the target item or
+    its' direct parent are destroyed.
+
+    Returns a `FillTarget` handle; call its `.remove` method to
+    stop sizing the target. Previously, the target's own resize
+    handler was returned and deleted to do this. The handler is
+    now shared by every target of the root parent and must not
+    be deleted.
 
     The target's root parent will almost always be a
     `mvWindowAppItem` item, which supports 'resized'. Parent
@@ -1500,109 +3805,4 @@ def resized_fill_content_region(
     any sizable item, such as a `mvButton`, `mvChildWindow`,
     or `mvPlot` item.
     """
-    item        = _interface.mvAll(item)
-    item_config = item.configuration()
-    item_info   = item.information()
-    if (
-        (autosize_x and "width" not in item_config) or
-        (autosize_y and "height" not in item_config)
-    ):
-        raise TypeError(
-            f"{item_info['type'].split('::')[1]!r} item {item!r} cannot be sized."
-        )
-
-    parent = item_info['parent']
-    if not parent:
-        raise TypeError(
-            f"target cannot be a top-level root item."
-        )
-    parent = _interface.mvAll(parent)
-
-    if not parent.state()['content_region_avail']:
-        _parent_tp = parent.information()['type'].split('::')[1]
-        raise TypeError(
-            f"parent {_parent_tp!r} item does not have a content region."
-        )
-
-    get_x_scr_max = dearpygui.get_x_scroll_max
-    get_y_scr_max = dearpygui.get_y_scroll_max
-    try:
-        parent.get_x_scroll_pos()
-    except:
-        get_x_scr_max = get_y_scr_max = lambda x: 0
-
-    root_parent = cast(_interface.mvAll, item.root_parent)
-    root_info   = root_parent.information()
-    if not root_info['resized_handler_applicable']:
-        raise TypeError(
-            f"top-level parent {root_info['type'].split('::')[1]!r} item "
-            f"does not support resize handlers."
-        )
-
-    root_ihr = root_info['handlers']
-    if not root_ihr:
-        root_ihr = ItemHandlerRegistry()
-        api.Item.set_handlers(root_parent, root_ihr)
-
-    if autosize_x and autosize_y:
-        cb_body = (
-            "avail_wt, avail_ht = parent.state()['content_region_avail']",
-            "item.configure(",
-            "    width=avail_wt,",
-            "    height=avail_ht,",
-            ")",
-            "split_frame()",
-            "avail_wt, avail_ht = parent.state()['content_region_avail']",
-            "item.configure(",
-            "    width=max(1, avail_wt - get_x_scr_max(parent)),",
-            "    height=max(1, avail_ht - get_y_scr_max(parent)),",
-            ")",
-        )
-    elif autosize_x:
-        cb_body = (
-            "item.configure(width=parent.state()['content_region_avail'][0])",
-            "split_frame()",
-            "item.configure(",
-            "    width=max(1, parent.state()['content_region_avail'][0] - get_x_scr_max(parent))",
-            ")",
-        )
-    elif autosize_y:
-        cb_body = (
-            "item.configure(height=parent.state()['content_region_avail'][1])",
-            "split_frame()",
-            "item.configure(",
-            "    height=max(1, parent.state()['content_region_avail'][1] - get_y_scr_max(parent))",
-            ")",
-        )
-    else:
-        cb_body = ("...",)
-
-    cb_body = (
-        "try:",
-        *(f'    {ln}' for ln in cb_body),
-        "except SystemError:",
-        "    if not item.exists() or not parent.exists():",
-        "        handler.callback = None",
-        "        handler.destroy()",
-        "        del callback",
-        "    else:",
-        "        raise",
-    )
-
-    handler  = items.ResizeHandler.new()
-    callback = _tools.create_function(
-        'callback',
-        (),
-        cb_body,
-        globals=globals(),
-        locals={
-            'item'            : _interface.mvAll(item),
-            'parent'          : _interface.mvAll(parent),
-            'handler'         : handler,
-            'get_x_scr_max'   : get_x_scr_max,
-            'get_y_scr_max'   : get_y_scr_max,
-            'split_frame'     : api.Runtime.split_frame,
-        }
-    )
-    handler.init(callback=callback, parent=root_ihr)
-    return handler
+    return _fill_layout.add(item, autosize_x=autosize_x, autosize_y=autosize_y)
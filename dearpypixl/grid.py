@@ -216,6 +216,22 @@ def _anchor_position_C(item_wt: float, item_ht: float, cell_x: float, cell_y: fl
     return (cell_wt - item_wt) / 2 + cell_x, (cell_ht - item_ht) / 2 + cell_y  # center x & y
 
 
+# Horizontal and vertical alignment of the built-in positioners as `(x, y)`,
+# where 0, 1 and 2 are start, center and end respectively. Lets the vector
+# solver inline them.
+_ANCHOR_ALIGNMENT: dict[_Positioner, tuple[int, int]] = {
+    _anchor_position_NW: (0, 0),
+    _anchor_position_N : (1, 0),
+    _anchor_position_NE: (2, 0),
+    _anchor_position_W : (0, 1),
+    _anchor_position_C : (1, 1),
+    _anchor_position_E : (2, 1),
+    _anchor_position_SW: (0, 2),
+    _anchor_position_S : (1, 2),
+    _anchor_position_SE: (2, 2),
+}
+
+
 
 
 @dataclasses.dataclass(slots=True)
@@ -242,6 +258,12 @@ class ItemData:
         position, and visibility status.
 
         * is_text (bool): If True, the target item an `mvText` object.
+
+        * last_rect (tuple[int, int, int, int, bool] | None): The arguments
+        (excluding the item) of the last successful *rect_setter* call,
+        as `(x_pos, y_pos, width, height, show)`. The grid does not call
+        *rect_setter* again until this changes. See `Grid.invalidate` to
+        force the next update.
     """
     item       : Item
     cellspan   : tuple[int, int, int, int]
@@ -250,11 +272,233 @@ class ItemData:
     positioner : _Positioner
     rect_setter: _RectSetter
     is_text    : bool
+    last_rect  : tuple[int, int, int, int, bool] | None = dataclasses.field(default=None, compare=False)
 
     def __hash__(self):
         return hash(self.item)
 
 
+def _slot_columns(slots: Sequence['Slot']) -> tuple[list[float], list[float], list[float], list[float]]:
+    # positions, sizes, and start/end paddings of evaluated slots
+    states = [s._state for s in slots]
+    return (
+        [st['pos'] for st in states],
+        [st['size'] for st in states],
+        [st['padding'][0] for st in states],
+        [st['padding'][1] for st in states],
+    )
+
+
+class _VectorSolver:
+    """Bulk alternative to `Grid._upd_item_states`, for grids with a large
+    number of items.
+
+    Item parameters are packed into contiguous arrays whenever the grid's
+    items or slot counts change. Item rects are then computed in bulk using
+    NumPy when it can be imported, or from the packed `array` objects
+    otherwise. Results are identical to those of the grid's own item pass,
+    and only items with a changed rect are passed to their *rect_setter*.
+
+    Text items and items with a custom positioner are updated by the grid
+    as usual.
+    """
+    __slots__ = ('_np', '_key', '_items', '_other_items', '_params', '_prev')
+
+    def __init__(self):
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        self._np  = numpy
+        self._key = None
+        self._items       = cast(list[ItemData], [])
+        self._other_items = cast(list[ItemData], [])
+        self._params = cast(tuple[Any, ...], ())
+        self._prev   = cast(Any, None)
+
+    def _pack(self, item_datas: Iterable[ItemData], n_cols: int, n_rows: int):
+        items = self._items = []
+        other = self._other_items = []
+
+        x1s, y1s, x2s, y2s = (array('q') for _ in range(4))
+        x1_pads, y1_pads, x2_pads, y2_pads, max_wts, max_hts = (array('d') for _ in range(6))
+        x_aligns, y_aligns = array('b'), array('b')
+        for item_data in item_datas:
+            if item_data.is_text or item_data.positioner not in _ANCHOR_ALIGNMENT:
+                other.append(item_data)
+                continue
+            items.append(item_data)
+            x_align, y_align = _ANCHOR_ALIGNMENT[item_data.positioner]
+
+            x1, y1, x2, y2 = item_data.cellspan
+            x1 %= n_cols
+            y1 %= n_rows
+            x2 %= n_cols
+            y2 %= n_rows
+            if y1 > y2:
+                y1, y2 = y2, y1
+            if x1 > x2:
+                x1, x2 = x2, x1
+            x1s.append(x1)
+            y1s.append(y1)
+            x2s.append(x2)
+            y2s.append(y2)
+
+            x1_pad, y1_pad, x2_pad, y2_pad = item_data.padding
+            x1_pads.append(x1_pad)
+            y1_pads.append(y1_pad)
+            x2_pads.append(x2_pad)
+            y2_pads.append(y2_pad)
+
+            max_wt, max_ht = item_data.max_size
+            max_wts.append(max_wt)
+            max_hts.append(max_ht)
+
+            x_aligns.append(x_align)
+            y_aligns.append(y_align)
+
+        params = (x1s, y1s, x2s, y2s, x1_pads, y1_pads, x2_pads, y2_pads, max_wts, max_hts, x_aligns, y_aligns)
+        np = self._np
+        if np is None:
+            self._params = params
+        else:
+            self._params = tuple(np.array(a, dtype=a.typecode) for a in params)
+            # -1 visibility marks a rect that was never applied
+            unknown = (-1, -1, -1, -1, -1)
+            columns = tuple(zip(*(d.last_rect or unknown for d in items))) or ((),) * 5
+            self._prev = (
+                *(np.array(c, dtype=np.int64) for c in columns[:4]),
+                np.array(columns[4], dtype=np.int8),
+            )
+
+    def __call__(self, grid: 'Grid'):
+        cols = grid.cols._slots
+        rows = grid.rows._slots
+
+        key = (grid._items_version, len(cols), len(rows))
+        if key != self._key:
+            self._pack(grid._item_data.values(), len(cols), len(rows))
+            self._key = key
+
+        if self._other_items:
+            grid._upd_item_states(self._other_items)
+        if self._items:
+            if self._np is None:
+                self._solve_array(grid, cols, rows)
+            else:
+                self._solve_numpy(grid, cols, rows)
+
+    def _apply(self, grid: 'Grid', item_data: ItemData, rect: tuple[int, int, int, int, bool]):
+        try:
+            item_data.rect_setter(item_data.item, *rect)
+        except SystemError:
+            if not dearpygui.does_item_exist(item_data.item):
+                grid._trashbin.add(item_data.item)
+                return
+            raise
+        item_data.last_rect = rect
+
+    def _solve_array(self, grid: 'Grid', cols: list['Slot'], rows: list['Slot']):  # XXX: performance-sensitive
+        col_pos, col_size, col_c1_pad, col_c2_pad = _slot_columns(cols)
+        row_pos, row_size, row_c1_pad, row_c2_pad = _slot_columns(rows)
+
+        apply = self._apply
+        for item_data, x1, y1, x2, y2, x1_pad, y1_pad, x2_pad, y2_pad, item_width, item_height, x_align, y_align in zip(self._items, *self._params):
+            if x1_pad != x1_pad:  # is NaN?
+                x1_pad = col_c1_pad[x1]
+            cell_x_pos = col_pos[x1] + x1_pad
+
+            if y1_pad != y1_pad:  # is NaN?
+                y1_pad = row_c1_pad[y1]
+            cell_y_pos = row_pos[y1] + y1_pad
+
+            if x2_pad != x2_pad:  # is NaN?
+                x2_pad = col_c2_pad[x2]
+            cell_width = col_pos[x2] + col_size[x2] - cell_x_pos - x2_pad
+
+            if y2_pad != y2_pad:  # is NaN? (same row as `Grid._upd_item_states`)
+                y2_pad = row_c2_pad[y1]
+            cell_height = row_pos[y2] + row_size[y2] - cell_y_pos - y2_pad
+
+            if not item_width or item_width > cell_width:
+                item_width = cell_width
+            if not item_height or item_height > cell_height:
+                item_height = cell_height
+
+            if item_width < 1 or item_height < 1:
+                item_x_pos = 0
+                item_y_pos = 0
+                item_show  = False
+            else:
+                if not x_align:
+                    item_x_pos = cell_x_pos
+                elif x_align == 1:
+                    item_x_pos = (cell_width - item_width) / 2 + cell_x_pos
+                else:
+                    item_x_pos = (cell_width - item_width) + cell_x_pos
+                if not y_align:
+                    item_y_pos = cell_y_pos
+                elif y_align == 1:
+                    item_y_pos = (cell_height - item_height) / 2 + cell_y_pos
+                else:
+                    item_y_pos = (cell_height - item_height) + cell_y_pos
+                item_show = True
+
+            rect = (int(item_x_pos), int(item_y_pos), int(item_width), int(item_height), item_show)
+            if rect != item_data.last_rect:
+                apply(grid, item_data, rect)
+
+    def _solve_numpy(self, grid: 'Grid', cols: list['Slot'], rows: list['Slot']):  # XXX: performance-sensitive
+        np    = self._np
+        where = np.where
+        isnan = np.isnan
+
+        col_pos, col_size, col_c1_pad, col_c2_pad = (np.array(c, dtype=np.float64) for c in _slot_columns(cols))
+        row_pos, row_size, row_c1_pad, row_c2_pad = (np.array(c, dtype=np.float64) for c in _slot_columns(rows))
+
+        x1, y1, x2, y2, x1_pad, y1_pad, x2_pad, y2_pad, max_wt, max_ht, x_align, y_align = self._params
+
+        # same operations (and order) as `Grid._upd_item_states`
+        cell_x  = col_pos[x1] + where(isnan(x1_pad), col_c1_pad[x1], x1_pad)
+        cell_y  = row_pos[y1] + where(isnan(y1_pad), row_c1_pad[y1], y1_pad)
+        cell_wt = col_pos[x2] + col_size[x2] - cell_x - where(isnan(x2_pad), col_c2_pad[x2], x2_pad)
+        cell_ht = row_pos[y2] + row_size[y2] - cell_y - where(isnan(y2_pad), row_c2_pad[y1], y2_pad)
+
+        item_wt = where((max_wt == 0) | (max_wt > cell_wt), cell_wt, max_wt)
+        item_ht = where((max_ht == 0) | (max_ht > cell_ht), cell_ht, max_ht)
+        show    = ~((item_wt < 1) | (item_ht < 1))
+
+        x_space = cell_wt - item_wt
+        y_space = cell_ht - item_ht
+        item_x  = where(x_align == 0, cell_x, where(x_align == 1, x_space / 2 + cell_x, x_space + cell_x))
+        item_y  = where(y_align == 0, cell_y, where(y_align == 1, y_space / 2 + cell_y, y_space + cell_y))
+
+        rect = (
+            where(show, item_x, 0.0).astype(np.int64),
+            where(show, item_y, 0.0).astype(np.int64),
+            item_wt.astype(np.int64),
+            item_ht.astype(np.int64),
+            show.astype(np.int8),
+        )
+        prev    = self._prev
+        changed = np.flatnonzero(
+            (rect[0] != prev[0])
+            | (rect[1] != prev[1])
+            | (rect[2] != prev[2])
+            | (rect[3] != prev[3])
+            | (rect[4] != prev[4])
+        )
+        if not changed.size:
+            return
+
+        items = self._items
+        apply = self._apply
+        for i, *r in zip(changed.tolist(), *(a[changed].tolist() for a in rect[:4]), show[changed].tolist()):
+            apply(grid, items[i], tuple(r))
+        for p, a in zip(prev, rect):
+            p[changed] = a[changed]
+
+
 
 
 
@@ -284,13 +528,16 @@ class _GridSetting(Generic[_T]):
 
 @dataclasses.dataclass(init=False)
 class _GridComponent:
-    __slots__ = ('_label', '_spacing', '_padding')
+    # `_version` is incremented whenever the component's settings
+    # change; see `Grid.__call__`
+    __slots__ = ('_label', '_spacing', '_padding', '_version')
 
     label  : _GridSetting[str]            = dataclasses.field(default=_GridSetting('label'))
     spacing: _GridSetting['array[float]'] = dataclasses.field(default=_GridSetting('spacing'))
     padding: _GridSetting['array[float]'] = dataclasses.field(default=_GridSetting('padding'))
 
     def __init__(self, *, label: str | None = None, spacing: FloatV = None, padding: Vec2 | FloatV = None, **kwargs):
+        self._version = 0
         self.configure(label=label, spacing=spacing, padding=padding, **kwargs)
 
     def configure(self, **kwargs) -> None:
@@ -310,6 +557,7 @@ class _GridComponent:
             else:
                 spacing = max(0.0, spacing)
             self._spacing = spacing
+        self._version += 1
 
     def configuration(self) -> dict[str, Any]:
         """Return a mapping of the object's settings and their current values."""
@@ -348,7 +596,7 @@ class Slot(_GridComponent):
     A slot is unaware of its' role in the grid (column vs row). A higher-level
     object may indicate this through its' `.label` attribute.
     """
-    __slots__ = ('_state', '_size', '_weight')
+    __slots__ = ('_state', '_size', '_weight', '_axis')
 
     weight: _GridSetting[float] = dataclasses.field(default=_GridSetting('weight'))
     size  : _GridSetting[int]   = dataclasses.field(default=_GridSetting('size'))
@@ -385,6 +633,8 @@ class Slot(_GridComponent):
                 'padding': (0, 0),
             }
         )
+        # set by the parenting `Axis`
+        self._axis: Axis | None = None
         super().__init__(weight=weight, size=size, **kwargs)
 
     @overload
@@ -395,6 +645,8 @@ class Slot(_GridComponent):
         if 'size' in kwargs:
             self._size = max(0, int(_to_value(kwargs['size'], 0)))
         super().configure(**kwargs)
+        if self._axis is not None:
+            self._axis._version += 1
 
     def configuration(self) -> dict[Literal['label', 'spacing', 'padding', 'weight', 'size'], Any]: ...
     del configuration
@@ -567,6 +819,11 @@ class Axis(_GridComponent, Iterable[Slot], Sized):
     def __iter__(self) -> Iterator[Slot]:
         yield from self._slots
 
+    def _new_slot(self) -> Slot:
+        slot = Slot()
+        slot._axis = self
+        return slot
+
     def __iadd__(self, x: int) -> Self:
         """
         >>> x = Axis(4)
@@ -584,7 +841,8 @@ class Axis(_GridComponent, Iterable[Slot], Sized):
             return self
         if x > 0:
             with self._lock:
-                self._slots.extend(Slot() for _ in range(x))
+                self._slots.extend(self._new_slot() for _ in range(x))
+                self._version += 1
                 return self
         return self.__isub__(abs(x))
 
@@ -606,6 +864,7 @@ class Axis(_GridComponent, Iterable[Slot], Sized):
         if x > 0:
             with self._lock:
                 del self._slots[-x:]
+                self._version += 1
                 return self
         return self.__iadd__(abs(x))
 
@@ -670,7 +929,8 @@ class Axis(_GridComponent, Iterable[Slot], Sized):
             * index: Position of the new slot.
         """
         with self._lock:
-            self._slots.insert(index, Slot())
+            self._slots.insert(index, self._new_slot())
+            self._version += 1
 
     def remove(self, index: SupportsIndex = -1):
         """Delete the row/column at the specified index, or the last
@@ -683,6 +943,7 @@ class Axis(_GridComponent, Iterable[Slot], Sized):
         """
         with self._lock:
             self._slots.pop(index)
+            self._version += 1
 
 
 @dataclasses.dataclass(init=False)
@@ -742,6 +1003,11 @@ class Grid(_GridComponent):
 
         * show (bool): If True, the grid and its' content will be visible.
 
+        * solver (str): The implementation used to size and position attached
+        items during a draw event. Either "scalar" (default), or "vector" for
+        grids with a large number of items. Both produce identical results.
+        The "vector" solver uses NumPy when it is installed.
+
 
     The grid calculates the positions, sizes, and visibility states of
     itself and attached items during a draw event; triggered by calling the
@@ -788,6 +1054,8 @@ class Grid(_GridComponent):
         '_item_data',
         '_trashbin',
         '_drawlayer',
+        '_items_version',
+        '_layout',
         # configuration
         'rows',
         'cols',
@@ -798,6 +1066,8 @@ class Grid(_GridComponent):
         '_rect_getter',
         '_overlay',
         '_show',
+        '_solver',
+        '_vector_solver',
         # other
         '__weakref__',
     )
@@ -810,11 +1080,12 @@ class Grid(_GridComponent):
     rect_getter: _GridSetting[_RectGetter]    = dataclasses.field(default=_GridSetting("rect_getter"))
     overlay    : _GridSetting[bool]           = dataclasses.field(default=_GridSetting("overlay"))
     show       : _GridSetting[bool]           = dataclasses.field(default=_GridSetting("show"))
+    solver     : _GridSetting[str]            = dataclasses.field(default=_GridSetting("solver"))
 
     __drawlist = '[mvViewportDrawlist] Grid'
 
     @overload
-    def __init__(self, cols: int = ..., rows: int = ..., target: Item = ..., *, label: str | None = ..., padding: Vec4 | FloatV = ..., spacing: Vec2 | FloatV = ..., width: FloatV = ..., height: FloatV = ..., offsets: Vec4 | FloatV = ..., rect_getter: _RectGetter = ..., overlay: bool = ..., show: bool = ...) -> None: ...  # type: ignore
+    def __init__(self, cols: int = ..., rows: int = ..., target: Item = ..., *, label: str | None = ..., padding: Vec4 | FloatV = ..., spacing: Vec2 | FloatV = ..., width: FloatV = ..., height: FloatV = ..., offsets: Vec4 | FloatV = ..., rect_getter: _RectGetter = ..., overlay: bool = ..., show: bool = ..., solver: Literal['scalar', 'vector'] = ...) -> None: ...  # type: ignore
     def __init__(
         self,
         cols       : int  = 1,
@@ -827,6 +1098,7 @@ class Grid(_GridComponent):
         rect_getter: Any  = None,
         overlay    : bool = False,
         show       : bool = True,
+        solver     : str  = 'scalar',
         **kwargs,
     ) -> None:
         """Args:
@@ -876,13 +1148,18 @@ class Grid(_GridComponent):
             * show: Used to update `self.show`. Evaluated as a boolean,
             False will hide the grid, its' overlay, and all attached items (and
             vice-versa).
+
+            * solver: Used to update `self.solver`. Must be "scalar" or "vector".
+            None is treated as "scalar".
         """
         _create_context()
         if not dearpygui.does_item_exist(self.__drawlist):
             type(self).__drawlist = dearpygui.add_viewport_drawlist()
         self._drawlayer = dearpygui.add_draw_layer(parent=self.__drawlist)
-        self._item_data = cast(set[ItemData], set())
-        self._trashbin  = set()
+        self._item_data = cast(dict[Item, ItemData], {})
+        self._trashbin  = cast(set[Item], set())
+        self._items_version = 0
+        self._layout    = None
         self._lock      = threading.Lock() if not sys.gettrace() else threading.RLock()
 
         self.cols = Axis(0, label='x')
@@ -898,6 +1175,7 @@ class Grid(_GridComponent):
             rect_getter=rect_getter,
             overlay=overlay,
             show=show,
+            solver=solver,
             **kwargs,
         )
 
@@ -906,11 +1184,17 @@ class Grid(_GridComponent):
         #   * updating the grid's settings
         #   * updating `self._item_data`
         #   * drawing the grid
-        self._item_data.difference_update(self._trashbin)
-        self._trashbin.clear()
+        if self._trashbin:
+            item_data = self._item_data
+            n_items   = len(item_data)
+            for item in self._trashbin:
+                item_data.pop(item, None)
+            self._trashbin.clear()
+            if len(item_data) != n_items:
+                self._items_version += 1
 
     @overload
-    def configure(self, *, cols: int = ..., rows: int = ..., target: Item = ..., label: str | None = ..., padding: Vec4 | FloatV = ..., spacing: Vec2 | FloatV = ..., offsets: Vec4 | FloatV = ..., width: FloatV = ..., height: FloatV = ..., rect_getter: _RectGetter = ..., overlay: bool = ..., show: bool = ...): ...  # type: ignore
+    def configure(self, *, cols: int = ..., rows: int = ..., target: Item = ..., label: str | None = ..., padding: Vec4 | FloatV = ..., spacing: Vec2 | FloatV = ..., offsets: Vec4 | FloatV = ..., width: FloatV = ..., height: FloatV = ..., rect_getter: _RectGetter = ..., overlay: bool = ..., show: bool = ..., solver: Literal['scalar', 'vector'] = ...): ...  # type: ignore
     def configure(self, **kwargs):
         """Update the grid's settings.
 
@@ -972,16 +1256,26 @@ class Grid(_GridComponent):
                 show = bool(kwargs['show'])
                 if not show:
                     _item_set_config(self._drawlayer, show=False)
-                for item_data in self._item_data:
+                self._items_version += 1  # rects were reset
+                for item_data in self._item_data.values():
+                    item_data.last_rect = None
                     try:
                         _item_set_config(item_data.item, show=show)
                     except SystemError:
                         if not dearpygui.does_item_exist(item_data.item):
-                            self._trashbin.add(item_data)
+                            self._trashbin.add(item_data.item)
                         else:
                             raise
                 self._show = show
 
+            # solver
+            if 'solver' in kwargs:
+                solver = kwargs['solver'] or 'scalar'
+                if solver not in ('scalar', 'vector'):
+                    raise ValueError(f"expected 'scalar' or 'vector' for `solver` (got {solver!r}).")
+                self._solver = solver
+                self._vector_solver = _VectorSolver() if solver == 'vector' else None
+
             super().configure(**kwargs)
             self._clean_cache()
 
@@ -1020,7 +1314,7 @@ class Grid(_GridComponent):
         Awaits internal lock release.
         """
         with self._lock:
-            for item_data in self._item_data:
+            for item_data in self._item_data.values():
                 try:
                     _item_set_config(item_data.item, pos=())
                 except SystemError:
@@ -1234,7 +1528,8 @@ class Grid(_GridComponent):
                 rect_setter=rect_setter,
                 is_text=is_text,
             )
-            self._item_data.add(item_data)
+            self._item_data[item] = item_data
+            self._items_version += 1
             return item_data
 
     def _upd_slot_states(self, axis: Axis, area_size: float, index_offset: Literal[0, 1]):  # XXX: performance-sensitive
@@ -1280,14 +1575,14 @@ class Grid(_GridComponent):
             slot_state['size'] = slot_size - _slot_size_offset
             alloc_size += slot_size
 
-    def _upd_item_states(self):  # XXX: performance-sensitive
+    def _upd_item_states(self, item_datas: Iterable[ItemData] | None = None):  # XXX: performance-sensitive
         rows = self.rows._slots
         cols = self.cols._slots
 
         n_cols = len(cols)
         n_rows = len(rows)
 
-        for item_data in self._item_data:
+        for item_data in (self._item_data.values() if item_datas is None else item_datas):
             x1, y1, x2, y2 = item_data.cellspan
             # convert negative indexes
             x1 %= n_cols
@@ -1362,15 +1657,13 @@ class Grid(_GridComponent):
                     )
                     item_show = True
 
+            rect = (int(item_x_pos), int(item_y_pos), int(item_width), int(item_height), item_show)
+            # Most items don't move when only part of the grid changes.
+            if rect == item_data.last_rect:
+                continue
             try:
-                item_data.rect_setter(
-                    item_data.item,
-                    int(item_x_pos),
-                    int(item_y_pos),
-                    int(item_width),
-                    int(item_height),
-                    item_show,
-                )
+                item_data.rect_setter(item_data.item, *rect)
+                item_data.last_rect = rect
             except SystemError:
                 if not dearpygui.does_item_exist(item_data.item):
                     self._trashbin.add(item_data.item)
@@ -1535,6 +1828,27 @@ class Grid(_GridComponent):
                 parent=layer,
             )
 
+    def invalidate(self, *, force: bool = False):
+        """Update all slots and items on the next draw event, even if
+        nothing changed. Only necessary after editing an attached item's
+        `ItemData` directly.
+
+        Args:
+            * force: If True, item rects are also re-applied when they are
+            the same as the last ones applied. Useful when an item's position,
+            size, or visibility was changed outside of the grid.
+
+        Awaits internal lock release.
+        """
+        with self._lock:
+            self._layout = None
+            # `ItemData` may have been edited; the vector solver repacks
+            # its arrays when this changes
+            self._items_version += 1
+            if force:
+                for item_data in self._item_data.values():
+                    item_data.last_rect = None
+
     @property
     def __code__(self):
         """[get] Return `self.__call__.__code__`.
@@ -1562,14 +1876,41 @@ class Grid(_GridComponent):
             )
 
             if self._show and area_visible:
-                area_width = self._width or _area_width
-                self._upd_slot_states(self.cols, area_width, 0)
+                area_width  = self._width or _area_width
                 area_height = self._height or _area_height
-                self._upd_slot_states(self.rows, area_height, 1)
-
-                self._upd_item_states()
-
-                if self._overlay:
+                # Only update what was affected by changes since the last
+                # draw event; the grid's size, grid/axis/slot settings, or
+                # the attached items.
+                cols_key = (area_width, self._version, self.cols._version)
+                rows_key = (area_height, self._version, self.rows._version)
+                layout   = self._layout or (None, None, None, (), None)
+
+                cols_dirty = cols_key != layout[0]
+                if cols_dirty:
+                    self._upd_slot_states(self.cols, area_width, 0)
+                rows_dirty = rows_key != layout[1]
+                if rows_dirty:
+                    self._upd_slot_states(self.rows, area_height, 1)
+
+                items_dirty = self._items_version != layout[2]
+                if items_dirty:
+                    text_items = tuple(d for d in self._item_data.values() if d.is_text)
+                else:
+                    text_items = layout[3]
+                if cols_dirty or rows_dirty or items_dirty:
+                    if self._vector_solver is None:
+                        self._upd_item_states()
+                    else:
+                        self._vector_solver(self)
+                elif text_items:
+                    # their size depends on their value
+                    self._upd_item_states(text_items)
+
+                area_pos = (area_x_pos, area_y_pos)
+                redraw   = cols_dirty or rows_dirty or area_pos != layout[4]
+                self._layout = (cols_key, rows_key, self._items_version, text_items, area_pos)
+
+                if self._overlay and redraw:
                     dearpygui.delete_item(self._drawlayer, children_only=True)
                     _item_set_config(self._drawlayer, show=True)
 
@@ -1594,6 +1935,7 @@ class Grid(_GridComponent):
                     )
             else:
                 _item_set_config(self._drawlayer, show=False)
+                self._layout = None
 
 
 
@@ -47,6 +47,11 @@ from .api import (
     AppConfigDict as AppConfigDict,
     ViewportConfigDict as ViewportConfigDict,
     RuntimeConfigDict as RuntimeConfigDict,
+    TaskStatsDict as TaskStatsDict,
+    ProcessTaskStatsDict as ProcessTaskStatsDict,
+    PhaseStatsDict as PhaseStatsDict,
+    FrameSampleDict as FrameSampleDict,
+    RuntimeStatsDict as RuntimeStatsDict,
 )
 
 